@@ -0,0 +1,150 @@
+"""
+Exécute les mesures de performance et écrit les résultats au format JSON.
+
+Les classes des modules bench_*.py suivent les conventions d'asv (méthodes time_*, setup/teardown,
+attributs params, param_names et number) : elles peuvent aussi être exécutées par asv.
+
+Usage :
+    python -m benchmarks [-k filtre] [--repeat 5] [--output resultats.json]
+"""
+import argparse
+import contextlib
+import importlib
+import itertools
+import json
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+import traceback
+
+import numpy as np
+
+import benchmarks
+
+MIN_SAMPLE_TIME = 0.01  # Durée minimale (s) d'un échantillon lors de la calibration du nombre d'appels
+MAX_NUMBER = 10000
+
+
+def discover():
+    """Retourne les (nom, classe) de toutes les classes de mesures des modules bench_*."""
+    found = []
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if not info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'benchmarks.{info.name}')
+        for name, cls in vars(module).items():
+            if isinstance(cls, type) and cls.__module__ == module.__name__ and any(
+                    attr.startswith('time_') for attr in vars(cls)):
+                found.append((f'{info.name}.{name}', cls))
+    return sorted(found, key=lambda item: item[0])
+
+
+def _calibrate(method, args):
+    """Nombre d'appels par échantillon pour qu'un échantillon dure au moins MIN_SAMPLE_TIME."""
+    start = time.perf_counter()
+    method(*args)
+    elapsed = time.perf_counter() - start
+    return int(min(MAX_NUMBER, max(1, np.ceil(MIN_SAMPLE_TIME / max(elapsed, 1e-9)))))
+
+
+def run_benchmark(cls, method_name, args, repeat):
+    """
+    Mesure une méthode time_* pour une combinaison de paramètres.
+
+    Chaque échantillon part d'une instance fraîchement préparée (setup) ; la durée rapportée est
+    celle d'un appel (durée de l'échantillon divisée par le nombre d'appels).
+
+    Returns:
+        dict: Échantillons et statistiques, ou l'erreur / le saut rencontré.
+    """
+    samples, number = [], getattr(cls, 'number', None)
+    for _ in range(repeat):
+        instance = cls()
+        try:
+            if hasattr(instance, 'setup'):
+                instance.setup(*args)
+        except NotImplementedError:
+            return {'status': 'skipped'}
+        try:
+            method = getattr(instance, method_name)
+            if number is None:
+                number = _calibrate(method, args)
+            start = time.perf_counter()
+            for _ in range(number):
+                method(*args)
+            samples.append((time.perf_counter() - start) / number)
+        finally:
+            if hasattr(instance, 'teardown'):
+                instance.teardown(*args)
+    samples = np.array(samples)
+    return {
+        'status': 'ok',
+        'number': number,
+        'samples': samples.tolist(),
+        'min': float(samples.min()),
+        'median': float(np.median(samples)),
+        'mean': float(samples.mean()),
+        'stdev': float(samples.std()),
+    }
+
+
+def environment():
+    """Décrit la machine et la version du code mesurées."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mesures de performance du projet Brain.")
+    parser.add_argument('-k', dest='pattern', default='', help="Ne mesure que les noms contenant ce filtre.")
+    parser.add_argument('--repeat', type=int, default=5, help="Nombre d'échantillons par mesure.")
+    parser.add_argument('--output', help="Fichier JSON des résultats (sortie standard par défaut).")
+    options = parser.parse_args(argv)
+
+    results = []
+    for class_name, cls in discover():
+        params = getattr(cls, 'params', [])
+        param_names = getattr(cls, 'param_names', [])
+        if params and not isinstance(params[0], list):
+            params = [params]
+        for method_name in sorted(attr for attr in vars(cls) if attr.startswith('time_')):
+            name = f'{class_name}.{method_name}'
+            if options.pattern not in name:
+                continue
+            for args in itertools.product(*params):
+                try:
+                    # Les messages des modules mesurés ne doivent pas se mêler au rapport JSON
+                    with contextlib.redirect_stdout(sys.stderr):
+                        result = run_benchmark(cls, method_name, args, options.repeat)
+                except Exception as e:
+                    traceback.print_exc()
+                    result = {'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+                result.update(name=name, params=dict(zip(param_names, map(repr, args))))
+                results.append(result)
+                summary = f"{result['median'] * 1e3:.4f} ms" if result['status'] == 'ok' else result['status']
+                print(f"{name} {list(args)} : {summary}", file=sys.stderr)
+
+    report = json.dumps({'environment': environment(), 'results': results}, indent=2)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
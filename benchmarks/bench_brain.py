@@ -0,0 +1,19 @@
+from benchmarks.common import SEED
+from core.brain import Brain
+
+
+class CreateNeuronsAndSynapses:
+    """Durée de construction du réseau d'un Brain (degré entrant 10)."""
+
+    params = [[100, 1000, 10000]]
+    param_names = ['num_neurons']
+    number = 1  # Chaque mesure part d'un cerveau vide
+
+    def setup(self, num_neurons):
+        self.brain = Brain(num_neurons=0)
+
+    def teardown(self, num_neurons):
+        self.brain.close()
+
+    def time_create_neurons_and_synapses(self, num_neurons):
+        self.brain.create_neurons_and_synapses(num_neurons, indegree=10, seed=SEED)
@@ -0,0 +1,44 @@
+import os
+import shutil
+import tempfile
+
+from benchmarks.common import CORPUS, SEED, tiny_language_model
+
+
+class LanguageCalls:
+    """Durée des appels au module de langage sur un petit GPT-2 local (aucun téléchargement)."""
+
+    def setup(self):
+        import torch
+        from modules.language import LanguageModule
+        from modules.memory import MemoryModule
+
+        torch.manual_seed(SEED)
+        self.directory = tempfile.mkdtemp(prefix="language-bench-")
+        memory = MemoryModule(os.path.join(self.directory, "long_term_memory.json"))
+        self.language = LanguageModule(memory, model_name=tiny_language_model())
+        self.prompts = [sentence.split(" ", 2)[0] for sentence in CORPUS] * 2
+        # Charge le modèle et remplit les caches avant la mesure
+        self.language.generate_batch(self.prompts[:1], max_length=8)
+
+    def teardown(self):
+        self.language.memory.store.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_encode_batch(self):
+        self.language.encode_batch(CORPUS)
+
+    def time_generate_batch(self):
+        self.language.generate_batch(self.prompts, max_length=24)
+
+    def time_stream_sentence(self):
+        for _ in self.language.stream_sentence("Le cerveau", max_length=24):
+            pass
+
+    def time_score_sentences(self):
+        self.language.score_sentences(CORPUS * 4)
+
+    def time_train_pending(self):
+        for text in CORPUS:
+            self.language.queue_text(text)
+        self.language.train_pending(micro_batch_size=4, accumulation_steps=2)
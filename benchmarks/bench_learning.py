@@ -0,0 +1,44 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from benchmarks.common import SEED, build_network
+from modules.learning import LearningModule
+from modules.memory import MemoryModule
+
+
+class LearningPasses:
+    """Durée des passes d'apprentissage supervisé, non supervisé et par renforcement."""
+
+    params = [['Network', 'VectorizedNetwork'], [100, 1000]]
+    param_names = ['engine', 'num_neurons']
+
+    def setup(self, engine, num_neurons):
+        self.directory = tempfile.mkdtemp(prefix="learning-bench-")
+        memory = MemoryModule(os.path.join(self.directory, "long_term_memory.json"))
+        self.network = build_network(engine, num_neurons)
+        self.learning = LearningModule(self.network, memory)
+        rng = np.random.default_rng(SEED)
+        self.inputs = rng.uniform(0.0, 1.0, (64, num_neurons))
+        self.targets = rng.integers(0, 2, (64, num_neurons)).astype(float)
+        self.features = rng.uniform(0.0, 1.0, num_neurons)
+        for _ in range(20):
+            self.network.update(0.5)
+            self.learning.update_eligibility(0.5)
+
+    def teardown(self, engine, num_neurons):
+        self.learning.memory.store.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_supervised_learning(self, engine, num_neurons):
+        self.learning.supervised_learning(self.inputs, self.targets, batch_size=16)
+
+    def time_unsupervised_learning(self, engine, num_neurons):
+        self.learning.unsupervised_learning(self.features, num_clusters=3, rng=SEED)
+
+    def time_reinforcement_step(self, engine, num_neurons):
+        self.network.update(0.5)
+        self.learning.update_eligibility(0.5)
+        self.learning.reinforcement_learning(1.0)
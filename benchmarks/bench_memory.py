@@ -0,0 +1,33 @@
+import os
+import shutil
+import tempfile
+
+from modules.memory import MemoryModule
+
+
+class StoreLongTerm:
+    """Durée d'une écriture en mémoire à long terme selon la taille du journal déjà présent."""
+
+    params = [[0, 10000, 100000]]
+    param_names = ['stored']
+
+    def setup(self, stored):
+        self.directory = tempfile.mkdtemp(prefix="memory-bench-")
+        filename = os.path.join(self.directory, "long_term_memory.json")
+        memory = MemoryModule(filename, batch_size=1024)
+        for i in range(stored):
+            memory.store_long_term(f"souvenir_{i}", {"valeur": i})
+        memory.flush()
+        self.memory = MemoryModule(filename)
+        self.counter = 0
+
+    def teardown(self, stored):
+        self.memory.store.close()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def time_store_long_term(self, stored):
+        self.counter += 1
+        self.memory.store_long_term(f"nouveau_{self.counter}", {"valeur": self.counter})
+
+    def time_load_long_term_memory(self, stored):
+        self.memory.load_long_term_memory()
@@ -0,0 +1,34 @@
+from benchmarks.common import build_network
+
+
+class NetworkUpdate:
+    """Durée d'un pas de simulation selon le moteur et la taille du réseau (degré entrant 10)."""
+
+    params = [['Network', 'VectorizedNetwork'], [100, 1000, 10000, 100000]]
+    param_names = ['engine', 'num_neurons']
+
+    def setup(self, engine, num_neurons):
+        if engine == 'Network' and num_neurons > 10000:
+            # Un million d'objets Synapse : construction trop longue pour une mesure régulière
+            raise NotImplementedError
+        self.network = build_network(engine, num_neurons)
+        # Premiers pas : regroupement des délais et spikes en transit
+        for _ in range(20):
+            self.network.update(0.5)
+
+    def time_update(self, engine, num_neurons):
+        self.network.update(0.5)
+
+
+class VectorizedRun:
+    """Durée de 100 pas du moteur vectorisé, pas à pas ou en sautant les périodes calmes."""
+
+    params = [[False, True]]
+    param_names = ['adaptive']
+
+    def setup(self, adaptive):
+        self.network = build_network('VectorizedNetwork', 10000)
+        self.network.update(0.5)
+
+    def time_run(self, adaptive):
+        self.network.run(100, 0.5, adaptive=adaptive)
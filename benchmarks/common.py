@@ -0,0 +1,70 @@
+import functools
+import tempfile
+
+import numpy as np
+
+from modules.network import Network
+from modules.vectorized import VectorizedNetwork
+
+# Graine commune : toutes les mesures portent sur les mêmes réseaux et les mêmes données
+SEED = 0
+
+ENGINES = {'Network': Network, 'VectorizedNetwork': VectorizedNetwork}
+
+# Corpus de construction du tokenizer du petit modèle de langage
+CORPUS = [
+    "Le cerveau stocke les souvenirs en renforçant les connexions entre les neurones.",
+    "La plasticité synaptique modifie la structure et la fonction des synapses.",
+    "L'hippocampe consolide les informations de la mémoire à court terme vers la mémoire à long terme.",
+    "Les émotions influencent la force et le rappel des souvenirs.",
+    "L'apprentissage automatique est une branche de l'intelligence artificielle.",
+]
+
+
+def build_network(engine, num_neurons, indegree=10, seed=SEED):
+    """
+    Construit un réseau à degré entrant fixe dont une partie des neurones décharge spontanément.
+
+    Args:
+        engine (str): 'Network' ou 'VectorizedNetwork'.
+        num_neurons (int): Nombre de neurones.
+        indegree (int): Nombre de synapses entrantes par neurone.
+        seed (int): Graine de la connectivité et des courants de fond.
+
+    Returns:
+        Network | VectorizedNetwork: Réseau prêt à être simulé.
+    """
+    network = ENGINES[engine]()
+    network.add_neurons(num_neurons)
+    network.connect_fixed_indegree(min(indegree, num_neurons - 1), rng=seed, weight=0.5)
+    drive = np.random.default_rng(seed).uniform(14.0, 16.0, num_neurons)
+    for neuron, value in zip(network.neurons, drive.tolist()):
+        neuron.emotion_influence = value
+    return network
+
+
+@functools.lru_cache(maxsize=None)
+def tiny_language_model():
+    """
+    Construit et sauvegarde (une fois par processus) un petit GPT-2 local à poids aléatoires.
+
+    Le tokenizer BPE est entraîné sur un corpus fixe : aucune ressource réseau n'est nécessaire.
+
+    Returns:
+        str: Répertoire du modèle, utilisable comme `model_name` de LanguageModule.
+    """
+    import torch
+    from tokenizers import ByteLevelBPETokenizer
+    from transformers import GPT2Config, GPT2LMHeadModel, GPT2TokenizerFast
+
+    directory = tempfile.mkdtemp(prefix="tiny-gpt2-")
+    bpe = ByteLevelBPETokenizer()
+    bpe.train_from_iterator(CORPUS * 10, vocab_size=512, special_tokens=["<|endoftext|>"])
+    tokenizer = GPT2TokenizerFast(tokenizer_object=bpe._tokenizer, bos_token="<|endoftext|>",
+                                  eos_token="<|endoftext|>", unk_token="<|endoftext|>")
+    tokenizer.save_pretrained(directory)
+    torch.manual_seed(SEED)
+    config = GPT2Config(vocab_size=len(tokenizer), n_positions=128, n_embd=32, n_layer=2, n_head=2,
+                        bos_token_id=tokenizer.bos_token_id, eos_token_id=tokenizer.eos_token_id)
+    GPT2LMHeadModel(config).save_pretrained(directory)
+    return directory
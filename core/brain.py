@@ -5,28 +5,59 @@ import os
 from typing import Dict
 from .interfaces import BrainModule
 from modules.attention import AttentionModule
+from modules.checkpoint import load_checkpoint, save_checkpoint
 from modules.decision import DecisionModule
 from modules.emotion import EmotionModule
+from modules.generation_queue import GenerationQueue
+from modules.language import LanguageModule
 from modules.learning import LearningModule
 from modules.memory import MemoryModule
 from modules.network import Network
-from modules.neuron import Neuron
-from modules.synapse import Synapse
+from modules.perception import PerceptionModule
+from modules.profiler import Profiler, network_activity
 
 class Brain:
-    def __init__(self):
+    def __init__(self, num_neurons=10, indegree=None, network=None, seed=None, profile=False):
+        """
+        Args:
+            num_neurons (int): Nombre de neurones du réseau.
+            indegree (int): Nombre de synapses entrantes par neurone (tous les autres neurones si None).
+            network (Network | VectorizedNetwork): Réseau à utiliser (un Network vide par défaut).
+            seed (int): Graine de la connectivité aléatoire.
+            profile (bool): Active la mesure des durées des étapes et des compteurs (voir `profiler`).
+        """
+        # Durées des étapes et compteurs d'événements, consultables via self.profiler.snapshot()
+        self.profiler = Profiler(enabled=profile)
         self.modules: Dict[str, BrainModule] = {}
         self.load_core_modules()
         self.load_plugins()
         self.attention_module = AttentionModule([])
         self.decision_module = DecisionModule()
         self.emotion_module = EmotionModule()
+        self.memory_module = MemoryModule(profiler=self.profiler)
+        self.network = network if network is not None else Network()
         self.learning_module = LearningModule(self.network, self.memory_module)
-        self.memory_module = MemoryModule()
-        self.network = Network()
+        # Codage des entrées sensorielles sur les neurones du réseau
+        self.perception_module = PerceptionModule(self.network)
+        # Le modèle de langage est chargé à la première utilisation et partagé entre les instances
+        self.language_module = LanguageModule(self.memory_module)
+        # File regroupant en lots les appels concurrents à communicate (thread démarré au premier appel)
+        self.generation_queue = GenerationQueue(self.language_module)
         self.neurons = []
         self.synapses = []
-        self.create_neurons_and_synapses()
+        self.create_neurons_and_synapses(num_neurons, indegree, seed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        """Termine les générations en attente, arrête le thread de génération et vide la mémoire à long terme."""
+        self.generation_queue.close()
+        self.memory_module.flush()
 
     def load_core_modules(self):
         from .perception import PerceptionModule
@@ -38,61 +69,51 @@ class Brain:
         self.modules['reasoning'] = ReasoningModule()
 
     def load_plugins(self):
-        plugin_folder = 'plugins'
-        for filename in os.listdir(plugin_folder):
+        # Dossier des plugins à la racine du projet, indépendamment du répertoire courant
+        plugin_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plugins')
+        for filename in sorted(os.listdir(plugin_folder)):
             if filename.endswith('.py') and not filename.startswith('__'):
                 module_name = filename[:-3]
                 module = importlib.import_module(f'plugins.{module_name}')
-                plugin_class = getattr(module, 'Plugin')
+                plugin_class = getattr(module, 'Plugin', None)
+                if plugin_class is None:  # Module utilitaire (interface), pas un plugin
+                    continue
                 plugin_instance = plugin_class()
                 self.modules[module_name] = plugin_instance
                 print(f'Plugin chargé : {module_name}')
 
     def process(self, data):
-        # Flux de traitement de base
-        data = self.modules['perception'].process(data)
-        data = self.modules['language'].process(data)
-        data = self.modules['reasoning'].process(data)
-        # Traitement avec les plugins
-        for module_name, module in self.modules.items():
-            if module_name not in ['perception', 'language', 'reasoning']:
-                data = module.process(data)
-        return data
-
-    def inject_knowledge(self, text):
-        """
-        Injecte des compétences ou des connaissances dans le cerveau via le module de langage.
-        
-        Args:
-            text (str): Texte à apprendre (par exemple, un texte sur une nouvelle compétence).
-        
-        Raises:
-            ValueError: Si le texte fourni est vide ou mal formé.
-        """
-        if not text or not isinstance(text, str):
-            raise ValueError("Le texte fourni pour l'injection de connaissances est invalide.")
-        
-        try:
-            self.modules['language'].learn_text(text)
-            print("Nouvelle compétence injectée dans le cerveau.")
-        except Exception as e:
-            print(f"Erreur lors de l'injection de connaissances : {str(e)}")
+        with self.profiler.stage('process'):
+            # Flux de traitement de base
+            data = self.modules['perception'].process(data)
+            data = self.modules['language'].process(data)
+            data = self.modules['reasoning'].process(data)
+            # Traitement avec les plugins
+            for module_name, module in self.modules.items():
+                if module_name not in ['perception', 'language', 'reasoning']:
+                    data = module.process(data)
+            return data
 
-    def create_neurons_and_synapses(self):
+    def create_neurons_and_synapses(self, num_neurons=10, indegree=None, seed=None):
         """
         Crée les neurones et les synapses pour le réseau neuronal.
+
+        Les connexions sont générées en masse par les constructeurs de connectivité du réseau :
+        tous-vers-tous (sans autapse) par défaut, ou un degré entrant fixe tiré au hasard.
+
+        Args:
+            num_neurons (int): Nombre de neurones à créer.
+            indegree (int): Nombre de synapses entrantes par neurone (tous les autres neurones si None).
+            seed (int): Graine de la connectivité aléatoire.
         """
-        for i in range(10):
-            neuron = Neuron(neuron_id=i)
-            self.neurons.append(neuron)
-            self.network.add_neuron(neuron)
-        
-        for pre_neuron in self.neurons:
-            for post_neuron in self.neurons:
-                if pre_neuron != post_neuron:
-                    synapse = Synapse(pre_neuron, post_neuron)
-                    self.synapses.append(synapse)
-                    self.network.connect_neurons(pre_neuron, post_neuron)
+        self.network.add_neurons(num_neurons)
+        if indegree is None:
+            self.network.connect_all_to_all()
+        else:
+            self.network.connect_fixed_indegree(indegree, rng=seed)
+        self.neurons = list(self.network.neurons)
+        self.synapses = self.network.synapses
+        self.perception_module.add_sensory_neurons(self.neurons)
 
     def perceive_and_process(self, sensory_input, dt):
         """
@@ -102,10 +123,56 @@ class Brain:
             sensory_input (list): Liste des entrées sensorielles.
             dt (float): Pas de temps de simulation.
         """
-        self.modules['perception'].encode_sensory_input(sensory_input)
-        self.network.update(dt)
-        self.emotion_module.update_emotions(sensory_input, self.memory_module.retrieve_short_term(), 0, dt)
-        self.attention_module.update_attention({neuron.neuron_id: 1.0 for neuron in self.neurons})
+        with self.profiler.stage('perceive_and_process'):
+            self.perception_module.encode_sensory_input(sensory_input, dt)
+            self._update_network(dt)
+            self.learning_module.update_eligibility(dt)
+            with self.profiler.stage('emotion'):
+                self.emotion_module.update_emotions(sensory_input, self.memory_module.retrieve_short_term(), 0, dt)
+            with self.profiler.stage('attention'):
+                self.attention_module.update_attention({neuron.neuron_id: 1.0 for neuron in self.neurons})
+
+    def _update_network(self, dt):
+        """Avance le réseau d'un pas et compte, si la mesure est active, ses spikes et événements synaptiques."""
+        with self.profiler.stage('network.update'):
+            self.network.update(dt)
+        if self.profiler.enabled:
+            spikes, events = network_activity(self.network)
+            self.profiler.count('spikes', spikes)
+            self.profiler.count('synaptic_events', events)
+
+    def perceive_stream(self, frames, dt, chunk_size=256):
+        """
+        Perçoit et traite un flux d'entrées sensorielles, un pas de simulation par trame.
+
+        Équivalent à appeler `perceive_and_process` pour chaque trame, mais les trames sont codées
+        par blocs et les signaux constants sur le flux (souvenirs récents, pertinence des neurones)
+        ne sont calculés qu'une fois.
+
+        Args:
+            frames (np.ndarray | iterable): Tableau de forme (T, n), éventuellement projeté en mémoire
+                                            (np.load(..., mmap_mode='r')), ou itérateur de trames.
+            dt (float): Pas de temps de simulation.
+            chunk_size (int): Nombre de trames codées ensemble.
+
+        Returns:
+            int: Nombre de trames traitées.
+        """
+        memories = self.memory_module.retrieve_short_term()
+        relevance = {neuron.neuron_id: 1.0 for neuron in self.neurons}
+        learning_module, emotion_module = self.learning_module, self.emotion_module
+        attention_module, profiler = self.attention_module, self.profiler
+
+        def step(frame):
+            self._update_network(dt)
+            learning_module.update_eligibility(dt)
+            with profiler.stage('emotion'):
+                emotion_module.update_emotions(frame, memories, 0, dt)
+            with profiler.stage('attention'):
+                attention_module.update_attention(relevance)
+
+        with profiler.stage('perceive_stream'):
+            return self.perception_module.stream(frames, dt, step, chunk_size)
 
     def execute_decision(self, dt):
         """
@@ -114,11 +181,12 @@ class Brain:
         Args:
             dt (float): Pas de temps de simulation.
         """
-        evidence = 0.5  # Exemple d'évidence
-        self.decision_module.update_decision(evidence, self.emotion_module.emotional_states["fear"], dt)
-        if self.decision_module.choice_made:
-            print(f"Décision prise : {self.decision_module.decision}")
-            self.decision_module.reset()
+        with self.profiler.stage('execute_decision'):
+            evidence = 0.5  # Exemple d'évidence
+            self.decision_module.update_decision(evidence, self.emotion_module.emotional_states["fear"], dt)
+            if self.decision_module.choice_made:
+                print(f"Décision prise : {self.decision_module.decision}")
+                self.decision_module.reset()
 
     def learn(self, inputs, targets):
         """
@@ -133,14 +201,29 @@ class Brain:
     def communicate(self, prompt):
         """
         Communique en générant une phrase à partir d'un prompt.
-        
+
+        Les appels concurrents (depuis plusieurs threads) sont regroupés en lots par la file de génération.
+
         Args:
             prompt (str): Prompt initial pour générer du texte.
             
         Returns:
             str: Phrase générée.
         """
-        return self.modules['language'].generate_sentence(prompt)
+        with self.profiler.stage('communicate'):
+            return self.communicate_async(prompt).result()
+
+    def communicate_async(self, prompt):
+        """
+        Soumet un prompt à la file de génération par lots sans attendre la réponse.
+
+        Args:
+            prompt (str): Prompt initial pour générer du texte.
+
+        Returns:
+            concurrent.futures.Future: Futur résolu avec la phrase générée.
+        """
+        return self.generation_queue.submit(prompt)
 
     def inject_knowledge(self, text):
         """
@@ -152,19 +235,60 @@ class Brain:
         Raises:
             ValueError: Si le texte fourni est vide ou mal formé.
         """
-        if not text or not isinstance(text, str):
+        self.inject_corpus([text])
+
+    def inject_corpus(self, texts, micro_batch_size=8, accumulation_steps=4):
+        """
+        Injecte un ensemble de textes : ils sont tous mis en file puis appris en micro-lots
+        (un pas d'optimiseur par groupe de `accumulation_steps` micro-lots).
+
+        Args:
+            texts (list): Textes à apprendre.
+            micro_batch_size (int): Nombre de segments par micro-lot.
+            accumulation_steps (int): Nombre de micro-lots par pas d'optimiseur.
+
+        Raises:
+            ValueError: Si un des textes fournis est vide ou mal formé.
+        """
+        if not texts or any(not text or not isinstance(text, str) for text in texts):
             raise ValueError("Le texte fourni pour l'injection de connaissances est invalide.")
-        
+
         try:
-            self.modules['language'].learn_text(text)
+            for text in texts:
+                self.language_module.queue_text(text)
+            self.language_module.train_pending(micro_batch_size, accumulation_steps)
             print("Nouvelle compétence injectée dans le cerveau.")
         except Exception as e:
             print(f"Erreur lors de l'injection de connaissances : {str(e)}")
 
-    def save_state(self):
-        """Sauvegarde l'état du cerveau."""
+    def save_state(self, checkpoint_path=None):
+        """
+        Sauvegarde l'état du cerveau.
+
+        Args:
+            checkpoint_path (str): Répertoire où écrire un point de contrôle binaire de l'état complet
+                                   du réseau (optionnel ; seule la mémoire à long terme est sauvegardée sinon).
+        """
         self.memory_module.save_long_term_memory()
+        if checkpoint_path is not None:
+            save_checkpoint(self.network, checkpoint_path)
+
+    def load_state(self, checkpoint_path=None, mmap_mode='c'):
+        """
+        Charge l'état du cerveau.
 
-    def load_state(self):
-        """Charge l'état du cerveau."""
+        Args:
+            checkpoint_path (str): Répertoire d'un point de contrôle du réseau à restaurer (optionnel).
+            mmap_mode (str): Mode de projection mémoire des tableaux du point de contrôle.
+        """
         self.memory_module.load_long_term_memory()
+        if checkpoint_path is not None:
+            self._set_network(load_checkpoint(checkpoint_path, mmap_mode))
+
+    def _set_network(self, network):
+        """Remplace le réseau et y reconnecte les modules qui le pilotent (apprentissage, perception)."""
+        self.network = network
+        self.learning_module.network = network
+        self.neurons = list(network.neurons)
+        self.synapses = network.synapses
+        self.perception_module.rebind(network, self.neurons)
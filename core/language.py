@@ -0,0 +1,9 @@
+# core/language.py
+
+from .interfaces import BrainModule
+
+class LanguageModule(BrainModule):
+    def process(self, data):
+        print("Module de Langage traite les données.")
+        # Implémenter la logique du langage ici
+        return "données_langage"
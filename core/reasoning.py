@@ -0,0 +1,9 @@
+# core/reasoning.py
+
+from .interfaces import BrainModule
+
+class ReasoningModule(BrainModule):
+    def process(self, data):
+        print("Module de Raisonnement traite les données.")
+        # Implémenter la logique de raisonnement ici
+        return "données_raisonnées"
@@ -0,0 +1,62 @@
+import math
+
+import torch
+from torch import nn
+
+
+class LowRankAdapter(nn.Module):
+    """
+    Adaptateur de faible rang (LoRA) ajouté à une couche linéaire gelée : y = couche(x) + (x A B) * alpha / rang.
+
+    B est initialisé à zéro, de sorte que l'adaptateur ne modifie pas la sortie avant entraînement.
+    Fonctionne avec `nn.Linear` (poids (sortie, entrée)) et `Conv1D` de GPT-2 (poids (entrée, sortie)).
+
+    Attributes:
+        base (nn.Module): Couche d'origine, gelée.
+        down (nn.Parameter): Projection (entrée, rang).
+        up (nn.Parameter): Projection (rang, sortie).
+        scale (float): Facteur alpha / rang.
+    """
+
+    def __init__(self, base, rank=8, alpha=None):
+        super().__init__()
+        if isinstance(base, nn.Linear):
+            in_features, out_features = base.in_features, base.out_features
+        else:
+            in_features, out_features = base.weight.shape
+        self.base = base
+        self.down = nn.Parameter(torch.empty(in_features, rank))
+        self.up = nn.Parameter(torch.zeros(rank, out_features))
+        nn.init.kaiming_uniform_(self.down, a=math.sqrt(5))
+        self.scale = (alpha or rank) / rank
+
+    def forward(self, x):
+        return self.base(x) + (x @ self.down @ self.up) * self.scale
+
+
+def add_low_rank_adapters(model, rank=8, target_modules=('c_attn',), alpha=None):
+    """
+    Gèle tous les paramètres d'un modèle et entoure les couches ciblées d'adaptateurs de faible rang.
+
+    Args:
+        model (nn.Module): Modèle à adapter (modifié sur place).
+        rank (int): Rang des adaptateurs.
+        target_modules (tuple): Suffixes des noms des couches à adapter.
+        alpha (float): Facteur d'échelle des adaptateurs (rang par défaut).
+
+    Returns:
+        list: Paramètres entraînables des adaptateurs.
+    """
+    model.requires_grad_(False)
+    targets = [(name, module) for name, module in model.named_modules()
+               if name.split('.')[-1] in target_modules and hasattr(module, 'weight')]
+    if not targets:
+        raise ValueError(f"Aucune couche du modèle ne correspond à {target_modules}.")
+    parameters = []
+    for name, module in targets:
+        parent_name, _, child_name = name.rpartition('.')
+        parent = model.get_submodule(parent_name) if parent_name else model
+        adapter = LowRankAdapter(module, rank, alpha).to(module.weight.device)
+        setattr(parent, child_name, adapter)
+        parameters.extend([adapter.down, adapter.up])
+    return parameters
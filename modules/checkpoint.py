@@ -0,0 +1,180 @@
+import json
+import os
+import shutil
+
+import numpy as np
+
+from modules.memory_store import _fsync_directory
+from modules.network import Network
+from modules.neuron import Neuron
+from modules.vectorized import DEFAULT_SYNAPSE_CONFIG, EDGE_FIELDS, NEURON_FIELDS, VectorizedNetwork
+
+FORMAT_VERSION = 1
+HEADER_FILE = "header.json"
+
+# Tableaux d'index CSR sauvegardés pour éviter toute reconstruction à la réouverture
+INDEX_ARRAYS = ('out_indptr', 'in_order', 'in_indptr', 'edge_pos', 'delay_steps', 'input_ring')
+
+
+def _network_arrays(network):
+    """Retourne l'en-tête et les tableaux typés décrivant l'état complet d'un VectorizedNetwork."""
+    network._ensure_compiled()
+    arrays = {f'neuron_{name}': network._neurons[name] for name in NEURON_FIELDS + ('spike',)}
+    arrays.update({f'edge_{name}': network._edges[name] for name in EDGE_FIELDS + ('pre', 'post', 'edge_id')})
+    arrays.update({name: getattr(network, f'_{name}') for name in INDEX_ARRAYS})
+    arrays.update({f'param_{name}': values for name, values in network.param_arrays.items()})
+    header = {
+        'version': FORMAT_VERSION,
+        'config': network.config,
+        'integrator': network.integrator,
+        'current_time': network.current_time,
+        'step': network._step,
+        'dt': network._dt,
+        'num_local': network.num_local,
+        'neuron_ids': list(network._neuron_ids),
+    }
+    return header, arrays
+
+
+def _spike_queue_arrays(spike_queue):
+    """Décrit les spikes en transit d'une SpikeQueue : une ligne (cases restantes, délai, neurone pré) par spike."""
+    rows = [(offset, delay_steps, index) for offset, delay_steps, neuron_ids in spike_queue.pending()
+            for index in neuron_ids]
+    queue = np.array(rows, dtype=np.int64).reshape(-1, 3)
+    return {'queue_offset': queue[:, 0], 'queue_delay': queue[:, 1], 'queue_pre': queue[:, 2]}
+
+
+def save_checkpoint(network, path):
+    """
+    Sauvegarde l'état complet d'un réseau (potentiels, poids, variables de plasticité à court terme,
+    calcium astrocytaire, courants ou spikes en transit) sous forme de fichiers .npy contigus et d'un en-tête JSON.
+
+    L'écriture se fait dans un répertoire temporaire synchronisé sur disque puis renommé à la fin ;
+    l'ancien point de contrôle est conservé sous `<path>.old` pendant le renommage, et
+    `load_checkpoint` le reprend si une interruption n'a laissé que lui.
+
+    Args:
+        network (Network | VectorizedNetwork): Réseau à sauvegarder.
+        path (str): Répertoire du point de contrôle.
+    """
+    engine = type(network).__name__
+    queue = None
+    if isinstance(network, Network):
+        queue = _spike_queue_arrays(network.spike_queue)
+        network = VectorizedNetwork.from_network(network)
+    header, arrays = _network_arrays(network)
+    if queue is not None:
+        arrays.update(queue)
+    header['engine'] = engine
+    header['arrays'] = sorted(arrays)
+
+    path = os.path.abspath(path)
+    tmp_path, old_path = path + ".tmp", path + ".old"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+    for name, values in arrays.items():
+        with open(os.path.join(tmp_path, f"{name}.npy"), "wb") as f:
+            np.save(f, np.ascontiguousarray(values))
+            f.flush()
+            os.fsync(f.fileno())
+    with open(os.path.join(tmp_path, HEADER_FILE), "w") as f:
+        json.dump(header, f)
+        f.flush()
+        os.fsync(f.fileno())
+    _fsync_directory(tmp_path)
+
+    if os.path.exists(path):
+        shutil.rmtree(old_path, ignore_errors=True)
+        os.replace(path, old_path)
+    os.replace(tmp_path, path)
+    _fsync_directory(os.path.dirname(path))
+    shutil.rmtree(old_path, ignore_errors=True)
+
+
+def load_checkpoint(path, mmap_mode='c'):
+    """
+    Restaure un réseau depuis un point de contrôle.
+
+    Les tableaux d'un VectorizedNetwork sont ouverts par projection mémoire : rien n'est lu ni
+    désérialisé avant d'être utilisé. Un Network d'objets est reconstruit entièrement en mémoire.
+    Si une sauvegarde a été interrompue pendant le renommage, le point de contrôle précédent
+    (`<path>.old`) est chargé.
+
+    Args:
+        path (str): Répertoire du point de contrôle.
+        mmap_mode (str): Mode de projection mémoire ('c' copie à l'écriture, 'r+' écriture dans le
+                         fichier, 'r' lecture seule, None pour tout charger en mémoire).
+
+    Returns:
+        Network | VectorizedNetwork: Réseau restauré, du même type que le réseau sauvegardé.
+    """
+    old_path = os.path.abspath(path) + ".old"
+    if not os.path.exists(os.path.join(path, HEADER_FILE)) and os.path.exists(os.path.join(old_path, HEADER_FILE)):
+        path = old_path
+    with open(os.path.join(path, HEADER_FILE), "r") as f:
+        header = json.load(f)
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Version de point de contrôle non prise en charge : {header.get('version')}")
+    arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in header['arrays']}
+
+    network = VectorizedNetwork(header['config'], header['integrator'])
+    network._neuron_ids = header['neuron_ids']
+    network._index_of = {neuron_id: i for i, neuron_id in enumerate(network._neuron_ids)}
+    network._neurons = {name: arrays[f'neuron_{name}'] for name in NEURON_FIELDS + ('spike',)}
+    network._edges = {name: arrays[f'edge_{name}'] for name in EDGE_FIELDS + ('pre', 'post', 'edge_id')}
+    for name in INDEX_ARRAYS:
+        setattr(network, f'_{name}', arrays[name])
+    network.param_arrays = {name[len('param_'):]: values for name, values in arrays.items()
+                            if name.startswith('param_')}
+    network.current_time = header['current_time']
+    network._step = header['step']
+    network._dt = header['dt']
+    network.num_local = header['num_local']
+
+    if header['engine'] == 'Network':
+        network = _to_object_network(network)
+        if header['dt'] is not None:
+            network._group_synapses(header['dt'])
+        if 'queue_pre' in arrays:
+            # Replace chaque spike en transit dans la file, à sa case d'arrivée
+            for offset, delay_steps, index in zip(arrays['queue_offset'].tolist(), arrays['queue_delay'].tolist(),
+                                                  arrays['queue_pre'].tolist()):
+                network.spike_queue.push([index], delay_steps, offset)
+    return network
+
+
+def _to_object_network(engine):
+    """Reconstruit un Network d'objets Neuron et Synapse à partir d'un VectorizedNetwork."""
+    network = Network(engine.config['homeostasis_interval'])
+    n = engine._neurons
+    for index, neuron_id in enumerate(engine._neuron_ids):
+        neuron = Neuron(neuron_id, tau_m=float(n['tau_m'][index]), v_rest=float(n['v_rest'][index]),
+                        v_threshold=float(n['v_threshold'][index]), v_reset=float(n['v_reset'][index]),
+                        r_m=float(n['r_m'][index]), integrator=engine.integrator)
+        neuron.v_m = float(n['v_m'][index])
+        neuron.alpha = float(n['alpha'][index])
+        neuron.emotion_influence = float(n['emotion_influence'][index])
+        last = n['last_spike_time'][index]
+        neuron.last_spike_time = None if np.isnan(last) else float(last)
+        neuron.pre_trace, neuron.post_trace = float(n['pre_trace'][index]), float(n['post_trace'][index])
+        neuron.trace_time = float(n['trace_time'][index])
+        neuron.tau_plus = float(engine._param('tau_plus', index))
+        neuron.tau_minus = float(engine._param('tau_minus', index))
+        neuron.firing_rate, neuron.tau_rate = float(n['firing_rate'][index]), float(engine._param('tau_rate', index))
+        neuron.current_time = engine.current_time
+        network.add_neuron(neuron)
+
+    e = engine._edges
+    # Recrée les synapses dans leur ordre de création d'origine
+    for position in engine._edge_pos:
+        pre, post = network.neurons[e['pre'][position]], network.neurons[e['post'][position]]
+        synapse = network.connect_neurons(pre, post, float(e['weight'][position]), float(e['delay'][position]))
+        for key in DEFAULT_SYNAPSE_CONFIG:
+            setattr(synapse, key, float(engine._param(key, e['post'][position])))
+        synapse.x, synapse.u = float(e['x'][position]), float(e['u'][position])
+        synapse.astro_ca = float(e['astro_ca'][position])
+        synapse.last_update_time = float(e['last_update_time'][position])
+        synapse.astro_update_time = float(e['astro_update_time'][position])
+        synapse.last_pre_spike_time, synapse.last_post_spike_time = pre.last_spike_time, post.last_spike_time
+    network.current_time, network._step = engine.current_time, engine._step
+    return network
@@ -0,0 +1,306 @@
+import numpy as np
+
+
+def _as_indices(population, num_neurons):
+    if population is None:
+        return np.arange(num_neurons, dtype=np.int64)
+    return np.asarray(population, dtype=np.int64).ravel()
+
+
+def _sample_pairs(num_pairs, count, rng):
+    """Tire `count` indices distincts dans [0, num_pairs) sans matérialiser toutes les paires."""
+    if count * 3 >= num_pairs:
+        return np.sort(rng.choice(num_pairs, size=count, replace=False))
+    chosen = sorted_unique(rng.integers(0, num_pairs, size=count))
+    while len(chosen) < count:
+        extra = rng.integers(0, num_pairs, size=count - len(chosen))
+        chosen = sorted_unique(np.concatenate([chosen, extra]))
+    return chosen
+
+
+def sorted_unique(values):
+    """Équivalent de np.unique pour des entiers, par tri puis suppression des doublons adjacents."""
+    values = np.sort(values)
+    if len(values) == 0:
+        return values
+    return values[np.concatenate([[True], values[1:] != values[:-1]])]
+
+
+def fixed_indegree(pre, post, indegree, allow_autapses=False, rng=None):
+    """
+    Connecte chaque neurone post-synaptique à `indegree` neurones pré-synaptiques distincts tirés au hasard.
+
+    Args:
+        pre (np.ndarray): Indices des neurones pré-synaptiques candidats.
+        post (np.ndarray): Indices des neurones post-synaptiques.
+        indegree (int): Nombre de synapses entrantes par neurone post-synaptique.
+        allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        tuple: Tableaux (pre, post) des arêtes générées.
+    """
+    rng = np.random.default_rng(rng)
+    pre, post = np.asarray(pre, dtype=np.int64), np.asarray(post, dtype=np.int64)
+    if len(pre) == 0 or len(post) == 0 or indegree == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    position = None
+    if not allow_autapses:
+        # Position de chaque neurone post dans la population pré (-1 s'il n'y figure pas)
+        lookup = np.full(max(pre.max(), post.max()) + 1, -1, dtype=np.int64)
+        lookup[pre] = np.arange(len(pre))
+        position = lookup[post]
+    available = len(pre) - (0 if position is None else int(np.any(position >= 0)))
+    if indegree > available:
+        raise ValueError("Le degré entrant dépasse le nombre de neurones pré-synaptiques disponibles.")
+
+    if indegree * 4 <= available:
+        # Degré faible : tirage avec remise, puis nouveau tirage des lignes contenant un doublon ou une autapse
+        sources = np.empty((len(post), indegree), dtype=np.int64)
+        redraw = np.arange(len(post))
+        while redraw.size:
+            rows = rng.integers(0, len(pre), size=(len(redraw), indegree))
+            sources[redraw] = rows
+            ordered = np.sort(rows, axis=1)
+            invalid = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+            if position is not None:
+                invalid |= (rows == position[redraw][:, None]).any(axis=1)
+            redraw = redraw[invalid]
+        return pre[sources.ravel()], np.repeat(post, indegree)
+
+    # Degré élevé : les k plus petites clés aléatoires de chaque ligne donnent un tirage sans remise
+    sources = []
+    block = max(1, int(2 ** 22 // len(pre)))
+    for start in range(0, len(post), block):
+        keys = rng.random((min(block, len(post) - start), len(pre)))
+        if position is not None:
+            rows = np.flatnonzero(position[start:start + block] >= 0)
+            keys[rows, position[start:start + block][rows]] = np.inf
+        sources.append(np.argpartition(keys, indegree - 1, axis=1)[:, :indegree])
+    sources = np.concatenate(sources)
+    return pre[sources.ravel()], np.repeat(post, indegree)
+
+
+def pairwise_bernoulli(pre, post, probability, allow_autapses=False, rng=None):
+    """
+    Connectivité aléatoire d'Erdős–Rényi : chaque paire (pre, post) est connectée avec la probabilité donnée.
+
+    Le nombre d'arêtes est tiré selon une loi binomiale puis les paires sont échantillonnées
+    directement, sans parcourir les N² paires possibles.
+
+    Args:
+        pre (np.ndarray): Indices des neurones pré-synaptiques.
+        post (np.ndarray): Indices des neurones post-synaptiques.
+        probability (float): Probabilité de connexion de chaque paire.
+        allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        tuple: Tableaux (pre, post) des arêtes générées.
+    """
+    rng = np.random.default_rng(rng)
+    pre, post = np.asarray(pre, dtype=np.int64), np.asarray(post, dtype=np.int64)
+    # Sans autapse sur une même population, la diagonale est exclue de l'espace des paires
+    same = not allow_autapses and len(pre) == len(post) and np.array_equal(pre, post)
+    width = len(post) - 1 if same else len(post)
+    num_pairs = len(pre) * width
+    if num_pairs <= 0 or probability <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    pairs = _sample_pairs(num_pairs, rng.binomial(num_pairs, min(probability, 1.0)), rng)
+    rows, cols = np.divmod(pairs, width)
+    if same:
+        cols += cols >= rows
+    pre_idx, post_idx = pre[rows], post[cols]
+    if not allow_autapses and not same:
+        keep = pre_idx != post_idx
+        pre_idx, post_idx = pre_idx[keep], post_idx[keep]
+    return pre_idx, post_idx
+
+
+def distance_dependent(pre, post, positions, p_max, sigma, cutoff=None, allow_autapses=False, rng=None):
+    """
+    Connectivité dépendant de la distance : p(d) = p_max * exp(-d² / (2 sigma²)).
+
+    Les paires sont évaluées par blocs de neurones pré-synaptiques afin de borner la mémoire.
+
+    Args:
+        pre (np.ndarray): Indices des neurones pré-synaptiques.
+        post (np.ndarray): Indices des neurones post-synaptiques.
+        positions (array-like): Coordonnées spatiales de tous les neurones, de forme (N, D).
+        p_max (float): Probabilité de connexion à distance nulle.
+        sigma (float): Portée spatiale du noyau gaussien.
+        cutoff (float): Distance au-delà de laquelle aucune connexion n'est créée (optionnel).
+        allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+        rng (np.random.Generator): Générateur aléatoire.
+
+    Returns:
+        tuple: Tableaux (pre, post) des arêtes générées.
+    """
+    rng = np.random.default_rng(rng)
+    pre, post = np.asarray(pre, dtype=np.int64), np.asarray(post, dtype=np.int64)
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim == 1:
+        positions = positions[:, None]
+    post_pos = positions[post]
+    pre_out, post_out = [], []
+    block = max(1, int(2 ** 22 // max(1, len(post))))
+    for start in range(0, len(pre), block):
+        rows = pre[start:start + block]
+        d2 = ((positions[rows][:, None, :] - post_pos[None, :, :]) ** 2).sum(axis=2)
+        prob = p_max * np.exp(-d2 / (2.0 * sigma ** 2))
+        if cutoff is not None:
+            prob[d2 > cutoff ** 2] = 0.0
+        if not allow_autapses:
+            prob[rows[:, None] == post[None, :]] = 0.0
+        i, j = np.nonzero(rng.random(prob.shape) < prob)
+        pre_out.append(rows[i])
+        post_out.append(post[j])
+    if not pre_out:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(pre_out), np.concatenate(post_out)
+
+
+class ConnectivityMixin:
+    """
+    Constructeurs de connectivité en masse partagés par Network et VectorizedNetwork.
+
+    Les arêtes sont générées directement sous forme de tableaux d'indices puis transmises à
+    `connect_edges`, qui les stocke selon le moteur (objets Synapse ou structure CSR).
+    """
+
+    def _edge_values(self, values, count, rng):
+        if callable(values):
+            return np.asarray(values(rng, count), dtype=float)
+        return values
+
+    def _connect_generated(self, edges, weight, delay, rng):
+        pre, post = edges
+        self.connect_edges(pre, post, self._edge_values(weight, len(pre), rng), self._edge_values(delay, len(pre), rng))
+        return len(pre)
+
+    def connect_all_to_all(self, pre=None, post=None, weight=0.5, delay=1.0, allow_autapses=False):
+        """
+        Connecte chaque neurone pré-synaptique à chaque neurone post-synaptique.
+
+        Args:
+            pre (array-like): Indices des neurones pré-synaptiques (tous par défaut).
+            post (array-like): Indices des neurones post-synaptiques (tous par défaut).
+            weight (float | array-like | callable): Poids, ou fonction (rng, n) -> poids.
+            delay (float | array-like | callable): Délais, ou fonction (rng, n) -> délais.
+            allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+
+        Returns:
+            int: Nombre de synapses créées.
+        """
+        pre = _as_indices(pre, len(self.neurons))
+        post = _as_indices(post, len(self.neurons))
+        pre_idx, post_idx = np.repeat(pre, len(post)), np.tile(post, len(pre))
+        if not allow_autapses:
+            keep = pre_idx != post_idx
+            pre_idx, post_idx = pre_idx[keep], post_idx[keep]
+        return self._connect_generated((pre_idx, post_idx), weight, delay, None)
+
+    def connect_fixed_indegree(self, indegree, pre=None, post=None, weight=0.5, delay=1.0,
+                               allow_autapses=False, rng=None):
+        """
+        Connecte chaque neurone post-synaptique à `indegree` neurones pré-synaptiques tirés au hasard.
+
+        Args:
+            indegree (int): Nombre de synapses entrantes par neurone.
+            pre (array-like): Indices des neurones pré-synaptiques (tous par défaut).
+            post (array-like): Indices des neurones post-synaptiques (tous par défaut).
+            weight (float | array-like | callable): Poids, ou fonction (rng, n) -> poids.
+            delay (float | array-like | callable): Délais, ou fonction (rng, n) -> délais.
+            allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+            rng (int | np.random.Generator): Graine ou générateur aléatoire.
+
+        Returns:
+            int: Nombre de synapses créées.
+        """
+        rng = np.random.default_rng(rng)
+        edges = fixed_indegree(_as_indices(pre, len(self.neurons)), _as_indices(post, len(self.neurons)),
+                               indegree, allow_autapses, rng)
+        return self._connect_generated(edges, weight, delay, rng)
+
+    def connect_probability(self, probability, pre=None, post=None, weight=0.5, delay=1.0,
+                            allow_autapses=False, rng=None):
+        """
+        Connecte chaque paire de neurones avec une probabilité fixe (graphe d'Erdős–Rényi).
+
+        Args:
+            probability (float): Probabilité de connexion.
+            pre (array-like): Indices des neurones pré-synaptiques (tous par défaut).
+            post (array-like): Indices des neurones post-synaptiques (tous par défaut).
+            weight (float | array-like | callable): Poids, ou fonction (rng, n) -> poids.
+            delay (float | array-like | callable): Délais, ou fonction (rng, n) -> délais.
+            allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+            rng (int | np.random.Generator): Graine ou générateur aléatoire.
+
+        Returns:
+            int: Nombre de synapses créées.
+        """
+        rng = np.random.default_rng(rng)
+        edges = pairwise_bernoulli(_as_indices(pre, len(self.neurons)), _as_indices(post, len(self.neurons)),
+                                   probability, allow_autapses, rng)
+        return self._connect_generated(edges, weight, delay, rng)
+
+    def connect_distance(self, positions, p_max, sigma, cutoff=None, pre=None, post=None, weight=0.5,
+                         delay=1.0, allow_autapses=False, rng=None):
+        """
+        Connecte les neurones avec une probabilité gaussienne décroissante avec la distance.
+
+        Args:
+            positions (array-like): Coordonnées de tous les neurones, de forme (N, D).
+            p_max (float): Probabilité de connexion à distance nulle.
+            sigma (float): Portée spatiale.
+            cutoff (float): Distance maximale de connexion (optionnel).
+            pre (array-like): Indices des neurones pré-synaptiques (tous par défaut).
+            post (array-like): Indices des neurones post-synaptiques (tous par défaut).
+            weight (float | array-like | callable): Poids, ou fonction (rng, n) -> poids.
+            delay (float | array-like | callable): Délais, ou fonction (rng, n) -> délais.
+            allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+            rng (int | np.random.Generator): Graine ou générateur aléatoire.
+
+        Returns:
+            int: Nombre de synapses créées.
+        """
+        rng = np.random.default_rng(rng)
+        edges = distance_dependent(_as_indices(pre, len(self.neurons)), _as_indices(post, len(self.neurons)),
+                                   positions, p_max, sigma, cutoff, allow_autapses, rng)
+        return self._connect_generated(edges, weight, delay, rng)
+
+    def connect_populations(self, populations, probabilities, weights=0.5, delays=1.0,
+                            allow_autapses=False, rng=None):
+        """
+        Connectivité par blocs : chaque couple de populations est connecté avec sa propre probabilité.
+
+        Args:
+            populations (list): Liste de tableaux d'indices, une entrée par population.
+            probabilities (array-like): Matrice (P, P) des probabilités de connexion [source, cible].
+            weights (float | array-like): Poids scalaire ou matrice (P, P) de poids par bloc.
+            delays (float | array-like): Délai scalaire ou matrice (P, P) de délais par bloc.
+            allow_autapses (bool): Autorise les connexions d'un neurone vers lui-même.
+            rng (int | np.random.Generator): Graine ou générateur aléatoire.
+
+        Returns:
+            int: Nombre de synapses créées.
+        """
+        rng = np.random.default_rng(rng)
+        count = len(populations)
+        probabilities = np.broadcast_to(np.asarray(probabilities, dtype=float), (count, count))
+        weights = np.broadcast_to(np.asarray(weights, dtype=float), (count, count))
+        delays = np.broadcast_to(np.asarray(delays, dtype=float), (count, count))
+        pre_out, post_out, weight_out, delay_out = [], [], [], []
+        for i, source in enumerate(populations):
+            for j, target in enumerate(populations):
+                pre_idx, post_idx = pairwise_bernoulli(_as_indices(source, 0), _as_indices(target, 0),
+                                                       probabilities[i, j], allow_autapses, rng)
+                pre_out.append(pre_idx)
+                post_out.append(post_idx)
+                weight_out.append(np.full(len(pre_idx), weights[i, j]))
+                delay_out.append(np.full(len(pre_idx), delays[i, j]))
+        pre_idx = np.concatenate(pre_out) if pre_out else np.empty(0, dtype=np.int64)
+        self.connect_edges(pre_idx, np.concatenate(post_out) if post_out else pre_idx,
+                           np.concatenate(weight_out) if weight_out else 0.5,
+                           np.concatenate(delay_out) if delay_out else 1.0)
+        return len(pre_idx)
@@ -32,7 +32,7 @@ class DecisionModule:
         self.D_t += dD
         
         # Vérifier si le seuil de décision est atteint
-                if abs(self.D_t) >= self.threshold:
+        if abs(self.D_t) >= self.threshold:
             self.choice_made = True
             self.decision = "Action positive" if self.D_t > 0 else "Action négative"
 
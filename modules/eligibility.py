@@ -0,0 +1,97 @@
+import numpy as np
+
+from modules.vectorized import DEFAULT_SYNAPSE_CONFIG, gather_rows
+
+
+def _csr(indices, num_rows):
+    """Retourne (pointeurs de lignes, ordre des entrées) regroupant les entrées par valeur de `indices`."""
+    order = np.argsort(indices, kind='stable')
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=num_rows), out=indptr[1:])
+    return indptr, order
+
+
+class EligibilityTraces:
+    """
+    Traces d'éligibilité synaptiques pour une règle d'apprentissage à trois facteurs.
+
+    Chaque synapse possède une trace qui décroît exponentiellement à chaque pas (constante `tau_e`)
+    et accumule les variations STDP que ses paires de spikes auraient produites : + A_plus exp(-Δt/tau_plus)
+    quand le neurone post spike après le pré, - A_minus exp(-Δt/tau_minus) quand le pré spike après le post.
+    Une récompense (signal dopaminergique) convertit ensuite les traces en variations de poids en une
+    seule opération : w += taux x récompense x trace.
+
+    Les traces sont un tableau aligné sur les tableaux de synapses (pré, post, poids) fournis.
+
+    Attributes:
+        trace (np.ndarray): Trace d'éligibilité de chaque synapse.
+        tau_e (float): Constante de temps de décroissance des traces.
+    """
+
+    def __init__(self, pre, post, num_neurons, tau_e=200.0, A_plus=None, A_minus=None, tau_plus=None,
+                 tau_minus=None):
+        """
+        Args:
+            pre (np.ndarray): Indice du neurone pré-synaptique de chaque synapse.
+            post (np.ndarray): Indice du neurone post-synaptique de chaque synapse.
+            num_neurons (int): Nombre de neurones du réseau.
+            tau_e (float): Constante de temps des traces.
+            A_plus, A_minus, tau_plus, tau_minus (float): Paramètres STDP (valeurs par défaut des synapses si None).
+        """
+        self.pre = np.asarray(pre, dtype=np.int64)
+        self.post = np.asarray(post, dtype=np.int64)
+        self.tau_e = tau_e
+        self.A_plus = DEFAULT_SYNAPSE_CONFIG['A_plus'] if A_plus is None else A_plus
+        self.A_minus = DEFAULT_SYNAPSE_CONFIG['A_minus'] if A_minus is None else A_minus
+        self.tau_plus = DEFAULT_SYNAPSE_CONFIG['tau_plus'] if tau_plus is None else tau_plus
+        self.tau_minus = DEFAULT_SYNAPSE_CONFIG['tau_minus'] if tau_minus is None else tau_minus
+        self.trace = np.zeros(len(self.pre))
+        self._out_indptr, self._out_order = _csr(self.pre, num_neurons)
+        self._in_indptr, self._in_order = _csr(self.post, num_neurons)
+
+    def __len__(self):
+        return len(self.trace)
+
+    def update(self, dt, fired, spike_times):
+        """
+        Fait décroître les traces d'un pas puis y ajoute les paires de spikes des neurones ayant spiké.
+
+        Args:
+            dt (float): Pas de temps de simulation.
+            fired (np.ndarray): Indices des neurones ayant spiké à ce pas.
+            spike_times (np.ndarray): Temps du dernier spike de chaque neurone (NaN si aucun).
+        """
+        self.trace *= np.exp(-dt / self.tau_e)
+        fired = np.asarray(fired, dtype=np.int64)
+        if not fired.size:
+            return
+        # Potentialisation : synapses entrantes des neurones post ayant spiké
+        incoming = self._in_order[gather_rows(self._in_indptr, fired)]
+        delta_t = spike_times[self.post[incoming]] - spike_times[self.pre[incoming]]
+        paired = delta_t > 0
+        self.trace[incoming[paired]] += self.A_plus * np.exp(-delta_t[paired] / self.tau_plus)
+        # Dépression : synapses sortantes des neurones pré ayant spiké
+        outgoing = self._out_order[gather_rows(self._out_indptr, fired)]
+        delta_t = spike_times[self.pre[outgoing]] - spike_times[self.post[outgoing]]
+        paired = delta_t > 0
+        self.trace[outgoing[paired]] -= self.A_minus * np.exp(-delta_t[paired] / self.tau_minus)
+
+    def apply_reward(self, weights, reward, learning_rate=1.0):
+        """
+        Module les poids par la récompense : w += taux x récompense x trace, borné à [0, 1] (sur place).
+
+        Args:
+            weights (np.ndarray): Poids des synapses, alignés sur les traces.
+            reward (float): Récompense (positive) ou punition (négative).
+            learning_rate (float): Taux d'apprentissage.
+
+        Returns:
+            np.ndarray: Poids mis à jour.
+        """
+        weights += (learning_rate * reward) * self.trace
+        np.clip(weights, 0.0, 1.0, out=weights)
+        return weights
+
+    def reset(self):
+        """Remet toutes les traces à zéro."""
+        self.trace[:] = 0.0
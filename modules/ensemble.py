@@ -0,0 +1,141 @@
+import numpy as np
+
+from modules.network import Network
+from modules.vectorized import EDGE_FIELDS, NEURON_FIELDS, VectorizedNetwork
+
+
+class NetworkEnsemble:
+    """
+    Ensemble de réseaux indépendants simulés ensemble dans un seul moteur vectorisé.
+
+    Les B réseaux sont juxtaposés le long d'un axe de lot : leurs neurones occupent des blocs
+    contigus et leurs synapses forment une matrice bloc-diagonale, si bien qu'un pas de l'ensemble
+    coûte autant qu'un pas d'un réseau unique de même taille totale. Aucune synapse ne relie deux
+    membres : chaque réseau évolue exactement comme s'il était simulé seul.
+
+    Les paramètres des neurones (tau_m, seuils, ...) comme les paramètres synaptiques (`config` :
+    A_plus, tau_plus, U, alpha, tau_rate, ...) peuvent différer d'un membre à l'autre ; ceux qui varient
+    sont stockés par neurone dans `network.param_arrays`. Seuls l'intégrateur et la période de mise à
+    l'échelle homéostatique (homeostasis_interval), qui rythment le pas commun, doivent être identiques.
+
+    Attributes:
+        networks (list): Réseaux membres (VectorizedNetwork), mis à jour par `synchronize`.
+        network (VectorizedNetwork): Moteur contenant l'ensemble.
+        bounds (np.ndarray): Limites des blocs de neurones de chaque membre.
+    """
+
+    def __init__(self, networks):
+        """
+        Args:
+            networks (list): Réseaux membres (Network ou VectorizedNetwork). Les Network d'objets
+                             sont convertis ; leurs copies vectorisées sont conservées dans `networks`.
+        """
+        if not networks:
+            raise ValueError("Un ensemble doit contenir au moins un réseau.")
+        self.networks = [VectorizedNetwork.from_network(network) if isinstance(network, Network) else network
+                         for network in networks]
+        first = self.networks[0]
+        for network in self.networks:
+            network._ensure_compiled()
+            if (network.integrator != first.integrator
+                    or network.config['homeostasis_interval'] != first.config['homeostasis_interval']):
+                raise ValueError("Les réseaux d'un ensemble doivent partager l'intégrateur et la période "
+                                 "de mise à l'échelle homéostatique.")
+            if network.current_time != first.current_time or network.num_local is not None:
+                raise ValueError("Les réseaux d'un ensemble doivent être au même temps et sans source externe.")
+        sizes = [len(network.neurons) for network in self.networks]
+        self.bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self.network = self._stack()
+
+    def __len__(self):
+        return len(self.networks)
+
+    def _stack(self):
+        """Construit le moteur bloc-diagonal contenant l'état de tous les membres."""
+        first = self.networks[0]
+        engine = VectorizedNetwork(first.config, first.integrator)
+        engine.add_neurons(int(self.bounds[-1]))
+        engine._neuron_ids = [(b, neuron_id) for b, network in enumerate(self.networks)
+                              for neuron_id in network._neuron_ids]
+        engine._index_of = {neuron_id: i for i, neuron_id in enumerate(engine._neuron_ids)}
+        for name in NEURON_FIELDS + ('spike',):
+            engine._neurons[name] = np.concatenate([network._neurons[name] for network in self.networks])
+        for name in first.config:
+            if name == 'homeostasis_interval':
+                continue
+            values = np.concatenate([np.broadcast_to(network._param(name, slice(None)), (len(network.neurons),))
+                                     for network in self.networks]).astype(float)
+            if np.any(values != first.config[name]):
+                # Paramètre balayé : une valeur par neurone, celle de son membre
+                engine.param_arrays[name] = values
+        for network, lo in zip(self.networks, self.bounds[:-1]):
+            e = network._edges
+            positions = network._edge_pos
+            engine.connect_edges(e['pre'][positions] + lo, e['post'][positions] + lo,
+                                 e['weight'][positions], e['delay'][positions])
+        engine._ensure_compiled()
+        for name in EDGE_FIELDS[2:]:
+            engine._edges[name][engine._edge_pos] = np.concatenate(
+                [network._edges[name][network._edge_pos] for network in self.networks])
+        engine.current_time, engine._step = first.current_time, first._step
+
+        dts = {network._dt for network in self.networks}
+        if len(dts) == 1 and first._dt is not None:
+            # Reprend les courants déjà en transit de chaque membre
+            engine._ensure_compiled(first._dt)
+            depth = engine._input_ring.shape[0]
+            for network, lo, hi in zip(self.networks, self.bounds[:-1], self.bounds[1:]):
+                ring = network._input_ring
+                for k in range(min(depth, ring.shape[0])):
+                    engine._input_ring[(engine._step + k) % depth, lo:hi] = ring[(network._step + k) % ring.shape[0]]
+        return engine
+
+    def update(self, dt):
+        """Avance tous les membres d'un pas de temps."""
+        self.network.update(dt)
+
+    def run(self, num_steps, dt, adaptive=False):
+        """
+        Avance tous les membres de `num_steps` pas (voir VectorizedNetwork.run).
+
+        Returns:
+            int: Nombre de pas effectivement calculés un à un.
+        """
+        return self.network.run(num_steps, dt, adaptive)
+
+    def neuron_state(self, name):
+        """
+        Retourne une variable neuronale de tous les membres.
+
+        Args:
+            name (str): Nom du champ (v_m, last_spike_time, firing_rate, spike, ...).
+
+        Returns:
+            np.ndarray | list: Vue de forme (B, N) si tous les membres ont N neurones,
+                               sinon liste des vues de chaque membre.
+        """
+        values = self.network._neuron_array(name)
+        sizes = np.diff(self.bounds)
+        if np.all(sizes == sizes[0]):
+            return values.reshape(len(self.networks), int(sizes[0]))
+        return [values[lo:hi] for lo, hi in zip(self.bounds[:-1], self.bounds[1:])]
+
+    def synchronize(self):
+        """Recopie l'état de l'ensemble dans chaque réseau membre (neurones, synapses, courants en transit)."""
+        engine = self.network
+        edge_start = 0
+        for network, lo, hi in zip(self.networks, self.bounds[:-1], self.bounds[1:]):
+            network._ensure_compiled(engine._dt)
+            for name in NEURON_FIELDS + ('spike',):
+                network._neurons[name][:] = engine._neurons[name][lo:hi]
+            count = len(network._edge_pos)
+            positions = engine._edge_pos[edge_start:edge_start + count]
+            edge_start += count
+            for name in EDGE_FIELDS:
+                network._edges[name][network._edge_pos] = engine._edges[name][positions]
+            network.current_time, network._step = engine.current_time, engine._step
+            if engine._dt is not None:
+                depth, member_depth = engine._input_ring.shape[0], network._input_ring.shape[0]
+                for k in range(min(depth, member_depth)):
+                    network._input_ring[(engine._step + k) % member_depth] = engine._input_ring[
+                        (engine._step + k) % depth, lo:hi]
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+
+class GenerationQueue:
+    """
+    File d'attente regroupant les demandes de génération de texte concurrentes en lots.
+
+    Un thread de service, démarré à la première demande, collecte celles qui arrivent pendant au plus
+    `max_wait` secondes (ou jusqu'à `max_batch_size` demandes), les génère en un seul appel à
+    `LanguageModule.generate_batch` puis résout le futur de chaque appelant.
+
+    Attributes:
+        language_module (LanguageModule): Module de langage utilisé pour la génération.
+        max_batch_size (int): Nombre maximal de prompts par lot.
+        max_wait (float): Délai maximal (s) de collecte d'un lot après la première demande.
+        max_length (int): Longueur maximale des phrases générées.
+    """
+
+    def __init__(self, language_module, max_batch_size=8, max_wait=0.01, max_length=50):
+        if max_batch_size < 1:
+            raise ValueError("La taille maximale d'un lot doit être d'au moins 1.")
+        self.language_module = language_module
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_length = max_length
+        self._requests = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def __len__(self):
+        return len(self._requests)
+
+    def submit(self, prompt):
+        """
+        Ajoute un prompt à la file.
+
+        Args:
+            prompt (str): Prompt initial pour générer du texte.
+
+        Returns:
+            concurrent.futures.Future: Futur résolu avec la phrase générée
+                                       (utilisable avec asyncio via `asyncio.wrap_future`).
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("La file de génération est fermée.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._serve, daemon=True)
+                self._thread.start()
+            self._requests.append((prompt, future))
+            self._condition.notify()
+        return future
+
+    def generate(self, prompt):
+        """Génère une phrase en attendant son traitement dans un lot."""
+        return self.submit(prompt).result()
+
+    def _next_batch(self):
+        """Attend une première demande puis collecte un lot ; retourne None à la fermeture."""
+        with self._condition:
+            while not self._requests and not self._closed:
+                self._condition.wait()
+            if not self._requests:
+                return None
+            deadline = time.monotonic() + self.max_wait
+            while len(self._requests) < self.max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            count = min(self.max_batch_size, len(self._requests))
+            return [self._requests.popleft() for _ in range(count)]
+
+    def _serve(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            # Les demandes annulées entre-temps ne sont pas générées
+            batch = [(prompt, future) for prompt, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                sentences = self.language_module.generate_batch([prompt for prompt, _ in batch], self.max_length)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), sentence in zip(batch, sentences):
+                    future.set_result(sentence)
+
+    def close(self):
+        """Traite les demandes en attente puis arrête le thread de service (s'il a été démarré)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
@@ -1,69 +1,469 @@
-from transformers import AutoTokenizer, AutoModelForCausalLM
-import torch
+import copy
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Registre des modèles partagés par processus : {nom du modèle: (tokenizer, modèle)}
+_MODEL_REGISTRY = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_pretrained(model_name="gpt2"):
+    """
+    Retourne le tokenizer et le modèle pré-entraîné partagés par tout le processus.
+
+    Le modèle est chargé (avec l'import de transformers et torch) au premier appel seulement,
+    puis réutilisé par toutes les instances de LanguageModule. Il est placé en mode évaluation
+    et ses paramètres ne requièrent pas de gradient : il ne doit pas être modifié.
+
+    Args:
+        model_name (str): Nom ou chemin du modèle Hugging Face.
+
+    Returns:
+        tuple: (tokenizer, modèle) partagés.
+    """
+    with _REGISTRY_LOCK:
+        if model_name not in _MODEL_REGISTRY:
+            from transformers import AutoTokenizer, AutoModelForCausalLM
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            model = AutoModelForCausalLM.from_pretrained(model_name)
+            model.eval()
+            model.requires_grad_(False)
+            _MODEL_REGISTRY[model_name] = (tokenizer, model)
+        return _MODEL_REGISTRY[model_name]
+
+
+def release_pretrained(model_name=None):
+    """
+    Retire un modèle (ou tous les modèles) du registre partagé.
+
+    Args:
+        model_name (str): Nom du modèle à retirer ; tous si None.
+    """
+    with _REGISTRY_LOCK:
+        if model_name is None:
+            _MODEL_REGISTRY.clear()
+        else:
+            _MODEL_REGISTRY.pop(model_name, None)
+
+
+def _common_prefix_length(prefix, ids):
+    """Retourne le nombre de tokens initiaux communs à deux séquences."""
+    for length, (a, b) in enumerate(zip(prefix, ids)):
+        if a != b:
+            return length
+    return min(len(prefix), len(ids))
+
 
 class LanguageModule:
     """
     Module de gestion du langage utilisant des modèles Hugging Face pour l'apprentissage et la génération de texte.
-    
+
+    Le tokenizer et le modèle ne sont chargés qu'à leur première utilisation, depuis un registre
+    partagé par le processus. L'apprentissage (`learn_text`) travaille sur une copie privée du
+    modèle, créée au premier appel, afin de ne jamais modifier les poids partagés.
+
     Attributes:
         tokenizer (AutoTokenizer): Tokenizer pour convertir le texte en tokens utilisables.
         model (AutoModelForCausalLM): Modèle pré-entraîné pour générer du langage.
         vocabulary (set): Ensemble de mots appris par le cerveau.
         grammar_rules (dict): Règles de grammaire pour la génération de phrases.
+        prefix_cache_size (int): Nombre de préfixes de prompts dont les clés/valeurs d'attention sont conservées.
+        token_cache_size (int): Nombre de textes dont la tokenisation est conservée.
+        learning_rate (float): Taux d'apprentissage de l'optimiseur de fine-tuning.
+        adapter_rank (int): Rang des adaptateurs de faible rang entraînés à la place de tous les poids (None : tous les poids).
     """
-    
-    def __init__(self, memory_module):
+
+    def __init__(self, memory_module, model_name="gpt2", prefix_cache_size=32, learning_rate=5e-5, adapter_rank=None,
+                 token_cache_size=4096):
         self.memory = memory_module
-        self.tokenizer = AutoTokenizer.from_pretrained("gpt2")
-        self.model = AutoModelForCausalLM.from_pretrained("gpt2")
+        self.model_name = model_name
+        self.prefix_cache_size = prefix_cache_size
+        self.token_cache_size = token_cache_size
+        # Cache LRU {texte: tokens} partagé par la génération, l'évaluation et l'apprentissage
+        self._token_cache = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+        self.learning_rate = learning_rate
+        self.adapter_rank = adapter_rank
+        self._optimizer = None
+        self._pending_texts = []  # Tokens des textes en attente d'entraînement
+        # Cache LRU {hash des tokens du préfixe: (tokens, past_key_values, logits du dernier token)}
+        # Partagé par les appelants et le thread de GenerationQueue : toujours manipulé sous ce verrou
+        self._prefix_cache = OrderedDict()
+        self._prefix_cache_lock = threading.Lock()
+        self._tokenizer = None
+        self._model = None
+        self._private_model = False
         self.vocabulary = set(self.memory.retrieve_long_term("vocabulary") or [])
         self.grammar_rules = self.memory.retrieve_long_term("grammar_rules") or {}
 
+    @property
+    def tokenizer(self):
+        if self._tokenizer is None:
+            self._tokenizer, self._model = get_pretrained(self.model_name)
+        return self._tokenizer
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._tokenizer, self._model = get_pretrained(self.model_name)
+        return self._model
+
+    def encode(self, text):
+        """
+        Tokenise un texte, en réutilisant le résultat d'un appel précédent pour le même texte.
+
+        Args:
+            text (str): Texte à tokeniser.
+
+        Returns:
+            list: Identifiants des tokens.
+        """
+        return self.encode_batch([text])[0]
+
+    def encode_batch(self, texts):
+        """
+        Tokenise un lot de textes : seuls ceux absents du cache passent, ensemble, dans le tokenizer.
+
+        Args:
+            texts (list): Textes à tokeniser.
+
+        Returns:
+            list: Pour chaque texte, liste des identifiants de ses tokens.
+        """
+        encoded = [None] * len(texts)
+        misses = {}
+        with self._token_cache_lock:
+            for i, text in enumerate(texts):
+                ids = self._token_cache.get(text)
+                if ids is None:
+                    misses.setdefault(text, []).append(i)
+                else:
+                    self._token_cache.move_to_end(text)
+                    encoded[i] = list(ids)
+        if misses:
+            new_ids = self.tokenizer(list(misses))['input_ids']
+            with self._token_cache_lock:
+                for (text, positions), ids in zip(misses.items(), new_ids):
+                    for i in positions:
+                        encoded[i] = list(ids)
+                    if self.token_cache_size > 0:
+                        self._token_cache[text] = tuple(ids)
+                while len(self._token_cache) > self.token_cache_size:
+                    self._token_cache.popitem(last=False)
+        return encoded
+
+    def trainable_model(self):
+        """
+        Retourne un modèle propre à cette instance, entraînable (copie du modèle partagé au premier appel).
+
+        Si `adapter_rank` est défini, les poids copiés sont gelés et seuls des adaptateurs de faible
+        rang ajoutés aux couches d'attention sont entraînés.
+
+        Returns:
+            AutoModelForCausalLM: Modèle privé en mode entraînement.
+        """
+        if not self._private_model:
+            import torch
+
+            self._model = copy.deepcopy(self.model)
+            if self.adapter_rank:
+                from modules.adapters import add_low_rank_adapters
+                parameters = add_low_rank_adapters(self._model, self.adapter_rank)
+            else:
+                self._model.requires_grad_(True)
+                parameters = list(self._model.parameters())
+            self._optimizer = torch.optim.AdamW(parameters, lr=self.learning_rate)
+            self._private_model = True
+        # Les clés/valeurs en cache ne correspondent plus aux poids entraînés
+        with self._prefix_cache_lock:
+            self._prefix_cache.clear()
+        self._model.train()
+        return self._model
+
+    def queue_text(self, text):
+        """
+        Ajoute un texte à la file d'entraînement et met à jour le vocabulaire.
+
+        Args:
+            text (str): Texte à apprendre.
+
+        Returns:
+            int: Nombre de textes en attente d'entraînement.
+        """
+        ids = self.encode(text)
+        if ids:
+            self._pending_texts.append(ids + [self.tokenizer.eos_token_id])
+        # Mise à jour du vocabulaire : seuls les tokens jamais vus sont ajoutés à la mémoire
+        new_tokens = set(self.tokenizer.convert_ids_to_tokens(ids)) - self.vocabulary
+        if new_tokens:
+            self.vocabulary.update(new_tokens)
+            self.memory.extend_long_term("vocabulary", sorted(new_tokens))
+        return len(self._pending_texts)
+
+    def train_pending(self, micro_batch_size=8, accumulation_steps=4, max_grad_norm=1.0):
+        """
+        Entraîne le modèle privé sur tous les textes en attente.
+
+        Les textes sont découpés à la longueur de contexte du modèle, triés par longueur puis regroupés
+        en micro-lots complétés par du remplissage ; les gradients de `accumulation_steps` micro-lots
+        sont accumulés (pondérés par leur nombre de tokens prédits) avant chaque pas d'optimiseur.
+
+        Args:
+            micro_batch_size (int): Nombre de segments par micro-lot.
+            accumulation_steps (int): Nombre de micro-lots par pas d'optimiseur.
+            max_grad_norm (float): Norme maximale des gradients (None : pas d'écrêtage).
+
+        Returns:
+            float: Perte moyenne par token prédit (None si aucun texte n'était en attente).
+        """
+        import torch
+
+        texts, self._pending_texts = self._pending_texts, []
+        model = self.trainable_model()
+        context = getattr(model.config, 'n_positions', None) or model.config.max_position_embeddings
+        # Un segment d'un seul token n'a aucun token suivant à prédire
+        chunks = sorted((ids[i:i + context] for ids in texts for i in range(0, len(ids), context)
+                         if len(ids) - i > 1), key=len)
+        if not chunks:
+            model.eval()
+            return None
+        pad_id = self.tokenizer.pad_token_id if self.tokenizer.pad_token_id is not None else self.tokenizer.eos_token_id
+        batches = []
+        for start in range(0, len(chunks), micro_batch_size):
+            group = chunks[start:start + micro_batch_size]
+            width = len(group[-1])
+            input_ids = torch.full((len(group), width), pad_id, dtype=torch.long)
+            attention_mask = torch.zeros((len(group), width), dtype=torch.long)
+            for row, ids in enumerate(group):
+                input_ids[row, :len(ids)] = torch.tensor(ids, dtype=torch.long)
+                attention_mask[row, :len(ids)] = 1
+            labels = input_ids.masked_fill(attention_mask == 0, -100)
+            batches.append((input_ids, attention_mask, labels, int(attention_mask[:, 1:].sum())))
+
+        total_loss, total_tokens = 0.0, 0
+        parameters = [p for group in self._optimizer.param_groups for p in group['params']]
+        for start in range(0, len(batches), accumulation_steps):
+            step = batches[start:start + accumulation_steps]
+            step_tokens = sum(batch[3] for batch in step)
+            self._optimizer.zero_grad(set_to_none=True)
+            for input_ids, attention_mask, labels, num_tokens in step:
+                loss = model(input_ids, attention_mask=attention_mask, labels=labels).loss
+                (loss * num_tokens / step_tokens).backward()
+                total_loss += loss.item() * num_tokens
+            if max_grad_norm is not None:
+                torch.nn.utils.clip_grad_norm_(parameters, max_grad_norm)
+            self._optimizer.step()
+            total_tokens += step_tokens
+        self._optimizer.zero_grad(set_to_none=True)
+        model.eval()
+        return total_loss / total_tokens
+
     def learn_text(self, text):
         """
         Apprend du texte en utilisant le modèle Hugging Face et met à jour le vocabulaire.
-        
+
+        Le texte est ajouté à la file d'entraînement, entraînée aussitôt (avec les textes déjà en attente).
+
         Args:
             text (str): Texte à apprendre.
+
+        Returns:
+            float: Perte moyenne par token prédit.
         """
-        inputs = self.tokenizer.encode(text, return_tensors='pt')
-        outputs = self.model(inputs, labels=inputs)
-        loss = outputs.loss
-        loss.backward()
-        # Mise à jour du vocabulaire
-        tokens = self.tokenizer.tokenize(text)
-        self.vocabulary.update(tokens)
-        self.memory.store_long_term("vocabulary", list(self.vocabulary))
+        self.queue_text(text)
+        return self.train_pending()
 
     def generate_sentence(self, prompt=""):
         """
         Génère une phrase en utilisant le modèle Hugging Face.
-        
+
         Args:
             prompt (str): Prompt initial pour générer du texte.
-            
+
         Returns:
             str: Phrase générée.
         """
-        inputs = self.tokenizer.encode(prompt, return_tensors='pt')
-        outputs = self.model.generate(inputs, max_length=50, do_sample=True)
-        sentence = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        return sentence
+        return prompt + "".join(self.stream_sentence(prompt))
+
+    def stream_sentence(self, prompt="", max_length=50, temperature=1.0, top_k=50):
+        """
+        Génère la suite d'un prompt token par token, en produisant le texte au fur et à mesure.
+
+        Le prompt est encodé à partir du plus long préfixe commun avec le cache : seuls les nouveaux
+        tokens passent dans le modèle, puis chaque token généré réutilise les clés/valeurs d'attention.
+
+        Args:
+            prompt (str): Prompt initial pour générer du texte.
+            max_length (int): Longueur maximale (en tokens) du prompt et de sa suite.
+            temperature (float): Température d'échantillonnage.
+            top_k (int): Nombre de tokens les plus probables parmi lesquels échantillonner (tous si None).
+
+        Yields:
+            str: Fragments de texte générés (sans le prompt).
+        """
+        import torch
+
+        tokenizer = self.tokenizer
+        ids = self.encode(prompt) or [tokenizer.bos_token_id]
+        generated, emitted = [], ""
+        num_tokens = max(1, max_length - len(ids))
+        with torch.inference_mode():
+            past, logits = self._encode_prompt(ids)
+            for step in range(num_tokens):
+                logits = logits / temperature
+                if top_k is not None:
+                    threshold = torch.topk(logits, min(top_k, logits.shape[-1])).values[-1]
+                    logits = logits.masked_fill(logits < threshold, float('-inf'))
+                token = int(torch.multinomial(torch.softmax(logits, dim=-1), 1))
+                if token == tokenizer.eos_token_id:
+                    break
+                generated.append(token)
+                text = tokenizer.decode(generated, skip_special_tokens=True)
+                # Un caractère multi-octets incomplet est retenu jusqu'au token suivant
+                if not text.endswith("\ufffd") and len(text) > len(emitted):
+                    yield text[len(emitted):]
+                    emitted = text
+                if step == num_tokens - 1:
+                    break
+                outputs = self.model(torch.tensor([[token]]), past_key_values=past, use_cache=True)
+                past, logits = outputs.past_key_values, outputs.logits[0, -1]
+
+    def _encode_prompt(self, ids):
+        """
+        Calcule les clés/valeurs d'attention d'un prompt en repartant du plus long préfixe commun avec le cache.
+
+        Une entrée du cache est réutilisable même si elle diverge du prompt (un même préfixe système
+        ou de connaissances suivi d'une autre question) : une copie de ses clés/valeurs est tronquée au
+        préfixe commun, et seuls les tokens suivants passent dans le modèle.
+
+        Args:
+            ids (list): Tokens du prompt.
+
+        Returns:
+            tuple: (past_key_values propres à l'appelant, logits du dernier token).
+        """
+        import torch
+
+        best, best_length = None, 0
+        with self._prefix_cache_lock:
+            for key, entry in self._prefix_cache.items():
+                length = _common_prefix_length(entry[0], ids)
+                if length > best_length:
+                    best, best_length = (key,) + entry, length
+            if best is not None:
+                self._prefix_cache.move_to_end(best[0])
+        if best is not None:
+            _, prefix, past, logits = best
+            if best_length == len(prefix) == len(ids):
+                return copy.deepcopy(past), logits
+            # Le cache du modèle est modifié sur place : l'entrée partagée n'est jamais passée telle quelle.
+            # Au moins un token est recalculé pour obtenir les logits du dernier token du prompt.
+            kept = min(best_length, len(ids) - 1)
+            past = copy.deepcopy(past)
+            if kept < past.get_seq_length():
+                past.crop(kept - past.get_seq_length())
+            outputs = self.model(torch.tensor([ids[kept:]]), past_key_values=past, use_cache=True)
+        else:
+            outputs = self.model(torch.tensor([ids]), use_cache=True)
+        past, logits = outputs.past_key_values, outputs.logits[0, -1]
+        if self.prefix_cache_size > 0:
+            prefix = tuple(ids)
+            entry = (prefix, copy.deepcopy(past), logits)
+            with self._prefix_cache_lock:
+                self._prefix_cache[hash(prefix)] = entry
+                while len(self._prefix_cache) > self.prefix_cache_size:
+                    self._prefix_cache.popitem(last=False)
+        return past, logits
+
+    def generate_batch(self, prompts, max_length=50):
+        """
+        Génère une phrase pour chaque prompt en un seul appel au modèle.
+
+        Les prompts sont complétés à gauche jusqu'à la longueur du plus long (avec un masque
+        d'attention) et la génération s'exécute sans suivi des gradients. Un prompt seul (cas de
+        Brain.communicate sans appel concurrent) passe par `stream_sentence`, qui réutilise les
+        clés/valeurs d'attention du cache de préfixes.
+
+        Args:
+            prompts (list): Prompts initiaux.
+            max_length (int): Longueur maximale (en tokens) du plus long prompt et de sa suite.
+
+        Returns:
+            list: Phrases générées, dans l'ordre des prompts.
+        """
+        if len(prompts) == 1:
+            return [prompts[0] + "".join(self.stream_sentence(prompts[0], max_length))]
+
+        import torch
+
+        tokenizer = self.tokenizer
+        pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+        # Un prompt vide commence par le token de début de séquence
+        encoded = [ids or [tokenizer.bos_token_id] for ids in self.encode_batch(prompts)]
+        width = max(len(ids) for ids in encoded)
+        input_ids = torch.full((len(encoded), width), pad_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(encoded), width), dtype=torch.long)
+        for row, ids in enumerate(encoded):
+            input_ids[row, width - len(ids):] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, width - len(ids):] = 1
+        with torch.inference_mode():
+            outputs = self.model.generate(input_ids, attention_mask=attention_mask, pad_token_id=pad_id,
+                                          max_new_tokens=max(1, max_length - width), do_sample=True)
+        return [tokenizer.decode(output, skip_special_tokens=True) for output in outputs]
+
+    def score_sentences(self, sentences, batch_size=16):
+        """
+        Calcule la log-vraisemblance de chaque token (à partir du deuxième) de chaque phrase.
+
+        Les phrases sont tokenisées en une fois, triées par longueur pour limiter le remplissage,
+        puis évaluées par lots sans suivi des gradients.
+
+        Args:
+            sentences (list): Phrases à évaluer.
+            batch_size (int): Nombre de phrases par passe du modèle.
+
+        Returns:
+            list: Pour chaque phrase (dans l'ordre d'entrée), tableau NumPy des log-probabilités de ses tokens.
+        """
+        import torch
+
+        tokenizer = self.tokenizer
+        encoded = self.encode_batch(list(sentences))
+        pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+        order = np.argsort([len(ids) for ids in encoded], kind='stable')
+        scores = [np.empty(0, dtype=np.float32) for _ in encoded]
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                rows = [i for i in order[start:start + batch_size] if len(encoded[i]) > 1]
+                if not rows:
+                    continue
+                width = len(encoded[rows[-1]])
+                input_ids = torch.full((len(rows), width), pad_id, dtype=torch.long)
+                attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+                for row, i in enumerate(rows):
+                    input_ids[row, :len(encoded[i])] = torch.tensor(encoded[i], dtype=torch.long)
+                    attention_mask[row, :len(encoded[i])] = 1
+                logits = self.model(input_ids, attention_mask=attention_mask).logits[:, :-1].float()
+                targets = input_ids[:, 1:].unsqueeze(-1)
+                log_probs = (logits.gather(-1, targets).squeeze(-1) - torch.logsumexp(logits, dim=-1)).numpy()
+                for row, i in enumerate(rows):
+                    scores[i] = log_probs[row, :len(encoded[i]) - 1].copy()
+        return scores
 
     def understand_sentence(self, sentence):
         """
         Évalue la compréhension d'une phrase en analysant sa probabilité sous le modèle GPT-2.
-        
+
         Args:
             sentence (str): Phrase à analyser.
-            
+
         Returns:
             str: Indication de la compréhension.
         """
-        inputs = self.tokenizer.encode(sentence, return_tensors='pt')
-        outputs = self.model(inputs, labels=inputs)
-        loss = outputs.loss.item()
-        if loss < 1.0:
+        log_probs = self.score_sentences([sentence])[0]
+        if log_probs.size and -log_probs.mean() < 1.0:
             return "Phrase comprise."
         else:
             return "Phrase partiellement comprise."
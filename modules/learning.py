@@ -1,5 +1,8 @@
 import numpy as np
 
+from modules.eligibility import EligibilityTraces
+from modules.vectorized import VectorizedNetwork
+
 class LearningModule:
     """
     Module d'apprentissage supervisé, non supervisé et par renforcement pour le réseau neuronal.
@@ -13,114 +16,260 @@ class LearningModule:
     def __init__(self, network, memory_module):
         self.network = network
         self.memory = memory_module
+        self.centroids = None  # Centroïdes des k-moyennes par mini-lots (clusters, caractéristiques)
+        self._cluster_counts = None  # Nombre de points reçus par chaque centroïde
+        self.eligibility = None  # Traces d'éligibilité des synapses (EligibilityTraces)
+        self._edge_cache = None  # ((réseau, version de topologie), indices pré, indices post) d'un Network d'objets
+        self._eligibility_key = None  # (réseau, version de topologie) des traces d'éligibilité
 
-    def supervised_learning(self, inputs, targets, learning_rate=0.01):
+    def supervised_learning(self, inputs, targets, learning_rate=0.01, batch_size=None, epochs=1, shuffle=False,
+                            rng=None):
         """
         Effectue un apprentissage supervisé en ajustant les poids synaptiques en fonction des erreurs.
+
+        Les exemples sont traités par mini-lots : sorties et mises à jour des poids sont calculées
+        pour tout le lot par des opérations matricielles (règle delta moyennée sur le lot).
         
         Args:
-            inputs (array-like): Entrées du réseau.
-            targets (array-like): Sorties attendues.
+            inputs (array-like): Entrées du réseau, un vecteur (un courant par neurone) ou une matrice (exemples, neurones).
+            targets (array-like): Sorties attendues, de même forme que `inputs`.
             learning_rate (float): Taux d'apprentissage.
+            batch_size (int): Nombre d'exemples par mini-lot (tous les exemples si None).
+            epochs (int): Nombre de passes sur les exemples.
+            shuffle (bool): Mélange l'ordre des exemples à chaque passe.
+            rng (int | np.random.Generator): Générateur ou graine du mélange.
+
+        Returns:
+            list: Erreur quadratique moyenne de chaque passe.
         """
-        outputs = self.forward_pass(inputs)
-        errors = targets - outputs
-        self.backward_pass(errors, learning_rate)
+        inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+        targets = np.atleast_2d(np.asarray(targets, dtype=float))
+        rng = np.random.default_rng(rng)
+        batch_size = batch_size or len(inputs)
+        losses = []
+        for _ in range(epochs):
+            order = rng.permutation(len(inputs)) if shuffle else np.arange(len(inputs))
+            squared_error = 0.0
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                potentials, outputs = self._forward(inputs[batch])
+                errors = targets[batch] - outputs
+                self.backward_pass(errors, learning_rate, potentials)
+                squared_error += float(np.sum(errors ** 2))
+            losses.append(squared_error / targets.size)
+        return losses
 
     def forward_pass(self, inputs):
         """
         Propagation avant des entrées à travers le réseau.
+
+        Chaque exemple est intégré en un pas LIF (dt = 1) depuis le potentiel de repos, pour tous les
+        neurones à la fois ; l'état du réseau n'est pas modifié.
         
         Args:
-            inputs (array-like): Entrées du réseau.
+            inputs (array-like): Entrées du réseau (vecteur ou matrice (exemples, neurones)).
             
         Returns:
-            np.array: Sorties calculées.
+            np.array: Sorties calculées (spikes), de même forme que `inputs`.
         """
-        outputs = []
-        for neuron in self.network.neurons:
-            neuron.reset()
-        for neuron, input_value in zip(self.network.neurons, inputs):
-            neuron.update_potential(input_value, dt=1.0)
-            outputs.append(neuron.spike)
-        return np.array(outputs)
+        inputs = np.asarray(inputs, dtype=float)
+        _, outputs = self._forward(np.atleast_2d(inputs))
+        return outputs.reshape(inputs.shape)
 
-    def backward_pass(self, errors, learning_rate):
+    def _forward(self, inputs, dt=1.0):
+        """Retourne les potentiels membranaires (après réinitialisation) et les spikes d'un lot d'entrées."""
+        p = self._neuron_params()
+        v_m = p['v_rest'] + dt * (p['r_m'] * p['alpha'] * (inputs + p['emotion_influence'])) / p['tau_m']
+        spikes = v_m >= p['v_threshold']
+        v_m = np.where(spikes, p['v_reset'], v_m)
+        return v_m, spikes.astype(float)
+
+    def backward_pass(self, errors, learning_rate, potentials=None):
         """
         Rétropropagation de l'erreur pour ajuster les poids synaptiques.
+
+        La variation du poids de chaque synapse est la moyenne sur le lot de
+        erreur(post) x potentiel(pré) ; elle est calculée par un produit matriciel dense (neurones x neurones)
+        quand le réseau est densément connecté, sinon directement sur les synapses existantes.
         
         Args:
-            errors (array-like): Erreurs observées entre les sorties réelles et attendues.
+            errors (array-like): Erreurs observées entre les sorties réelles et attendues (vecteur ou matrice (exemples, neurones)).
             learning_rate (float): Taux d'apprentissage.
+            potentials (array-like): Potentiels pré-synaptiques associés à chaque exemple
+                                     (potentiels courants des neurones si None).
+        """
+        errors = np.atleast_2d(np.asarray(errors, dtype=float))
+        if potentials is None:
+            potentials = np.broadcast_to(self._neuron_params()['v_m'], errors.shape)
+        potentials = np.atleast_2d(potentials)
+        pre, post, weights = self._synapse_arrays()
+        if not len(weights):
+            return
+        num_neurons = errors.shape[1]
+        if num_neurons * num_neurons <= 4 * len(weights):
+            delta_w = (potentials.T @ errors)[pre, post]
+        else:
+            delta_w = np.empty(len(weights))
+            # Synapses traitées par blocs pour borner la matrice (exemples x synapses)
+            block = max(1, 2 ** 22 // len(errors))
+            for start in range(0, len(weights), block):
+                edges = slice(start, start + block)
+                delta_w[edges] = np.einsum('be,be->e', potentials[:, pre[edges]], errors[:, post[edges]])
+        weights += learning_rate * delta_w / len(errors)
+        np.clip(weights, 0.0, 1.0, out=weights)
+        self._store_weights(weights)
+
+    def _neuron_params(self):
+        """Retourne les paramètres LIF des neurones du réseau sous forme de tableaux."""
+        names = ('tau_m', 'v_rest', 'v_threshold', 'v_reset', 'r_m', 'alpha', 'emotion_influence', 'v_m')
+        if isinstance(self.network, VectorizedNetwork):
+            self.network._ensure_compiled()
+            return {name: self.network._neurons[name] for name in names}
+        neurons = self.network.neurons
+        return {name: np.array([getattr(neuron, name) for neuron in neurons], dtype=float) for name in names}
+
+    def _synapse_arrays(self):
+        """
+        Retourne les indices pré/post-synaptiques et les poids de toutes les synapses.
+
+        Pour un VectorizedNetwork, les poids sont le tableau du réseau lui-même (modifié sur place) ;
+        pour un Network d'objets, ils sont copiés depuis les objets Synapse.
+        """
+        pre, post = self._synapse_indices()
+        if isinstance(self.network, VectorizedNetwork):
+            return pre, post, self.network._edges['weight']
+        return pre, post, np.array([synapse.weight for synapse in self.network.synapses], dtype=float)
+
+    def _synapse_indices(self):
         """
-        for synapse in self.network.synapses:
-            delta_w = learning_rate * errors[synapse.post_neuron.neuron_id] * synapse.pre_neuron.v_m
-            synapse.weight += delta_w
-            synapse.weight = np.clip(synapse.weight, 0.0, 1.0)
+        Retourne les indices pré/post-synaptiques de toutes les synapses.
 
-        def unsupervised_learning(self, inputs, num_clusters=3):
+        Pour un Network d'objets, ils sont mis en cache tant que la topologie du réseau ne change pas.
+        """
+        if isinstance(self.network, VectorizedNetwork):
+            self.network._ensure_compiled()
+            return self.network._edges['pre'], self.network._edges['post']
+        key = (self.network, self.network._topology_version)
+        if self._edge_cache is None or self._edge_cache[0] != key:
+            index_of = {id(neuron): i for i, neuron in enumerate(self.network.neurons)}
+            synapses = self.network.synapses
+            pre = np.array([index_of[id(synapse.pre_neuron)] for synapse in synapses], dtype=np.int64)
+            post = np.array([index_of[id(synapse.post_neuron)] for synapse in synapses], dtype=np.int64)
+            self._edge_cache = (key, pre, post)
+        return self._edge_cache[1:]
+
+    def _store_weights(self, weights):
+        """Recopie les poids mis à jour dans les objets Synapse (sans effet pour un VectorizedNetwork)."""
+        if isinstance(self.network, VectorizedNetwork):
+            return
+        for synapse, weight in zip(self.network.synapses, weights.tolist()):
+            synapse.weight = weight
+
+    def unsupervised_learning(self, inputs, num_clusters=3, learning_rate=0.01, rng=None):
         """
         Effectue un apprentissage non supervisé basé sur le regroupement des neurones en clusters.
+
+        Les centroïdes sont un état du module mis à jour incrémentalement d'un appel à l'autre
+        (k-moyennes par mini-lots : chaque centroïde se déplace vers la moyenne de ses nouveaux points
+        avec un pas égal à 1 / nombre de points qu'il a reçus). Les synapses entre neurones d'un même
+        cluster sont ensuite renforcées et les autres affaiblies, par un seul masque vectorisé.
         
         Args:
-            inputs (array-like): Données d'entrée pour l'apprentissage non supervisé.
+            inputs (array-like): Données d'entrée, une valeur (ou un vecteur de caractéristiques) par neurone.
             num_clusters (int): Nombre de clusters à utiliser pour l'algorithme de k-moyennes.
+            learning_rate (float): Variation des poids intra-cluster (+) et inter-clusters (-).
+            rng (int | np.random.Generator): Générateur ou graine de l'initialisation des centroïdes.
+
+        Returns:
+            np.ndarray: Cluster de chaque neurone.
         """
-        from sklearn.cluster import KMeans
-        kmeans = KMeans(n_clusters=num_clusters)
-        kmeans.fit(inputs.reshape(-1, 1))
-        clusters = kmeans.predict(inputs.reshape(-1, 1))
-        
-        for i, neuron in enumerate(self.network.neurons):
-            for synapse in neuron.outgoing_synapses:
-                if clusters[synapse.pre_neuron.neuron_id] == clusters[synapse.post_neuron.neuron_id]:
-                    synapse.weight += 0.01  # Renforcer les connexions intra-cluster
-                else:
-                    synapse.weight -= 0.01  # Affaiblir les connexions inter-cluster
-                synapse.weight = np.clip(synapse.weight, 0.0, 1.0)
+        inputs = np.asarray(inputs, dtype=float)
+        points = inputs.reshape(len(inputs), -1)
+        if len(points) != len(self.network.neurons):
+            raise ValueError(f"Une entrée par neurone est attendue ({len(self.network.neurons)}), reçu {len(points)}.")
+        if self.centroids is None or self.centroids.shape != (num_clusters, points.shape[1]):
+            rng = np.random.default_rng(rng)
+            rows = rng.choice(len(points), size=num_clusters, replace=len(points) < num_clusters)
+            self.centroids = points[rows].copy()
+            self._cluster_counts = np.zeros(num_clusters)
 
-      import numpy as np
+        labels = self._nearest_centroid(points)
+        counts = np.bincount(labels, minlength=num_clusters)
+        sums = np.zeros_like(self.centroids)
+        np.add.at(sums, labels, points)
+        self._cluster_counts += counts
+        updated = counts > 0
+        self.centroids[updated] += (sums[updated] - counts[updated, None] * self.centroids[updated]) \
+            / self._cluster_counts[updated, None]
+        labels = self._nearest_centroid(points)
 
-class DecisionModule:
-    """
-    Module de prise de décision basé sur l'accumulation d'évidence jusqu'à un seuil.
-    
-    Attributes:
-        D_t (float): Variable d'accumulation d'évidence.
-        threshold (float): Seuil pour prendre une décision.
-        choice_made (bool): Indique si une décision a été prise.
-        decision (str): Décision finale (positive ou négative).
-    """
-    
-    def __init__(self, threshold=1.0, bias=0.0):
-        self.D_t = 0.0  # Variable d'accumulation d'évidence
-        self.threshold = threshold
-        self.bias = bias
-        self.choice_made = False
-        self.decision = None
+        pre, post, weights = self._synapse_arrays()
+        if len(weights):
+            weights += np.where(labels[pre] == labels[post], learning_rate, -learning_rate)
+            np.clip(weights, 0.0, 1.0, out=weights)
+            self._store_weights(weights)
+        return labels
 
-    def update_decision(self, evidence, emotion_influence, dt):
+    def _nearest_centroid(self, points):
+        """Retourne l'indice du centroïde le plus proche de chaque point."""
+        distances = (points ** 2).sum(axis=1)[:, None] - 2 * points @ self.centroids.T + (self.centroids ** 2).sum(axis=1)
+        return np.argmin(distances, axis=1)
+
+    def update_eligibility(self, dt):
         """
-        Met à jour la variable d'accumulation d'évidence et prend une décision si le seuil est atteint.
-        
+        Met à jour les traces d'éligibilité après un pas de simulation du réseau.
+
         Args:
-            evidence (float): Évidence accumulée pour la décision.
-            emotion_influence (float): Influence des émotions sur la décision.
             dt (float): Pas de temps de simulation.
         """
-        noise = np.random.normal(0, 0.1)
-        dD = dt * (evidence + self.bias + emotion_influence + noise)
-        self.D_t += dD
-        
-        # Vérifier si le seuil de décision est atteint
-    def reinforcement_learning(self, reward):
+        fired, spike_times = self._spike_arrays()
+        self._eligibility_traces().update(dt, fired, spike_times)
+
+    def reinforcement_learning(self, reward, learning_rate=0.01):
         """
         Effectue un apprentissage par renforcement basé sur les récompenses reçues.
-        
+
+        Règle à trois facteurs : seules les synapses dont les paires de spikes récentes sont
+        enregistrées dans leur trace d'éligibilité (voir `update_eligibility`) sont modifiées,
+        proportionnellement à la récompense.
+
         Args:
             reward (float): Récompense reçue pour renforcer ou punir un comportement.
+            learning_rate (float): Taux d'apprentissage.
         """
-        delta = reward
-        for synapse in self.network.synapses:
-            synapse.update_weight_rl(delta)
+        traces = self._eligibility_traces()
+        if not len(traces):
+            return
+        _, _, weights = self._synapse_arrays()
+        self._store_weights(traces.apply_reward(weights, reward, learning_rate))
+
+    def _eligibility_traces(self):
+        """Retourne les traces d'éligibilité, recréées (à zéro) quand la topologie du réseau change."""
+        pre, post = self._synapse_indices()
+        key = (self.network, self.network._topology_version)
+        if self._eligibility_key != key:
+            self.eligibility = EligibilityTraces(pre, post, len(self.network.neurons), **self._stdp_params())
+            self._eligibility_key = key
+        return self.eligibility
+
+    def _stdp_params(self):
+        """Retourne les paramètres STDP du réseau (lus sur la première synapse pour un Network d'objets)."""
+        names = ('A_plus', 'A_minus', 'tau_plus', 'tau_minus')
+        if isinstance(self.network, VectorizedNetwork):
+            return {name: self.network.config[name] for name in names}
+        if not self.network.synapses:
+            return {}
+        first = self.network.synapses[0]
+        return {name: getattr(first, name) for name in names}
 
+    def _spike_arrays(self):
+        """Retourne les indices des neurones ayant spiké au dernier pas et le temps du dernier spike de chaque neurone."""
+        if isinstance(self.network, VectorizedNetwork):
+            self.network._ensure_compiled()
+            n = self.network._neurons
+            return np.flatnonzero(n['spike']), n['last_spike_time']
+        neurons = self.network.neurons
+        fired = np.flatnonzero([neuron.spike for neuron in neurons])
+        spike_times = np.array([np.nan if neuron.last_spike_time is None else neuron.last_spike_time
+                                for neuron in neurons], dtype=float)
+        return fired, spike_times
@@ -1,20 +1,41 @@
-import json
+import os
+import weakref
 from collections import deque
 
+import numpy as np
+
+from modules.memory_store import AppendOnlyStore
+from modules.profiler import Profiler
+from modules.vector_index import VectorIndex
+
 class MemoryModule:
     """
     Module de mémoire gérant la mémoire à court et long terme, avec persistance des informations.
+
+    La mémoire à long terme est persistée par un journal d'ajouts (AppendOnlyStore) : les écritures
+    sont regroupées et ajoutées en fin de fichier, puis le journal est compacté atomiquement.
+    Un vecteur de plongement peut être associé à chaque souvenir pour le rappel par similarité.
     
     Attributes:
         short_term_memory (deque): Mémoire à court terme (MCT) limitée en capacité.
         long_term_memory (dict): Mémoire à long terme (MLT) persistante.
         filename (str): Nom du fichier où les données de la mémoire à long terme sont sauvegardées.
+        index (VectorIndex): Index des plongements pour le rappel associatif.
+        embedder (callable): Fonction donnée -> vecteur utilisée quand aucun plongement n'est fourni.
+        profiler (Profiler): Compte les écritures en mémoire à long terme (désactivé par défaut).
     """
     
-    def __init__(self, filename="long_term_memory.json"):
+    def __init__(self, filename="long_term_memory.json", batch_size=64, flush_interval=1.0,
+                 embedder=None, index=None, profiler=None):
         self.short_term_memory = deque(maxlen=5)  # MCT avec une capacité limitée
         self.long_term_memory = {}
         self.filename = filename
+        self.embedder = embedder
+        self.index = index if index is not None else VectorIndex()
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.store = AppendOnlyStore(filename, batch_size=batch_size, flush_interval=flush_interval)
+        # Vide les écritures en attente à la destruction du module ou à l'arrêt de l'interpréteur
+        weakref.finalize(self, _flush, self.store, self.index, self.index_filename)
         self.load_long_term_memory()
 
     def store_short_term(self, data):
@@ -35,16 +56,33 @@ class MemoryModule:
         """
         return list(self.short_term_memory)
 
-    def store_long_term(self, key, data):
+    def store_long_term(self, key, data, embedding=None):
         """
         Stocke des données dans la mémoire à long terme.
         
         Args:
             key (str): Clé pour identifier les données.
             data (any): Données à stocker.
+            embedding (array-like): Vecteur de plongement pour le rappel par similarité (optionnel ;
+                                    calculé par `embedder` s'il est défini).
         """
-        self.long_term_memory[key] = data
-        self.save_long_term_memory()
+        self.store.put(key, data)
+        self.profiler.count('memory_writes')
+        if embedding is None and self.embedder is not None:
+            embedding = self.embedder(data)
+        if embedding is not None:
+            self.index.add(key, embedding)
+
+    def extend_long_term(self, key, items):
+        """
+        Ajoute des éléments à une liste de la mémoire à long terme en ne persistant que ces éléments.
+
+        Args:
+            key (str): Clé de la liste.
+            items (list): Nouveaux éléments.
+        """
+        self.store.extend(key, items)
+        self.profiler.count('memory_writes')
 
     def retrieve_long_term(self, key):
         """
@@ -58,18 +96,56 @@ class MemoryModule:
         """
         return self.long_term_memory.get(key, None)
 
+    def recall_similar(self, query, k=5):
+        """
+        Rappel associatif : retourne les k souvenirs dont le plongement est le plus proche de la requête.
+        
+        Args:
+            query (any): Vecteur de requête, ou donnée à plonger avec `embedder` s'il est défini.
+            k (int): Nombre de souvenirs à retourner.
+            
+        Returns:
+            list: Triplets (clé, données, similarité) par similarité décroissante.
+        """
+        return self.recall_similar_batch([query], k)[0]
+
+    def recall_similar_batch(self, queries, k=5):
+        """
+        Rappel associatif pour un lot de requêtes, évaluées ensemble par l'index.
+        
+        Args:
+            queries (list | np.ndarray): Vecteurs de requête ou données à plonger.
+            k (int): Nombre de souvenirs à retourner par requête.
+            
+        Returns:
+            list: Pour chaque requête, liste de triplets (clé, données, similarité).
+        """
+        if self.embedder is not None and not isinstance(queries, np.ndarray):
+            queries = [self.embedder(query) for query in queries]
+        return [[(key, self.long_term_memory.get(key), score) for key, score in matches]
+                for matches in self.index.search(queries, k)]
+
+    def flush(self):
+        """Écrit sur disque les données de la mémoire à long terme et les plongements encore en attente."""
+        _flush(self.store, self.index, self.index_filename)
+
     def save_long_term_memory(self):
-        """Sauvegarde la mémoire à long terme sur disque."""
-        with open(self.filename, "w") as f:
-            json.dump(self.long_term_memory, f)
+        """Sauvegarde la mémoire à long terme sur disque (réécriture complète et atomique du journal)."""
+        self.store.data = self.long_term_memory
+        self.store.compact()
+        if len(self.index):
+            self.index.save(self.index_filename)
 
     def load_long_term_memory(self):
-        """Charge la mémoire à long terme depuis un fichier."""
-        try:
-            with open(self.filename, "r") as f:
-                self.long_term_memory = json.load(f)
-        except FileNotFoundError:
-            self.long_term_memory = {}
+        """Charge la mémoire à long terme (et l'index des plongements s'il a été sauvegardé) depuis un fichier."""
+        self.long_term_memory = self.store.load()
+        if not len(self.index) and os.path.exists(self.index_filename):
+            self.index.load(self.index_filename)
+
+    @property
+    def index_filename(self):
+        """Fichier de sauvegarde de l'index des plongements, écrit par `flush` et `save_long_term_memory`."""
+        return self.filename + ".index.npz"
 
     def synaptic_plasticity(self, synapse):
         """
@@ -130,8 +206,7 @@ class MemoryModule:
         Args:
             new_neurons (list): Liste des nouveaux neurones à ajouter.
         """
-        self.long_term_memory["new_neurons"] = new_neurons
-        self.save_long_term_memory()
+        self.store_long_term("new_neurons", new_neurons)
 
     def protein_synthesis(self, synapse):
         """
@@ -163,3 +238,10 @@ class MemoryModule:
         """
         labeled_data = f"{data}_{emotion}"
         self.store_long_term("emotional_memory", labeled_data)
+
+
+def _flush(store, index, index_filename):
+    """Vide le journal et réécrit l'index des plongements s'il a changé depuis sa dernière sauvegarde."""
+    store.flush()
+    if index.dirty:
+        index.save(index_filename)
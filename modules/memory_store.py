@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+
+
+class AppendOnlyStore:
+    """
+    Stockage clé-valeur persistant en journal d'ajouts (une ligne JSON par écriture).
+
+    Les écritures sont mises en tampon puis ajoutées en fin de fichier par lots (écriture différée),
+    de sorte que leur coût est proportionnel aux données écrites et non à la taille totale de la
+    mémoire. Le journal est périodiquement compacté : l'état courant est réécrit dans un fichier
+    temporaire, synchronisé sur disque puis substitué atomiquement au journal.
+
+    Une liste peut aussi être prolongée par un enregistrement ne contenant que ses nouveaux éléments
+    (`extend`), ce qui évite de réécrire toute la liste à chaque ajout.
+
+    Un ancien fichier au format dictionnaire JSON est lu tel quel et converti à la première compaction.
+
+    Une minuterie vide les écritures en attente au plus tard `flush_interval` secondes après la
+    première d'entre elles, même si aucune autre écriture ne suit. Son thread est un démon : à l'arrêt
+    de l'interpréteur, seules les écritures vidées par `close` (appelé par MemoryModule à sa
+    destruction) sont garanties sur disque.
+
+    Attributes:
+        filename (str): Chemin du journal.
+        data (dict): État courant de la mémoire.
+        batch_size (int): Nombre d'écritures en attente déclenchant un vidage.
+        flush_interval (float): Délai maximal (s) avant le vidage des écritures en attente.
+    """
+
+    def __init__(self, filename, batch_size=64, flush_interval=1.0, compact_ratio=2.0, min_compact_records=1000):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.compact_ratio = compact_ratio
+        self.min_compact_records = min_compact_records
+        self.data = {}
+        self._pending = []
+        self._records = 0  # Nombre d'enregistrements présents dans le journal
+        self._needs_rewrite = False  # Fichier à réécrire avant tout ajout (ancien format ou ligne tronquée)
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+        self._timer = None
+
+    def load(self):
+        """
+        Recharge l'état depuis le disque (les écritures en attente sont d'abord vidées).
+
+        Une dernière ligne tronquée par un arrêt brutal est ignorée.
+
+        Returns:
+            dict: État courant de la mémoire.
+        """
+        with self._lock:
+            self.flush()
+            self.data, self._records, self._needs_rewrite = {}, 0, False
+            try:
+                with open(self.filename, "r") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return self.data
+            if content.lstrip().startswith("{"):
+                # Ancien format : dictionnaire JSON complet
+                self.data = json.loads(content)
+                self._records = len(self.data)
+                self._needs_rewrite = True
+                return self.data
+            for line in content.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    self._needs_rewrite = True
+                    break
+                if len(record) == 3:
+                    # Enregistrement d'extension : [clé, nouveaux éléments, "+"]
+                    self.data.setdefault(record[0], []).extend(record[1])
+                else:
+                    self.data[record[0]] = record[1]
+                self._records += 1
+            return self.data
+
+    def put(self, key, value):
+        """
+        Enregistre une valeur ; l'écriture sur disque est différée jusqu'au prochain vidage.
+
+        Args:
+            key (str): Clé de la donnée.
+            value (any): Donnée sérialisable en JSON.
+        """
+        with self._lock:
+            self.data[key] = value
+            self._pending.append(json.dumps([key, value]))
+            self._flush_if_due()
+
+    def extend(self, key, values):
+        """
+        Ajoute des éléments à la liste associée à une clé ; seuls ces éléments sont écrits dans le journal.
+
+        Args:
+            key (str): Clé de la liste (créée si absente).
+            values (list): Nouveaux éléments sérialisables en JSON.
+        """
+        values = list(values)
+        with self._lock:
+            self.data.setdefault(key, []).extend(values)
+            self._pending.append(json.dumps([key, values, "+"]))
+            self._flush_if_due()
+
+    def _flush_if_due(self):
+        """Vide le tampon s'il est plein ou trop ancien, sinon programme son vidage par la minuterie."""
+        if len(self._pending) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        elif self._timer is None:
+            # Garantit le vidage même si aucune autre écriture n'arrive
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+    def flush(self):
+        """Ajoute les écritures en attente à la fin du journal, puis compacte si nécessaire."""
+        with self._lock:
+            self._cancel_timer()
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            if self._needs_rewrite:
+                self.compact()
+                return
+            with open(self.filename, "a") as f:
+                f.write("\n".join(pending) + "\n")
+            self._records += len(pending)
+            if self._records > max(self.min_compact_records, self.compact_ratio * len(self.data)):
+                self.compact()
+
+    def compact(self):
+        """
+        Réécrit atomiquement le journal pour ne conserver qu'un enregistrement par clé.
+
+        Le fichier temporaire puis le répertoire (qui porte le renommage) sont synchronisés sur disque.
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._pending = []
+            tmp_filename = self.filename + ".tmp"
+            with open(tmp_filename, "w") as f:
+                for key, value in self.data.items():
+                    f.write(json.dumps([key, value]) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, self.filename)
+            _fsync_directory(os.path.dirname(os.path.abspath(self.filename)))
+            self._records = len(self.data)
+            self._needs_rewrite = False
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        """Vide les écritures en attente et arrête la minuterie de vidage."""
+        self.flush()
+
+
+def _fsync_directory(path):
+    """Synchronise une entrée de répertoire sur disque (POSIX uniquement ; sans effet ailleurs)."""
+    if os.name != 'posix':
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -1,55 +1,155 @@
-class Network:
+from collections import defaultdict
+
+import numpy as np
+
+from modules.connectivity import ConnectivityMixin
+from modules.neuron import Neuron
+from modules.spike_queue import SpikeQueue
+from modules.synapse import Synapse
+
+class Network(ConnectivityMixin):
     """
     Modèle du réseau neuronal, regroupant les neurones et les synapses.
-    
+
+    Les spikes sont acheminés par une file d'événements commune (SpikeQueue) indexée par le délai
+    en pas de simulation : seuls les neurones pré-synaptiques ayant spiké y sont stockés, de sorte
+    qu'un pas sans activité ne parcourt aucune synapse pour la livraison.
+
+    La plasticité homéostatique est appliquée toutes les `homeostasis_interval` ms : chaque synapse
+    est mise à l'échelle selon le taux de décharge lissé de son neurone post-synaptique.
+
     Methods:
         add_neuron: Ajoute un neurone au réseau.
+        add_neurons: Crée et ajoute plusieurs neurones.
         connect_neurons: Crée une synapse entre deux neurones.
+        connect_edges: Crée les synapses d'une liste d'arêtes (voir ConnectivityMixin).
         update: Met à jour le réseau (neurones et synapses).
     """
-    
-    def __init__(self):
+
+    def __init__(self, homeostasis_interval=100.0):
         self.neurons = []
         self.synapses = []
         self.current_time = 0.0  # Temps courant de la simulation
-    
+        self.homeostasis_interval = homeostasis_interval  # Période de la mise à l'échelle (ms)
+        self._step = 0
+        self.recorder = None  # SpikeRecorder optionnel, appelé à chaque pas
+        self.spike_queue = SpikeQueue()
+        self._dt = None
+        self._outgoing_by_delay = []  # Pour chaque neurone : {délai en pas: [synapses]}
+        self._index_of = {}
+        self._topology_version = 0  # Incrémenté à chaque ajout de neurone ou de synapse
+
     def add_neuron(self, neuron):
         """Ajoute un neurone au réseau."""
+        self._index_of[id(neuron)] = len(self.neurons)
         self.neurons.append(neuron)
-    
+        self._topology_version += 1
+        self._outgoing_by_delay.append(defaultdict(list))
+
+    def add_neurons(self, count, **params):
+        """
+        Crée et ajoute `count` neurones identiques.
+
+        Args:
+            count (int): Nombre de neurones à créer.
+            **params: Paramètres transmis au constructeur de Neuron.
+
+        Returns:
+            list: Indices des neurones ajoutés.
+        """
+        start = len(self.neurons)
+        for index in range(start, start + count):
+            self.add_neuron(Neuron(neuron_id=index, **params))
+        return list(range(start, start + count))
+
     def connect_neurons(self, pre_neuron, post_neuron, weight=0.5, delay=1.0):
         """Crée une synapse entre deux neurones."""
         synapse = Synapse(pre_neuron, post_neuron, weight, delay)
         self.synapses.append(synapse)
+        self._topology_version += 1
         pre_neuron.add_outgoing_synapse(synapse)
         post_neuron.add_incoming_synapse(synapse)
-    
+        if self._dt is not None and id(pre_neuron) in self._index_of:
+            self._register(synapse)
+        return synapse
+
+    def connect_edges(self, pre, post, weight=0.5, delay=1.0):
+        """
+        Crée une synapse pour chaque arête (pre[k], post[k]), les indices désignant des positions dans `neurons`.
+
+        Args:
+            pre (array-like): Indices des neurones pré-synaptiques.
+            post (array-like): Indices des neurones post-synaptiques.
+            weight (float | array-like): Poids initiaux.
+            delay (float | array-like): Délais de transmission (ms).
+        """
+        pre, post = np.asarray(pre, dtype=np.int64).ravel(), np.asarray(post, dtype=np.int64).ravel()
+        weights = np.broadcast_to(np.asarray(weight, dtype=float), pre.shape)
+        delays = np.broadcast_to(np.asarray(delay, dtype=float), pre.shape)
+        for i, j, w, d in zip(pre.tolist(), post.tolist(), weights.tolist(), delays.tolist()):
+            self.connect_neurons(self.neurons[i], self.neurons[j], w, d)
+
+    def delay_steps(self, synapse, dt):
+        """Convertit le délai d'une synapse en nombre de pas de simulation (au moins un)."""
+        return max(1, int(round(synapse.delay / dt)))
+
+    def _register(self, synapse):
+        index = self._index_of[id(synapse.pre_neuron)]
+        self._outgoing_by_delay[index][self.delay_steps(synapse, self._dt)].append(synapse)
+
+    def _group_synapses(self, dt):
+        """
+        Regroupe les synapses sortantes de chaque neurone par délai (recalculé si dt change).
+
+        Raises:
+            ValueError: Si des spikes sont en transit : leurs délais, en pas de l'ancien dt, ne
+                        désigneraient plus les bons groupes de synapses.
+        """
+        if self._dt is not None and len(self.spike_queue):
+            raise ValueError("Le pas de temps ne peut pas changer tant que des spikes sont en transit.")
+        self._dt = dt
+        self._outgoing_by_delay = [defaultdict(list) for _ in self.neurons]
+        for synapse in self.synapses:
+            if id(synapse.pre_neuron) in self._index_of:
+                self._register(synapse)
+
     def update(self, dt):
         """Met à jour le réseau (neurones et synapses)."""
+        if dt != self._dt:
+            self._group_synapses(dt)
         self.current_time += dt
+
+        # Livrer les spikes qui arrivent à ce pas
+        currents = defaultdict(float)
+        for delay, neuron_ids in self.spike_queue.pop():
+            for index in neuron_ids:
+                for synapse in self._outgoing_by_delay[index].get(delay, ()):
+                    currents[id(synapse.post_neuron)] += synapse.efficacy()
+
         # Mettre à jour les neurones
         for neuron in self.neurons:
-            neuron.update(dt)
-        
-        # Transmettre les spikes des neurones qui ont spiké
-        for neuron in self.neurons:
-            if neuron.spike:
-                # Transmettre le spike via les synapses sortantes
-                for synapse in neuron.outgoing_synapses:
-                    synapse.transmit_spike(self.current_time)
-        
-        # Mettre à jour les synapses
-        for synapse in self.synapses:
-            # Mettre à jour la modulation astrocytaire
-            synapse.update_astrocyte_modulation()
-            # Obtenir le courant synaptique
-            syn_current = synapse.get_current(self.current_time)
-            # Le neurone post-synaptique reçoit le courant
-            synapse.post_neuron.receive_current(syn_current)
-            # Si le neurone post-synaptique a spiké, on met à jour la STDP
-            if synapse.post_neuron.spike:
+            neuron.update(dt, currents.get(id(neuron), 0.0))
+
+        # Mettre en file les spikes des neurones qui ont spiké, groupés par délai
+        fired = [index for index, neuron in enumerate(self.neurons) if neuron.spike]
+        by_delay = defaultdict(list)
+        for index in fired:
+            for delay, synapses in self._outgoing_by_delay[index].items():
+                for synapse in synapses:
+                    synapse.on_pre_spike(self.current_time)
+                by_delay[delay].append(index)
+        for delay, neuron_ids in by_delay.items():
+            self.spike_queue.push(neuron_ids, delay)
+
+        # STDP sur les synapses entrantes des neurones qui ont spiké
+        for index in fired:
+            for synapse in self.neurons[index].incoming_synapses:
                 synapse.receive_spike(self.current_time)
-        
-        # Réinitialiser le courant des neurones pour le prochain pas de temps
-        for neuron in self.neurons:
-            neuron.reset_current()
+
+        self.spike_queue.advance()
+        if self.recorder is not None:
+            self.recorder.record(self._step, fired, self)
+        self._step += 1
+        if self._step % max(1, int(round(self.homeostasis_interval / dt))) == 0:
+            for synapse in self.synapses:
+                synapse.update_homeostatic_plasticity()
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 class Neuron:
@@ -17,9 +19,22 @@ class Neuron:
         incoming_synapses (list): Liste des synapses entrantes.
         outgoing_synapses (list): Liste des synapses sortantes.
         last_spike_time (float): Temps du dernier spike du neurone.
+        pre_trace (float): Trace STDP pré-synaptique (somme des exp(-Δt/tau_plus) de ses spikes) à trace_time.
+        post_trace (float): Trace STDP post-synaptique (somme des exp(-Δt/tau_minus) de ses spikes) à trace_time.
+        trace_time (float): Temps auquel les traces sont exactes ; elles décroissent analytiquement au-delà.
+        tau_plus (float): Constante de temps de la trace pré-synaptique (ms).
+        tau_minus (float): Constante de temps de la trace post-synaptique (ms).
+        firing_rate (float): Taux de décharge lissé exponentiellement (spikes/ms), utilisé par la
+                             mise à l'échelle homéostatique des synapses entrantes.
+        tau_rate (float): Constante de temps du lissage du taux de décharge (ms).
+        integrator (str): 'exact' (solution exponentielle exacte pour un courant constant sur le pas)
+                          ou 'euler' (Euler explicite, stable seulement pour dt petit devant tau_m).
     """
 
-    def __init__(self, neuron_id, tau_m=20.0, v_rest=-65.0, v_threshold=-50.0, v_reset=-65.0, r_m=1.0):
+    def __init__(self, neuron_id, tau_m=20.0, v_rest=-65.0, v_threshold=-50.0, v_reset=-65.0, r_m=1.0,
+                 integrator="exact"):
+        if integrator not in ("exact", "euler"):
+            raise ValueError("L'intégrateur doit être 'exact' ou 'euler'.")
         self.neuron_id = neuron_id
         self.tau_m = tau_m
         self.v_rest = v_rest
@@ -34,6 +49,19 @@ class Neuron:
         self.outgoing_synapses = []
         self.last_spike_time = None  # Temps du dernier spike
         self.current_time = 0.0  # Temps courant de la simulation
+        self.input_current = 0.0  # Courant synaptique reçu au dernier pas
+        self.integrator = integrator
+        # Traces STDP, partagées par toutes les synapses du neurone
+        self.pre_trace = 0.0
+        self.post_trace = 0.0
+        self.trace_time = 0.0
+        self.tau_plus = 20.0
+        self.tau_minus = 20.0
+        # Estimation du taux de décharge pour la plasticité homéostatique
+        self.firing_rate = 0.0
+        self.tau_rate = 1000.0
+        self._decay = (None, None, None)  # (dt, tau_m, exp(-dt / tau_m)) du dernier pas
+        self._rate_decay = (None, None, None)  # (dt, tau_rate, exp(-dt / tau_rate)) du dernier pas
 
     def add_incoming_synapse(self, synapse):
         """Ajoute une synapse entrante."""
@@ -47,29 +75,77 @@ class Neuron:
         """Reçoit le courant total des synapses entrantes."""
         self.input_current = syn_current
 
-    def update(self, dt):
+    def update(self, dt, input_current=None):
         """
         Met à jour le potentiel membranaire du neurone en fonction du courant synaptique total.
 
         Args:
             dt (float): Pas de temps de simulation.
+            input_current (float): Courant synaptique déjà accumulé par le réseau. Si None, le courant
+                                   est obtenu en interrogeant chaque synapse entrante.
         """
         self.current_time += dt
-        total_synaptic_current = sum(
-            synapse.get_current(self.current_time) for synapse in self.incoming_synapses
-        )
+        if input_current is None:
+            input_current = sum(
+                synapse.get_current(self.current_time) for synapse in self.incoming_synapses
+            )
+        self.input_current = total_synaptic_current = input_current
         # Inclure le courant émotionnel et le facteur d'attention
         total_current = total_synaptic_current + self.emotion_influence
-        dv = dt * ((- (self.v_m - self.v_rest) + self.r_m * self.alpha * total_current) / self.tau_m)
-        self.v_m += dv
+        if self.integrator == "exact":
+            # Solution exacte de tau_m dv/dt = -(v - v_rest) + r_m I pour I constant sur le pas
+            v_inf = self.v_rest + self.r_m * self.alpha * total_current
+            self.v_m = v_inf + (self.v_m - v_inf) * self.decay_factor(dt)
+        else:
+            dv = dt * ((- (self.v_m - self.v_rest) + self.r_m * self.alpha * total_current) / self.tau_m)
+            self.v_m += dv
 
         # Vérifier si le neurone dépasse le seuil de déclenchement
         if self.v_m >= self.v_threshold:
             self.v_m = self.v_reset
             self.spike = True
             self.last_spike_time = self.current_time
+            self.add_spike_to_traces(self.current_time)
         else:
             self.spike = False
+        self.firing_rate = self.firing_rate * self.rate_decay_factor(dt) + self.spike / self.tau_rate
+
+    def traces_at(self, current_time):
+        """
+        Retourne les traces STDP décrues jusqu'à `current_time` (sans les modifier).
+
+        Args:
+            current_time (float): Temps d'évaluation.
+
+        Returns:
+            tuple: (trace pré-synaptique, trace post-synaptique).
+        """
+        elapsed = max(current_time - self.trace_time, 0.0)
+        return (self.pre_trace * math.exp(-elapsed / self.tau_plus),
+                self.post_trace * math.exp(-elapsed / self.tau_minus))
+
+    def add_spike_to_traces(self, current_time):
+        """
+        Ajoute un spike aux traces STDP : décroissance jusqu'au spike puis incrément de 1.
+
+        Args:
+            current_time (float): Temps du spike.
+        """
+        pre, post = self.traces_at(current_time)
+        self.pre_trace, self.post_trace = pre + 1.0, post + 1.0
+        self.trace_time = current_time
+
+    def decay_factor(self, dt):
+        """Retourne exp(-dt / tau_m), recalculé seulement quand dt ou tau_m changent."""
+        if self._decay[0] != dt or self._decay[1] != self.tau_m:
+            self._decay = (dt, self.tau_m, math.exp(-dt / self.tau_m))
+        return self._decay[2]
+
+    def rate_decay_factor(self, dt):
+        """Retourne exp(-dt / tau_rate), recalculé seulement quand dt ou tau_rate changent."""
+        if self._rate_decay[0] != dt or self._rate_decay[1] != self.tau_rate:
+            self._rate_decay = (dt, self.tau_rate, math.exp(-dt / self.tau_rate))
+        return self._rate_decay[2]
 
     def reset(self):
         """Réinitialise le potentiel du neurone après un spike."""
@@ -77,3 +153,4 @@ class Neuron:
         self.spike = False
         self.last_spike_time = None
         self.input_current = 0.0
+        self.pre_trace = self.post_trace = 0.0
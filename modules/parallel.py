@@ -0,0 +1,260 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from modules.connectivity import sorted_unique
+from modules.vectorized import NEURON_FIELDS, VectorizedNetwork
+
+EDGE_STATE = ('weight', 'x', 'u', 'astro_ca', 'last_update_time', 'astro_update_time')
+
+
+def _run_window(shard, num_steps, dt, incoming):
+    """Injecte les spikes externes reçus puis avance la partition de `num_steps` pas."""
+    if incoming is not None:
+        shard.inject_spikes(*incoming)
+    steps, times, fired = [], [], []
+    for _ in range(num_steps):
+        step = shard._step
+        shard.update(dt)
+        local = np.flatnonzero(shard._neurons['spike'][:shard.num_local])
+        if local.size:
+            steps.append(np.full(local.size, step))
+            times.append(np.full(local.size, shard.current_time))
+            fired.append(local)
+    if not fired:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0, dtype=np.int64)
+    return np.concatenate(steps), np.concatenate(times), np.concatenate(fired)
+
+
+def _shard_state(shard, incoming):
+    """Retourne l'état local de la partition (neurones, synapses et courants en transit)."""
+    if incoming is not None:
+        shard.inject_spikes(*incoming)
+    local = slice(0, shard.num_local)
+    neurons = {name: shard._neurons[name][local].copy() for name in NEURON_FIELDS + ('spike',)}
+    edges = {name: shard._edges[name][shard._edge_pos] for name in EDGE_STATE}
+    return neurons, edges, shard._input_ring[:, local].copy(), shard._step, shard.current_time
+
+
+_COMMANDS = {'run': _run_window, 'state': _shard_state}
+
+
+def _worker_main(conn, shard):
+    """Boucle d'un processus de travail : la partition reste en mémoire entre les fenêtres."""
+    while True:
+        command, args = conn.recv()
+        if command == 'close':
+            break
+        try:
+            conn.send(('ok', _COMMANDS[command](shard, *args)))
+        except Exception as e:
+            conn.send(('error', e))
+    conn.close()
+
+
+class _ProcessShard:
+    """Partition hébergée dans un processus dédié, pilotée par un tube."""
+
+    def __init__(self, context, shard):
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_worker_main, args=(child, shard), daemon=True)
+        self._process.start()
+        child.close()
+
+    def submit(self, command, *args):
+        self._conn.send((command, args))
+        return self
+
+    def result(self):
+        status, value = self._conn.recv()
+        if status == 'error':
+            raise value
+        return value
+
+    def close(self):
+        self._conn.send(('close', ()))
+        self._process.join()
+
+
+class _ThreadShard:
+    """Partition exécutée dans un pool de threads (NumPy libère le GIL sur les opérations de tableaux)."""
+
+    def __init__(self, executor, shard):
+        self._executor = executor
+        self.shard = shard
+
+    def submit(self, command, *args):
+        return self._executor.submit(_COMMANDS[command], self.shard, *args)
+
+    def close(self):
+        pass
+
+
+class ShardedNetwork:
+    """
+    Simulation parallèle d'un VectorizedNetwork découpé en partitions de neurones contigus.
+
+    Chaque partition possède ses neurones et toutes leurs synapses entrantes ; les neurones
+    pré-synaptiques des autres partitions y sont représentés par des sources externes.
+    Les partitions avancent indépendamment pendant une fenêtre égale au plus petit délai des
+    synapses inter-partitions, puis n'échangent que les identifiants des neurones ayant spiké
+    dont des cibles se trouvent dans une autre partition.
+
+    La STDP d'une partition voit les spikes pré-synaptiques distants (et leurs traces) avec au plus
+    une fenêtre de retard, et l'efficacité d'un spike distant utilise la modulation astrocytaire au moment
+    de sa réception ; le reste de la dynamique est identique à la simulation séquentielle.
+
+    Attributes:
+        network (VectorizedNetwork): Réseau d'origine, mis à jour par `synchronize`.
+        bounds (np.ndarray): Limites des partitions dans l'ordre des neurones.
+    """
+
+    def __init__(self, network, num_shards, backend='thread', max_workers=None):
+        """
+        Args:
+            network (VectorizedNetwork): Réseau à partitionner.
+            num_shards (int): Nombre de partitions.
+            backend (str): 'thread' (pool de threads) ou 'process' (un processus par partition).
+            max_workers (int): Nombre de threads (par défaut, un par partition).
+        """
+        if backend not in ('thread', 'process'):
+            raise ValueError("Le backend doit être 'thread' ou 'process'.")
+        network._ensure_compiled()
+        self.network = network
+        self.backend = backend
+        num_neurons = len(network.neurons)
+        self.bounds = np.linspace(0, num_neurons, num_shards + 1).astype(np.int64)
+        self._shards, self._ghosts, self._edge_ids = [], [], []
+        for lo, hi in zip(self.bounds[:-1], self.bounds[1:]):
+            shard, ghosts, edge_ids = self._build_shard(lo, hi)
+            self._shards.append(shard)
+            self._ghosts.append(ghosts)
+            self._edge_ids.append(edge_ids)
+        self._pending = [None] * num_shards
+        self._dt = None
+        self._window = 1
+
+        if backend == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=max_workers or num_shards)
+            self._workers = [_ThreadShard(self._executor, shard) for shard in self._shards]
+        else:
+            self._executor = None
+            context = multiprocessing.get_context()
+            self._workers = [_ProcessShard(context, shard) for shard in self._shards]
+
+    def _build_shard(self, lo, hi):
+        net = self.network
+        e = net._edges
+        positions = np.flatnonzero((e['post'] >= lo) & (e['post'] < hi))
+        pre = e['pre'][positions]
+        remote = (pre < lo) | (pre >= hi)
+        ghosts = sorted_unique(pre[remote])
+
+        shard = VectorizedNetwork(net.config, net.integrator)
+        shard.add_neurons(hi - lo + len(ghosts))
+        shard._neuron_ids = list(net._neuron_ids[lo:hi]) + [net._neuron_ids[g] for g in ghosts]
+        shard._index_of = {neuron_id: i for i, neuron_id in enumerate(shard._neuron_ids)}
+        shard.num_local = hi - lo
+        shard.param_arrays = {name: np.concatenate([values[lo:hi], values[ghosts]])
+                              for name, values in net.param_arrays.items()}
+        shard._ensure_compiled()
+        for name in NEURON_FIELDS + ('spike',):
+            shard._neurons[name][:hi - lo] = net._neurons[name][lo:hi]
+        for name in ('last_spike_time', 'pre_trace', 'post_trace', 'trace_time'):
+            shard._neurons[name][hi - lo:] = net._neurons[name][ghosts]
+
+        local_pre = np.where(remote, hi - lo + np.searchsorted(ghosts, pre), pre - lo)
+        shard.connect_edges(local_pre, e['post'][positions] - lo, e['weight'][positions], e['delay'][positions])
+        shard._ensure_compiled()
+        for name in EDGE_STATE[1:]:
+            shard._edges[name][shard._edge_pos] = e[name][positions]
+        shard.current_time, shard._step = net.current_time, net._step
+        if net._dt is not None:
+            # Reprend les courants déjà en transit vers les neurones de la partition
+            shard._ensure_compiled(net._dt)
+            depth = shard._input_ring.shape[0]
+            for k in range(min(depth, net._input_ring.shape[0])):
+                step = net._step + k
+                shard._input_ring[step % depth, :hi - lo] = net._input_ring[step % net._input_ring.shape[0], lo:hi]
+        return shard, ghosts, e['edge_id'][positions]
+
+    def _min_remote_delay(self, dt):
+        delays = [np.min(shard._edges['delay'][shard._edges['pre'] >= shard.num_local])
+                  for shard in self._shards if np.any(shard._edges['pre'] >= shard.num_local)]
+        if not delays:
+            return None
+        return max(1, int(np.rint(min(delays) / dt)))
+
+    def run(self, num_steps, dt):
+        """
+        Avance toutes les partitions de `num_steps` pas, par fenêtres de plus petit délai inter-partitions.
+
+        Args:
+            num_steps (int): Nombre de pas de simulation.
+            dt (float): Pas de temps de simulation.
+        """
+        if dt != self._dt:
+            self._dt = dt
+            self._window = self._min_remote_delay(dt) or num_steps
+        remaining = num_steps
+        while remaining > 0:
+            window = min(self._window, remaining)
+            futures = [worker.submit('run', window, dt, pending)
+                       for worker, pending in zip(self._workers, self._pending)]
+            results = [future.result() for future in futures]
+            self._exchange(results)
+            remaining -= window
+
+    def update(self, dt):
+        """Avance le réseau d'un pas de temps (échange des spikes à chaque pas)."""
+        self.run(1, dt)
+
+    def _exchange(self, results):
+        """Achemine vers chaque partition les spikes des neurones distants dont elle possède des cibles."""
+        steps = np.concatenate([r[0] for r in results])
+        times = np.concatenate([r[1] for r in results])
+        fired = np.concatenate([r[2] + lo for r, lo in zip(results, self.bounds[:-1])])
+        for k, ghosts in enumerate(self._ghosts):
+            if not len(ghosts) or not len(fired):
+                self._pending[k] = None
+                continue
+            slot = np.minimum(np.searchsorted(ghosts, fired), len(ghosts) - 1)
+            mask = ghosts[slot] == fired
+            if not mask.any():
+                self._pending[k] = None
+                continue
+            local = self.bounds[k + 1] - self.bounds[k] + slot[mask]
+            self._pending[k] = (local, steps[mask], times[mask])
+
+    def synchronize(self):
+        """Recopie l'état des partitions dans le réseau d'origine (neurones, synapses, courants en transit)."""
+        net = self.network
+        futures = [worker.submit('state', pending) for worker, pending in zip(self._workers, self._pending)]
+        self._pending = [None] * len(self._workers)
+        states = [future.result() for future in futures]
+        net._ensure_compiled(self._dt)
+        depth = net._input_ring.shape[0]
+        for (neurons, edges, ring, step, current_time), lo, hi, edge_ids in zip(
+                states, self.bounds[:-1], self.bounds[1:], self._edge_ids):
+            for name, values in neurons.items():
+                net._neurons[name][lo:hi] = values
+            positions = net._edge_pos[edge_ids]
+            for name, values in edges.items():
+                net._edges[name][positions] = values
+            for k in range(min(depth, ring.shape[0])):
+                net._input_ring[(step + k) % depth, lo:hi] = ring[(step + k) % ring.shape[0]]
+            net._step, net.current_time = step, current_time
+
+    def close(self):
+        """Arrête les processus ou threads de travail."""
+        for worker in self._workers:
+            worker.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,31 +1,152 @@
+import itertools
+
+import numpy as np
+
+from modules.vectorized import VectorizedNetwork
+
+ENCODERS = ('direct', 'rate', 'poisson')
+
+
 class PerceptionModule:
     """
     Module de perception qui gère l'entrée sensorielle et la codification pour le réseau neuronal.
-    
+
+    Trois codages sont disponibles :
+    - 'direct' : chaque valeur (x gain) s'ajoute au potentiel membranaire de son neurone sensoriel ;
+    - 'rate' : chaque valeur fixe un taux de décharge (valeur x max_rate) ; un accumulateur de phase
+      déterministe émet une impulsion de `gain` mV à chaque unité franchie ;
+    - 'poisson' : impulsion de `gain` mV avec une probabilité valeur x max_rate x dt à chaque pas.
+
     Attributes:
-        network (Network): Réseau neuronal auquel les entrées sont transmises.
+        network (Network | VectorizedNetwork): Réseau neuronal auquel les entrées sont transmises.
         sensory_neurons (list): Liste des neurones sensoriels.
+        encoder (str): Codage des entrées ('direct', 'rate' ou 'poisson').
+        gain (float): Facteur (direct) ou amplitude des impulsions (rate, poisson), en mV.
+        max_rate (float): Taux de décharge (spikes/ms) correspondant à une entrée de 1.
     """
-    
-    def __init__(self, network):
+
+    def __init__(self, network, encoder='direct', gain=1.0, max_rate=0.1, rng=None):
+        if encoder not in ENCODERS:
+            raise ValueError(f"Le codage doit être l'un de {ENCODERS}.")
         self.network = network
         self.sensory_neurons = []
+        self.encoder = encoder
+        self.gain = gain
+        self.max_rate = max_rate
+        self.rng = np.random.default_rng(rng)
+        self._phase = np.zeros(0)
+        self._indices = None
 
     def add_sensory_neurons(self, neurons):
         """
         Ajoute des neurones sensoriels au module de perception.
-        
+
         Args:
             neurons (list): Liste des neurones sensoriels à ajouter.
         """
         self.sensory_neurons.extend(neurons)
+        self._phase = np.concatenate([self._phase, np.zeros(len(neurons))])
+        self._indices = None
+
+    def rebind(self, network, neurons):
+        """
+        Reconnecte le module à un autre réseau (par exemple restauré depuis un point de contrôle).
+
+        Les neurones sensoriels sont remplacés et les indices mis en cache et les phases du codage
+        par taux sont réinitialisés.
+
+        Args:
+            network (Network | VectorizedNetwork): Nouveau réseau.
+            neurons (list): Neurones sensoriels du nouveau réseau.
+        """
+        self.network = network
+        self.sensory_neurons = []
+        self._phase = np.zeros(0)
+        self._indices = None
+        self.add_sensory_neurons(neurons)
 
-    def encode_sensory_input(self, sensory_input):
+    def encode(self, frames, dt):
+        """
+        Convertit un bloc de trames sensorielles en incréments de potentiel, en une opération vectorielle.
+
+        Args:
+            frames (np.ndarray): Entrées de forme (T, n) ; seules les colonnes ayant un neurone sensoriel
+                                 sont utilisées.
+            dt (float): Pas de temps de simulation.
+
+        Returns:
+            np.ndarray: Incréments de potentiel membranaire de forme (T, min(n, nombre de neurones sensoriels)).
+        """
+        frames = np.asarray(frames, dtype=float)[:, :len(self.sensory_neurons)]
+        if self.encoder == 'direct':
+            return frames * self.gain
+        if self.encoder == 'poisson':
+            probability = np.clip(frames * (self.max_rate * dt), 0.0, 1.0)
+            return (self.rng.random(frames.shape) < probability) * self.gain
+        # Codage par taux : impulsions aux franchissements d'unités de la phase cumulée
+        width = frames.shape[1]
+        phase = self._phase[:width] + np.cumsum(np.maximum(frames, 0.0) * (self.max_rate * dt), axis=0)
+        crossings = np.floor(phase)
+        pulses = np.diff(crossings, axis=0, prepend=np.zeros((1, width)))
+        self._phase[:width] = phase[-1] - crossings[-1] if len(frames) else self._phase[:width]
+        return pulses * self.gain
+
+    def encode_sensory_input(self, sensory_input, dt=1.0):
         """
         Encode les entrées sensorielles en courants neuronaux pour les neurones sensoriels.
-        
+
         Args:
             sensory_input (list): Liste des entrées sensorielles à encoder.
+            dt (float): Pas de temps de simulation (codages 'rate' et 'poisson').
+        """
+        self._apply(self.encode(np.asarray(sensory_input, dtype=float)[None, :], dt)[0])
+
+    def stream(self, frames, dt, step=None, chunk_size=256):
+        """
+        Simule un pas par trame d'un flux d'entrées sensorielles.
+
+        Les trames sont lues par blocs de `chunk_size` (une tranche d'un tableau, éventuellement
+        projeté en mémoire, ou les trames suivantes d'un itérateur) et chaque bloc est codé en une
+        seule opération ; seule l'application des incréments et le pas du réseau restent par trame.
+
+        Args:
+            frames (np.ndarray | iterable): Tableau de forme (T, n) ou itérateur de trames.
+            dt (float): Pas de temps de simulation.
+            step (callable): Appelé avec chaque trame brute après son codage (par défaut, avance le réseau de dt).
+            chunk_size (int): Nombre de trames codées ensemble.
+
+        Returns:
+            int: Nombre de trames traitées.
         """
-        for neuron, value in zip(self.sensory_neurons, sensory_input):
-            neuron.v_m += value  # Mise à jour du potentiel membranaire des neurones sensoriels
+        if step is None:
+            step = lambda frame: self.network.update(dt)
+        count = 0
+        for chunk in self._chunks(frames, chunk_size):
+            for frame, increments in zip(chunk, self.encode(chunk, dt)):
+                self._apply(increments)
+                step(frame)
+            count += len(chunk)
+        return count
+
+    def _chunks(self, frames, chunk_size):
+        if isinstance(frames, np.ndarray):
+            for start in range(0, len(frames), chunk_size):
+                yield np.asarray(frames[start:start + chunk_size], dtype=float)
+            return
+        frames = iter(frames)
+        while True:
+            chunk = list(itertools.islice(frames, chunk_size))
+            if not chunk:
+                return
+            yield np.asarray(chunk, dtype=float)
+
+    def _apply(self, increments):
+        """Ajoute les incréments aux potentiels des neurones sensoriels."""
+        if isinstance(self.network, VectorizedNetwork):
+            if self._indices is None:
+                self._indices = np.array([self.network._resolve(neuron) for neuron in self.sensory_neurons],
+                                         dtype=np.int64)
+            self.network._neuron_array('v_m')[self._indices[:len(increments)]] += increments
+        else:
+            for neuron, value in zip(self.sensory_neurons, increments.tolist()):
+                neuron.v_m += value  # Mise à jour du potentiel membranaire des neurones sensoriels
@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+from modules.vectorized import VectorizedNetwork
+
+
+class _NullStage:
+    """Contexte sans effet retourné par un profileur désactivé."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Mesure la durée d'une étape avec l'horloge monotone."""
+
+    __slots__ = ('_profiler', '_name', '_start')
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler.record(self._name, time.perf_counter() - self._start)
+        return False
+
+
+class Profiler:
+    """
+    Instrumentation légère du pipeline : durées des étapes et compteurs d'événements.
+
+    Désactivé (par défaut), `stage` retourne un contexte partagé sans effet et `count` ne fait
+    rien : le coût se limite à un appel de méthode. Activé, chaque étape conserve sa durée totale,
+    sa durée maximale, son nombre d'appels et les `window` dernières durées, d'où sont tirés les percentiles.
+
+    Attributes:
+        enabled (bool): Active la mesure.
+        window (int): Nombre de durées récentes conservées par étape pour les percentiles.
+    """
+
+    def __init__(self, enabled=False, window=10000):
+        self.enabled = enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Efface toutes les mesures."""
+        with self._lock:
+            self._totals = defaultdict(float)
+            self._calls = defaultdict(int)
+            self._max = defaultdict(float)
+            self._durations = defaultdict(lambda: deque(maxlen=self.window))
+            self._counters = defaultdict(int)
+
+    def stage(self, name):
+        """
+        Retourne un contexte mesurant la durée d'une étape.
+
+        Args:
+            name (str): Nom de l'étape.
+
+        Returns:
+            Contexte à utiliser avec `with`.
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, duration):
+        """
+        Enregistre la durée d'une étape.
+
+        Args:
+            name (str): Nom de l'étape.
+            duration (float): Durée en secondes.
+        """
+        with self._lock:
+            self._totals[name] += duration
+            self._calls[name] += 1
+            self._max[name] = max(self._max[name], duration)
+            self._durations[name].append(duration)
+
+    def count(self, name, value=1):
+        """
+        Incrémente un compteur d'événements.
+
+        Args:
+            name (str): Nom du compteur (spikes, synaptic_events, memory_writes, ...).
+            value (int): Incrément.
+        """
+        if self.enabled:
+            with self._lock:
+                self._counters[name] += int(value)
+
+    def snapshot(self, percentiles=(50, 90, 99)):
+        """
+        Retourne l'état des mesures sous forme de dictionnaire sérialisable (export vers un système de métriques).
+
+        Args:
+            percentiles (tuple): Percentiles de latence à calculer.
+
+        Returns:
+            dict: {'stages': {étape: {'calls', 'total', 'mean', 'max', 'p50', ...}}, 'counters': {...}},
+                  durées en secondes ; les percentiles portent sur les `window` dernières durées,
+                  les autres statistiques sur tous les appels.
+        """
+        with self._lock:
+            stages = {}
+            for name, durations in self._durations.items():
+                recent = np.fromiter(durations, dtype=float, count=len(durations))
+                stats = {
+                    'calls': self._calls[name],
+                    'total': self._totals[name],
+                    'mean': self._totals[name] / self._calls[name],
+                    'max': self._max[name],
+                }
+                stats.update((f'p{p:g}', float(value))
+                             for p, value in zip(percentiles, np.percentile(recent, percentiles)))
+                stages[name] = stats
+            return {'stages': stages, 'counters': dict(self._counters)}
+
+
+def network_activity(network):
+    """
+    Compte les spikes du dernier pas et les événements synaptiques qu'ils déclenchent.
+
+    Args:
+        network (Network | VectorizedNetwork): Réseau venant d'être mis à jour.
+
+    Returns:
+        tuple: (nombre de spikes, nombre de synapses sortantes des neurones ayant spiké).
+    """
+    if isinstance(network, VectorizedNetwork):
+        fired = np.flatnonzero(network._neuron_array('spike'))
+        return len(fired), int((network._out_indptr[fired + 1] - network._out_indptr[fired]).sum())
+    fired = [neuron for neuron in network.neurons if neuron.spike]
+    return len(fired), sum(len(neuron.outgoing_synapses) for neuron in fired)
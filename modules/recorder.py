@@ -0,0 +1,164 @@
+import os
+
+import numpy as np
+
+from modules.vectorized import VectorizedNetwork
+
+
+class _GrowableArray:
+    """Tableau 2D préalloué dont la capacité double quand il est plein."""
+
+    def __init__(self, width, dtype, capacity=4096):
+        self.data = np.empty((capacity, width), dtype=dtype)
+        self.size = 0
+
+    @property
+    def nbytes(self):
+        return self.size * self.data.itemsize * self.data.shape[1]
+
+    def reserve(self, count):
+        """Garantit la place pour `count` lignes supplémentaires et retourne la tranche à remplir."""
+        needed = self.size + count
+        if needed > len(self.data):
+            grown = np.empty((max(needed, 2 * len(self.data)), self.data.shape[1]), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        rows = self.data[self.size:needed]
+        self.size = needed
+        return rows
+
+    def take(self):
+        """Retourne une copie des lignes remplies et vide le tableau (la capacité est conservée)."""
+        rows = self.data[:self.size].copy()
+        self.size = 0
+        return rows
+
+
+class SpikeRecorder:
+    """
+    Enregistreur compact de l'activité d'un réseau (Network ou VectorizedNetwork).
+
+    Les spikes sont stockés en paires (pas, indice du neurone) int32 dans un tableau préalloué qui
+    grandit par doublement. Lorsque la mémoire occupée atteint `memory_budget`, le bloc courant est
+    écrit dans un segment .npy de `directory` et le tableau est réutilisé : la mémoire reste bornée
+    quelle que soit la durée de la simulation. Le potentiel membranaire d'un sous-ensemble de
+    neurones peut aussi être échantillonné tous les `sample_every` pas.
+
+    Attributes:
+        directory (str): Répertoire des segments (None : tout reste en mémoire).
+        memory_budget (int): Mémoire maximale (octets) de chaque tampon avant écriture d'un segment.
+        sample_neurons (np.ndarray): Indices des neurones dont le potentiel est échantillonné (ou None).
+        sample_every (int): Période d'échantillonnage des potentiels, en pas.
+    """
+
+    def __init__(self, directory=None, memory_budget=64 * 2 ** 20, sample_neurons=None, sample_every=10):
+        if sample_every < 1:
+            raise ValueError("La période d'échantillonnage doit être d'au moins un pas.")
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.sample_neurons = None if sample_neurons is None else np.asarray(sample_neurons, dtype=np.int64)
+        self.sample_every = sample_every
+        self._spikes = _GrowableArray(2, np.int32)
+        self._sample_steps = _GrowableArray(1, np.int32)
+        self._samples = _GrowableArray(0 if sample_neurons is None else len(self.sample_neurons), np.float32)
+        self._segments = []  # Chemins des fichiers de chaque segment écrit
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, step, fired, network):
+        """
+        Enregistre les spikes d'un pas (appelé par le réseau à chaque pas).
+
+        Args:
+            step (int): Indice du pas de simulation.
+            fired (array-like): Indices des neurones ayant spiké.
+            network (Network | VectorizedNetwork): Réseau enregistré (pour l'échantillonnage des potentiels).
+        """
+        count = len(fired)
+        if count:
+            rows = self._spikes.reserve(count)
+            rows[:, 0] = step
+            rows[:, 1] = fired
+        if self.sample_neurons is not None and step % self.sample_every == 0:
+            if isinstance(network, VectorizedNetwork):
+                values = network._neurons['v_m'][self.sample_neurons]
+            else:
+                values = [network.neurons[i].v_m for i in self.sample_neurons.tolist()]
+            self._sample_steps.reserve(1)[0, 0] = step
+            self._samples.reserve(1)[0] = values
+        if self.directory is not None and max(self._spikes.nbytes, self._samples.nbytes) >= self.memory_budget:
+            self.flush()
+
+    def steps_until_sample(self, step):
+        """Nombre de pas pouvant être sautés avant le prochain échantillonnage (aucune limite sans échantillonnage)."""
+        if self.sample_neurons is None:
+            return np.iinfo(np.int64).max
+        return -step % self.sample_every
+
+    def flush(self):
+        """Écrit les tampons en mémoire dans un nouveau segment de `directory`."""
+        if self.directory is None or not (self._spikes.size or self._sample_steps.size):
+            return
+        segment = {}
+        for key, buffer in (('spikes', self._spikes), ('membrane_steps', self._sample_steps),
+                            ('membrane', self._samples)):
+            if key != 'spikes' and self.sample_neurons is None:
+                continue
+            segment[key] = os.path.join(self.directory, f"{key}_{len(self._segments):06d}.npy")
+            np.save(segment[key], buffer.take())
+        self._segments.append(segment)
+
+    def _segments_of(self, key, buffer):
+        """Produit chaque segment écrit (ouvert par projection mémoire) puis le tampon courant."""
+        for segment in self._segments:
+            yield np.load(segment[key], mmap_mode='r')
+        yield buffer.data[:buffer.size]
+
+    def iter_spikes(self):
+        """
+        Parcourt les spikes enregistrés segment par segment, sans les charger tous en mémoire.
+
+        Les segments écrits sont ouverts par projection mémoire ; le dernier bloc est une vue sur le
+        tampon courant, valable jusqu'au prochain pas enregistré.
+
+        Yields:
+            tuple: (pas, indices des neurones) d'un segment, deux tableaux int32.
+        """
+        for spikes in self._segments_of('spikes', self._spikes):
+            yield spikes[:, 0], spikes[:, 1]
+
+    def iter_membrane(self):
+        """
+        Parcourt les potentiels échantillonnés segment par segment (voir `iter_spikes`).
+
+        Yields:
+            tuple: (pas d'échantillonnage, potentiels de forme (échantillons, neurones échantillonnés)) d'un segment.
+        """
+        if self.sample_neurons is None:
+            raise ValueError("Aucun neurone n'est échantillonné.")
+        segments = zip(self._segments_of('membrane_steps', self._sample_steps),
+                       self._segments_of('membrane', self._samples))
+        for steps, values in segments:
+            yield steps[:, 0], values
+
+    def spikes(self):
+        """
+        Retourne tous les spikes enregistrés (segments écrits puis tampon courant), chargés en mémoire.
+
+        Pour un long enregistrement, `iter_spikes` évite de charger tous les segments à la fois.
+
+        Returns:
+            tuple: (pas, indices des neurones), deux tableaux int32.
+        """
+        steps, neurons = zip(*self.iter_spikes())
+        return np.concatenate(steps), np.concatenate(neurons)
+
+    def membrane(self):
+        """
+        Retourne les potentiels échantillonnés, chargés en mémoire (voir `iter_membrane`).
+
+        Returns:
+            tuple: (pas d'échantillonnage, potentiels de forme (échantillons, neurones échantillonnés)).
+        """
+        steps, values = zip(*self.iter_membrane())
+        return np.concatenate(steps), np.concatenate(values)
@@ -0,0 +1,87 @@
+class SpikeQueue:
+    """
+    File circulaire d'événements de spikes indexée par le délai (en pas de simulation).
+
+    Chaque case contient uniquement les identifiants des neurones pré-synaptiques dont le spike
+    arrive à ce pas, regroupés par délai, de sorte que la livraison ne coûte qu'un travail
+    proportionnel aux spikes réellement en transit.
+
+    Attributes:
+        size (int): Nombre de cases du tampon (délai maximal + 1).
+    """
+
+    def __init__(self, max_delay_steps=1):
+        self._slots = [[] for _ in range(max_delay_steps + 1)]
+        self._head = 0  # Case correspondant au pas courant
+        self._pending = 0
+
+    @property
+    def size(self):
+        return len(self._slots)
+
+    def __len__(self):
+        """Nombre de lots de spikes en transit."""
+        return self._pending
+
+    def push(self, neuron_ids, delay_steps, offset=None):
+        """
+        Programme la livraison des spikes de neurones pré-synaptiques après un délai.
+
+        Args:
+            neuron_ids (sequence): Identifiants des neurones pré-synaptiques qui ont spiké.
+            delay_steps (int): Délai de transmission en pas de simulation (>= 1).
+            offset (int): Nombre de cases entre la tête et la case d'arrivée (délai par défaut ;
+                          utilisé pour replacer un spike déjà en transit, voir `pending`).
+        """
+        if delay_steps < 1:
+            raise ValueError("Le délai doit être d'au moins un pas de simulation.")
+        offset = delay_steps if offset is None else offset
+        if not 0 <= offset <= delay_steps:
+            raise ValueError("Un spike ne peut pas arriver après son délai de transmission.")
+        if not len(neuron_ids):
+            return
+        if offset >= len(self._slots):
+            self._grow(offset + 1)
+        self._slots[(self._head + offset) % len(self._slots)].append((delay_steps, neuron_ids))
+        self._pending += 1
+
+    def pending(self):
+        """
+        Retourne les spikes en transit, dans l'ordre de leur arrivée.
+
+        Returns:
+            list: Triplets (cases restantes avant l'arrivée, délai, identifiants pré-synaptiques) ;
+                  0 désigne la case lue au prochain `pop`.
+        """
+        size = len(self._slots)
+        return [(offset, delay_steps, neuron_ids)
+                for offset in range(size)
+                for delay_steps, neuron_ids in self._slots[(self._head + offset) % size]]
+
+    def pop(self):
+        """
+        Retire les spikes qui arrivent au pas courant.
+
+        Returns:
+            list: Liste de couples (délai, identifiants pré-synaptiques).
+        """
+        events = self._slots[self._head]
+        if events:
+            self._slots[self._head] = []
+            self._pending -= len(events)
+        return events
+
+    def advance(self):
+        """Passe au pas de simulation suivant."""
+        self._head = (self._head + 1) % len(self._slots)
+
+    def clear(self):
+        """Supprime tous les spikes en transit."""
+        self._slots = [[] for _ in self._slots]
+        self._pending = 0
+
+    def _grow(self, size):
+        # Réordonne les cases pour que la tête soit en position 0, puis agrandit le tampon
+        self._slots = self._slots[self._head:] + self._slots[:self._head]
+        self._slots.extend([] for _ in range(size - len(self._slots)))
+        self._head = 0
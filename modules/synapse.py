@@ -16,6 +16,22 @@ class Synapse:
         last_pre_spike_time (float): Temps du dernier spike du neurone pré-synaptique.
         last_post_spike_time (float): Temps du dernier spike du neurone post-synaptique.
         astro_ca (float): Concentration de calcium de l'astrocyte pour la modulation.
+        last_update_time (float): Temps de la dernière mise à jour de x et u (dernier spike pré-synaptique).
+        astro_update_time (float): Temps de la dernière mise à jour de astro_ca.
+
+    La plasticité homéostatique est une mise à l'échelle périodique : le réseau multiplie les poids
+    selon l'écart entre le taux de décharge lissé du neurone post (Neuron.firing_rate) et la cible.
+
+    La STDP est tous-contre-tous : elle lit les traces exponentielles stockées une fois par neurone
+    (Neuron.pre_trace et Neuron.post_trace) plutôt que la dernière paire de spikes. Un spike post
+    potentialise la synapse de A_plus x trace pré ; un spike pré la déprime de A_minus x trace post.
+    Les constantes de temps tau_plus et tau_minus sont donc celles des traces des neurones pré et
+    post : les fixer sur une synapse (ou par `config`) les fixe pour toutes les synapses partageant
+    ces neurones, comme le paramètre partagé de VectorizedNetwork.
+
+    Entre deux événements, x et u relaxent vers leurs valeurs de repos (1 et U) et le calcium
+    astrocytaire vers 1 ; ces relaxations sont calculées analytiquement au prochain spike qui
+    touche la synapse, si bien qu'une synapse inactive ne coûte rien à chaque pas.
     """
     
     def __init__(self, pre_neuron, post_neuron, weight=0.5, delay=1.0, config=None):
@@ -35,8 +51,7 @@ class Synapse:
         # Paramètres STDP
         self.A_plus = 0.01
         self.A_minus = 0.012
-        self.tau_plus = 20.0
-        self.tau_minus = 20.0
+        # tau_plus et tau_minus sont ceux des traces des neurones (voir les propriétés ci-dessous)
         self.last_pre_spike_time = None
         self.last_post_spike_time = None
         
@@ -47,6 +62,10 @@ class Synapse:
         # Modulation astrocytaire
         self.astro_ca = 0.0  # Concentration de calcium de l'astrocyte
         self.tau_astro = 1000.0  # Constante de temps pour la dynamique de l'astrocyte
+
+        # Temps des dernières mises à jour des variables d'état
+        self.last_update_time = getattr(pre_neuron, 'current_time', 0.0)
+        self.astro_update_time = self.last_update_time
         
         # Configuration personnalisée si fournie
         if config:
@@ -61,34 +80,94 @@ class Synapse:
             self.alpha = config.get('alpha', self.alpha)
             self.tau_astro = config.get('tau_astro', self.tau_astro)
         
+    @property
+    def tau_plus(self):
+        """Constante de temps de la trace du neurone pré-synaptique (ms)."""
+        return self.pre_neuron.tau_plus
+
+    @tau_plus.setter
+    def tau_plus(self, value):
+        self.pre_neuron.tau_plus = value
+
+    @property
+    def tau_minus(self):
+        """Constante de temps de la trace du neurone post-synaptique (ms)."""
+        return self.post_neuron.tau_minus
+
+    @tau_minus.setter
+    def tau_minus(self, value):
+        self.post_neuron.tau_minus = value
+
     def transmit_spike(self, current_time):
         """Transmet un spike après le délai spécifié."""
         self.spike_times.append(current_time + self.delay)
+        self.on_pre_spike(current_time)
+
+    def on_pre_spike(self, current_time):
+        """
+        Met à jour l'état pré-synaptique lors d'un spike, sans mettre le spike en file.
+
+        Utilisé par Network, qui achemine les spikes via sa propre file d'événements.
+
+        Args:
+            current_time (float): Temps du spike pré-synaptique.
+        """
         # Met à jour le temps du dernier spike pré-synaptique
         self.last_pre_spike_time = current_time
         
         # Met à jour les variables de plasticité à court terme
-        self.update_short_term_plasticity()
+        self.update_short_term_plasticity(current_time)
+        # Dépression STDP par la trace du neurone post-synaptique
+        self.update_weight_stdp(current_time, pre_spike=True)
     
     def receive_spike(self, current_time):
         """Gère la réception d'un spike par le neurone post-synaptique."""
         self.last_post_spike_time = current_time
-        # Met à jour le poids synaptique avec la STDP
-        self.update_weight_stdp()
-        # Met à jour la plasticité homéostatique
-        self.update_homeostatic_plasticity()
+        self.advance_astrocyte(current_time)
+        # Potentialisation STDP par la trace du neurone pré-synaptique
+        self.update_weight_stdp(current_time)
         # Met à jour la modulation astrocytaire
         self.update_astrocyte_modulation()
     
-    def update_short_term_plasticity(self):
-        """Met à jour l'efficacité synaptique et le facteur d'utilisation."""
-        dt = self.delay  # Supposons que le spike vient de se produire
-        # Met à jour u
-        du = (self.U - self.u) / self.tau_p + self.U * (1 - self.u)
-        self.u += du * dt
-        # Met à jour x
-        dx = (1 - self.x) / self.tau_p - self.u * self.x
-        self.x += dx * dt
+    def advance(self, current_time):
+        """
+        Fait relaxer analytiquement x et u depuis leur dernière mise à jour.
+
+        Args:
+            current_time (float): Temps auquel amener l'état de la synapse.
+        """
+        elapsed = current_time - self.last_update_time
+        if elapsed > 0:
+            recovery = np.exp(-elapsed / self.tau_p)
+            self.x = 1.0 - (1.0 - self.x) * recovery
+            self.u = self.U + (self.u - self.U) * recovery
+            self.last_update_time = current_time
+
+    def advance_astrocyte(self, current_time):
+        """
+        Fait relaxer analytiquement le calcium astrocytaire vers 1 depuis sa dernière mise à jour.
+
+        Args:
+            current_time (float): Temps auquel amener le calcium.
+        """
+        elapsed = current_time - self.astro_update_time
+        if elapsed > 0:
+            self.astro_ca = 1.0 - (1.0 - self.astro_ca) * np.exp(-elapsed / self.tau_astro)
+            self.astro_update_time = current_time
+
+    def update_short_term_plasticity(self, current_time=None):
+        """
+        Met à jour l'efficacité synaptique et le facteur d'utilisation lors d'un spike pré-synaptique.
+
+        Args:
+            current_time (float): Temps du spike (état avancé jusqu'à ce temps si fourni).
+        """
+        if current_time is not None:
+            self.advance(current_time)
+            self.advance_astrocyte(current_time)
+        # Facilitation puis consommation des ressources
+        self.u += self.U * (1 - self.u)
+        self.x -= self.u * self.x
         # Assure que les variables sont dans [0,1]
         self.u = np.clip(self.u, 0.0, 1.0)
         self.x = np.clip(self.x, 0.0, 1.0)
@@ -100,33 +179,41 @@ class Synapse:
             self.spike_times.popleft()
             # L'effet de la plasticité à court terme est déjà pris en compte
         
-        # Calcule le courant synaptique
-        current = self.weight * self.A * self.x * self.u * len(self.spike_times)
+        return self.efficacy() * len(self.spike_times)
+
+    def efficacy(self):
+        """Calcule le courant transmis par un spike (poids, plasticité à court terme et astrocyte)."""
+        current = self.weight * self.A * self.x * self.u
         # Applique la modulation astrocytaire
         current *= (1 + 0.1 * self.astro_ca)
         return current
     
-    def update_weight_stdp(self):
-        """Met à jour le poids synaptique en utilisant la STDP."""
-        if self.last_pre_spike_time is not None and self.last_post_spike_time is not None:
-            delta_t = self.last_post_spike_time - self.last_pre_spike_time
-            if delta_t > 0:
-                delta_w = self.A_plus * np.exp(-delta_t / self.tau_plus)
-            else:
-                delta_w = -self.A_minus * np.exp(delta_t / self.tau_minus)
-            self.weight += delta_w
-            self.weight = np.clip(self.weight, 0.0, 1.0)
-    
+    def update_weight_stdp(self, current_time, pre_spike=False):
+        """
+        Met à jour le poids synaptique par STDP à partir des traces des neurones.
+
+        Args:
+            current_time (float): Temps du spike.
+            pre_spike (bool): True pour un spike pré-synaptique (dépression), False pour un spike
+                              post-synaptique (potentialisation).
+        """
+        if pre_spike:
+            delta_w = -self.A_minus * self.post_neuron.traces_at(current_time)[1]
+        else:
+            delta_w = self.A_plus * self.pre_neuron.traces_at(current_time)[0]
+        self.weight = np.clip(self.weight + delta_w, 0.0, 1.0)
+
     def update_homeostatic_plasticity(self):
-        """Ajuste le poids synaptique pour maintenir des taux de firing stables."""
-        # Pour simplifier, supposons que le taux est proportionnel à l'activité récente
-        rate = 1.0 / (self.last_post_spike_time - self.last_pre_spike_time + 1e-9)
-        delta_w = self.alpha * (self.target_rate - rate)
-        self.weight += delta_w
-        self.weight = np.clip(self.weight, 0.0, 1.0)
-    
+        """
+        Met le poids à l'échelle pour rapprocher le taux de décharge lissé du neurone post de la cible.
+
+        Appelé périodiquement par Network (voir Network.homeostasis_interval).
+        """
+        factor = 1.0 + self.alpha * (1.0 - self.post_neuron.firing_rate / self.target_rate)
+        self.weight = np.clip(self.weight * factor, 0.0, 1.0)
+
     def update_astrocyte_modulation(self):
-        """Met à jour la concentration de calcium de l'astrocyte."""
+        """Augmente la concentration de calcium de l'astrocyte lors d'une activité post-synaptique."""
         # Modèle simple : la concentration de calcium augmente avec l'activité
         dca = (-self.astro_ca + 1.0) / self.tau_astro
         self.astro_ca += dca
@@ -0,0 +1,202 @@
+import json
+import os
+
+import numpy as np
+
+
+class VectorIndex:
+    """
+    Index de plus proches voisins par produits scalaires sur une matrice NumPy contiguë.
+
+    Les vecteurs sont normalisés (similarité cosinus) et stockés dans une matrice float32 dont la
+    capacité double au besoin ; une recherche traite un lot de requêtes en un seul produit matriciel.
+
+    Attributes:
+        dim (int): Dimension des vecteurs (fixée au premier ajout si None).
+        keys (list): Clé associée à chaque ligne de la matrice.
+        dirty (bool): Vrai si l'index a changé depuis le dernier `save` ou `load`.
+    """
+
+    def __init__(self, dim=None):
+        self.dim = dim
+        self.keys = []
+        self.dirty = False
+        self._rows = {}
+        self._vectors = np.empty((0, dim or 0), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self._rows
+
+    @property
+    def vectors(self):
+        """Matrice (n, dim) des vecteurs normalisés."""
+        return self._vectors[:len(self.keys)]
+
+    def _normalize(self, vectors):
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self._vectors = np.empty((0, self.dim), dtype=np.float32)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Dimension attendue : {self.dim}, reçue : {vectors.shape[1]}.")
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def add(self, key, vector):
+        """
+        Ajoute ou remplace le vecteur associé à une clé.
+
+        Args:
+            key (str): Clé de la mémoire.
+            vector (array-like): Vecteur de plongement.
+
+        Returns:
+            int: Ligne du vecteur dans la matrice.
+        """
+        vector = self._normalize(vector)[0]
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self.keys)
+            if row == len(self._vectors):
+                grown = np.empty((max(16, 2 * len(self._vectors)), self.dim), dtype=np.float32)
+                grown[:row] = self._vectors[:row]
+                self._vectors = grown
+            self.keys.append(key)
+            self._rows[key] = row
+        self._vectors[row] = vector
+        self.dirty = True
+        return row
+
+    def search(self, queries, k=5):
+        """
+        Recherche les k vecteurs les plus similaires pour chaque requête.
+
+        Args:
+            queries (array-like): Requête unique (dim,) ou lot de requêtes (q, dim).
+            k (int): Nombre de voisins à retourner.
+
+        Returns:
+            list: Pour chaque requête, liste de couples (clé, similarité) triés par similarité décroissante.
+        """
+        queries = self._normalize(queries)
+        if not self.keys:
+            return [[] for _ in queries]
+        rows = np.arange(len(self.keys))
+        results = []
+        # Requêtes traitées par blocs pour borner la matrice de scores (bloc x n)
+        block = max(1, 2 ** 24 // len(self.keys))
+        for start in range(0, len(queries), block):
+            scores = queries[start:start + block] @ self.vectors.T
+            results.extend(self._top_k(row_scores, rows, k) for row_scores in scores)
+        return results
+
+    def _top_k(self, scores, rows, k):
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(self.keys[rows[i]], float(scores[i])) for i in best]
+
+    def save(self, path):
+        """
+        Sauvegarde l'index dans un fichier .npz (vecteurs float32 et clés en JSON).
+
+        Le fichier est écrit à côté, synchronisé sur disque puis substitué atomiquement à `path`.
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, vectors=self.vectors, keys=np.array(json.dumps(self.keys)))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self.dirty = False
+
+    def load(self, path):
+        """Recharge un index sauvegardé par `save` (les vecteurs déjà normalisés sont réinsérés)."""
+        with np.load(path) as data:
+            vectors, keys = data['vectors'], json.loads(str(data['keys']))
+        for key, vector in zip(keys, vectors):
+            self.add(key, vector)
+        self.dirty = False
+
+
+class IVFIndex(VectorIndex):
+    """
+    Index à fichiers inversés (IVF) : les vecteurs sont répartis entre `num_lists` centroïdes
+    obtenus par k-moyennes, et une requête ne compare que les listes des `num_probe` centroïdes
+    les plus proches. Tant que moins de `train_size` vecteurs sont stockés, la recherche est exhaustive.
+
+    Attributes:
+        num_lists (int): Nombre de listes inversées.
+        num_probe (int): Nombre de listes explorées par requête.
+        train_size (int): Nombre de vecteurs à partir duquel les centroïdes sont entraînés.
+    """
+
+    def __init__(self, dim=None, num_lists=64, num_probe=4, train_size=None, seed=0):
+        super().__init__(dim)
+        self.num_lists = num_lists
+        self.num_probe = num_probe
+        self.train_size = train_size or 40 * num_lists
+        self.centroids = None
+        self._assignment = np.empty(0, dtype=np.int64)
+        self._lists = []
+        self._list_arrays = {}
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, key, vector):
+        replaced = key in self
+        row = super().add(key, vector)
+        if self.centroids is None:
+            if len(self) >= self.train_size:
+                self.train()
+            return row
+        if replaced:
+            self._lists[self._assignment[row]].remove(row)
+            self._list_arrays.pop(self._assignment[row], None)
+        elif row >= len(self._assignment):
+            self._assignment = np.resize(self._assignment, max(16, 2 * len(self._assignment)))
+        cluster = int(np.argmax(self.centroids @ self._vectors[row]))
+        self._assignment[row] = cluster
+        self._lists[cluster].append(row)
+        self._list_arrays.pop(cluster, None)
+        return row
+
+    def train(self, iterations=10):
+        """Entraîne les centroïdes par k-moyennes sphériques et répartit tous les vecteurs."""
+        vectors = self.vectors
+        num_lists = min(self.num_lists, len(vectors))
+        sample = vectors[self._rng.choice(len(vectors), size=min(len(vectors), 256 * num_lists), replace=False)]
+        centroids = sample[self._rng.choice(len(sample), size=num_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = ~np.any(sums, axis=1)
+            sums[empty] = centroids[empty]
+            centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+        self.centroids = centroids
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        self._assignment = np.resize(assignment, max(16, 2 * len(assignment)))
+        self._lists = [np.flatnonzero(assignment == c).tolist() for c in range(num_lists)]
+        self._list_arrays = {}
+
+    def _list_rows(self, cluster):
+        rows = self._list_arrays.get(cluster)
+        if rows is None:
+            rows = self._list_arrays[cluster] = np.array(self._lists[cluster], dtype=np.int64)
+        return rows
+
+    def search(self, queries, k=5):
+        if self.centroids is None:
+            return super().search(queries, k)
+        queries = self._normalize(queries)
+        probes = np.argsort(-(queries @ self.centroids.T), axis=1)[:, :self.num_probe]
+        results = []
+        for query, clusters in zip(queries, probes):
+            rows = np.concatenate([self._list_rows(c) for c in clusters])
+            results.append(self._top_k(self._vectors[rows] @ query, rows, k))
+        return results
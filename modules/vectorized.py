@@ -0,0 +1,822 @@
+import numpy as np
+
+from modules.connectivity import ConnectivityMixin
+
+# Paramètres synaptiques par défaut (identiques à ceux de Synapse)
+DEFAULT_SYNAPSE_CONFIG = {
+    'U': 0.2,
+    'A': 1.0,
+    'tau_p': 200.0,
+    'A_plus': 0.01,
+    'A_minus': 0.012,
+    'tau_plus': 20.0,
+    'tau_minus': 20.0,
+    'target_rate': 0.1,
+    'alpha': 0.001,
+    'tau_astro': 1000.0,
+}
+
+# Paramètres de la plasticité homéostatique propres au réseau (lissage des taux, période de mise à l'échelle)
+DEFAULT_HOMEOSTASIS_CONFIG = {
+    'tau_rate': 1000.0,
+    'homeostasis_interval': 100.0,
+}
+
+# Paramètres neuronaux par défaut (identiques à ceux de Neuron)
+DEFAULT_NEURON_PARAMS = {
+    'tau_m': 20.0,
+    'v_rest': -65.0,
+    'v_threshold': -50.0,
+    'v_reset': -65.0,
+    'r_m': 1.0,
+}
+
+NEURON_FIELDS = ('tau_m', 'v_rest', 'v_threshold', 'v_reset', 'r_m', 'v_m',
+                 'alpha', 'emotion_influence', 'last_spike_time', 'input_current',
+                 'pre_trace', 'post_trace', 'trace_time', 'firing_rate')
+EDGE_FIELDS = ('weight', 'delay', 'x', 'u', 'astro_ca', 'last_update_time', 'astro_update_time')
+
+
+def gather_rows(indptr, rows):
+    """
+    Retourne les positions (dans l'ordre CSR) de toutes les entrées des lignes demandées.
+
+    Args:
+        indptr (np.ndarray): Pointeurs de lignes de la structure CSR.
+        rows (np.ndarray): Indices des lignes à rassembler.
+
+    Returns:
+        np.ndarray: Positions concaténées des entrées des lignes.
+    """
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # Décalage de chaque bloc : position de départ moins le début du bloc dans la sortie
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return shifts + np.arange(total, dtype=np.int64)
+
+
+def _neuron_field(name):
+    def fget(self):
+        return self._network._neuron_array(name)[self.index].item()
+
+    def fset(self, value):
+        self._network._neuron_array(name)[self.index] = value
+        if name == 'tau_m':
+            self._network._decay = None
+
+    return property(fget, fset)
+
+
+def _edge_field(name):
+    def fget(self):
+        return self._network._edge_array(name)[self._network._edge_pos[self.edge_id]].item()
+
+    def fset(self, value):
+        self._network._edge_array(name)[self._network._edge_pos[self.edge_id]] = value
+
+    return property(fget, fset)
+
+
+class NeuronView:
+    """
+    Vue légère sur un neurone d'un VectorizedNetwork, exposant les mêmes attributs que Neuron.
+
+    Attributes:
+        index (int): Position du neurone dans les tableaux du réseau.
+    """
+
+    __slots__ = ('_network', 'index')
+
+    def __init__(self, network, index):
+        self._network = network
+        self.index = index
+
+    tau_m = _neuron_field('tau_m')
+    v_rest = _neuron_field('v_rest')
+    v_threshold = _neuron_field('v_threshold')
+    v_reset = _neuron_field('v_reset')
+    r_m = _neuron_field('r_m')
+    v_m = _neuron_field('v_m')
+    alpha = _neuron_field('alpha')
+    emotion_influence = _neuron_field('emotion_influence')
+    input_current = _neuron_field('input_current')
+    pre_trace = _neuron_field('pre_trace')
+    post_trace = _neuron_field('post_trace')
+    trace_time = _neuron_field('trace_time')
+    firing_rate = _neuron_field('firing_rate')
+
+    @property
+    def neuron_id(self):
+        return self._network._neuron_ids[self.index]
+
+    @property
+    def spike(self):
+        return bool(self._network._neuron_array('spike')[self.index])
+
+    @spike.setter
+    def spike(self, value):
+        self._network._neuron_array('spike')[self.index] = value
+
+    @property
+    def last_spike_time(self):
+        value = self._network._neuron_array('last_spike_time')[self.index]
+        return None if np.isnan(value) else float(value)
+
+    @property
+    def current_time(self):
+        return self._network.current_time
+
+    @property
+    def incoming_synapses(self):
+        return self._network._synapse_views(self._network._in_edges(self.index))
+
+    @property
+    def outgoing_synapses(self):
+        return self._network._synapse_views(self._network._out_edges(self.index))
+
+    def __eq__(self, other):
+        return (isinstance(other, NeuronView) and other._network is self._network
+                and other.index == self.index)
+
+    def __hash__(self):
+        return hash((id(self._network), self.index))
+
+    def __repr__(self):
+        return f"NeuronView(neuron_id={self.neuron_id!r}, v_m={self.v_m:.3f})"
+
+
+class SynapseView:
+    """
+    Vue légère sur une synapse d'un VectorizedNetwork, exposant les mêmes attributs que Synapse.
+
+    Attributes:
+        edge_id (int): Identifiant stable de la synapse (ordre de création).
+    """
+
+    __slots__ = ('_network', 'edge_id')
+
+    def __init__(self, network, edge_id):
+        self._network = network
+        self.edge_id = edge_id
+
+    weight = _edge_field('weight')
+    delay = _edge_field('delay')
+    x = _edge_field('x')
+    u = _edge_field('u')
+    astro_ca = _edge_field('astro_ca')
+    last_update_time = _edge_field('last_update_time')
+    astro_update_time = _edge_field('astro_update_time')
+
+    @property
+    def pre_neuron(self):
+        net = self._network
+        return NeuronView(net, int(net._edge_array('pre')[net._edge_pos[self.edge_id]]))
+
+    @property
+    def post_neuron(self):
+        net = self._network
+        return NeuronView(net, int(net._edge_array('post')[net._edge_pos[self.edge_id]]))
+
+    @property
+    def last_pre_spike_time(self):
+        return self.pre_neuron.last_spike_time
+
+    @property
+    def last_post_spike_time(self):
+        return self.post_neuron.last_spike_time
+
+    def __getattr__(self, name):
+        # Paramètres partagés (U, A, tau_p, A_plus, ...) lus dans la configuration du réseau
+        net = self._network
+        if name in net.param_arrays:
+            return net.param_arrays[name][net._edge_array('post')[net._edge_pos[self.edge_id]]].item()
+        if name in net.config:
+            return net.config[name]
+        raise AttributeError(name)
+
+    def __eq__(self, other):
+        return (isinstance(other, SynapseView) and other._network is self._network
+                and other.edge_id == self.edge_id)
+
+    def __hash__(self):
+        return hash((id(self._network), self.edge_id))
+
+    def __repr__(self):
+        return f"SynapseView(edge_id={self.edge_id}, weight={self.weight:.3f})"
+
+
+class _ViewSequence:
+    """Séquence paresseuse créant les vues à la demande (aucun objet par élément en mémoire)."""
+
+    def __init__(self, length, factory):
+        self._length = length
+        self._factory = factory
+
+    def __len__(self):
+        return self._length()
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._factory(i) for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(item)
+        return self._factory(item)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._factory(i)
+
+
+class VectorizedNetwork(ConnectivityMixin):
+    """
+    Moteur de simulation en structure de tableaux : les états neuronaux sont stockés dans des
+    tableaux NumPy et les synapses dans une structure CSR (triée par neurone pré-synaptique),
+    de sorte qu'un pas LIF se réduit à quelques opérations vectorielles.
+
+    Les objets `neurons` et `synapses` sont des vues légères (NeuronView, SynapseView) qui
+    lisent et écrivent directement dans les tableaux.
+
+    Attributes:
+        config (dict): Paramètres synaptiques partagés (mêmes clés que la configuration de Synapse),
+                       complétés par tau_rate et homeostasis_interval (voir Network).
+        param_arrays (dict): Paramètres de `config` (sauf homeostasis_interval) qui varient d'un neurone
+                             à l'autre, par exemple entre les membres d'un NetworkEnsemble : {nom: valeur
+                             par neurone}. Une synapse prend la valeur de son neurone post-synaptique.
+        integrator (str): 'exact' (intégration exponentielle exacte) ou 'euler', comme Neuron.
+        current_time (float): Temps courant de la simulation.
+        neurons (sequence): Vues sur les neurones.
+        synapses (sequence): Vues sur les synapses, dans l'ordre de création.
+    """
+
+    def __init__(self, config=None, integrator='exact'):
+        if integrator not in ('exact', 'euler'):
+            raise ValueError("L'intégrateur doit être 'exact' ou 'euler'.")
+        self.config = dict(DEFAULT_SYNAPSE_CONFIG, **DEFAULT_HOMEOSTASIS_CONFIG)
+        if config:
+            self.config.update(config)
+        self.param_arrays = {}
+        self.integrator = integrator
+        self._decay = None  # (dt, nombre de neurones, exp(-dt / tau_m) de chaque neurone)
+        self.current_time = 0.0
+        self._step = 0
+        self._dt = None
+
+        self._neuron_ids = []
+        self._index_of = {}
+        self._neurons = {name: np.empty(0) for name in NEURON_FIELDS}
+        self._neurons['spike'] = np.zeros(0, dtype=bool)
+        self._staged_neurons = []
+
+        self._edges = {name: np.empty(0) for name in EDGE_FIELDS}
+        self._edges['pre'] = np.empty(0, dtype=np.int64)
+        self._edges['post'] = np.empty(0, dtype=np.int64)
+        self._edges['edge_id'] = np.empty(0, dtype=np.int64)
+        self._staged_edges = []
+        self._edge_pos = np.empty(0, dtype=np.int64)
+        self._out_indptr = np.zeros(1, dtype=np.int64)
+        self._in_order = np.empty(0, dtype=np.int64)
+        self._in_indptr = np.zeros(1, dtype=np.int64)
+        self._delay_steps = np.empty(0, dtype=np.int64)
+        self._input_ring = np.zeros((1, 0))
+        self._topology_version = 0  # Incrémenté à chaque reconstruction des index CSR
+
+        # Nombre de neurones intégrés ; les suivants sont des sources externes (voir inject_spikes)
+        self.num_local = None
+        self.recorder = None  # SpikeRecorder optionnel, appelé à chaque pas
+
+        self.neurons = _ViewSequence(self._num_neurons, self._neuron_view)
+        self.synapses = _ViewSequence(self._num_edges, self._synapse_view)
+
+    @classmethod
+    def from_network(cls, network, config=None):
+        """
+        Construit un moteur vectorisé à partir d'un Network composé d'objets Neuron et Synapse.
+
+        Les paramètres synaptiques partagés sont lus sur la première synapse si `config` n'est pas fourni.
+        Les spikes en transit dans la file du réseau sont convertis en courants dans le tampon de délais.
+
+        Args:
+            network (Network): Réseau à convertir.
+            config (dict): Paramètres synaptiques partagés.
+
+        Returns:
+            VectorizedNetwork: Moteur contenant le même état.
+        """
+        if config is None and network.synapses:
+            first = network.synapses[0]
+            config = {key: getattr(first, key) for key in DEFAULT_SYNAPSE_CONFIG}
+        config = dict(config or {}, homeostasis_interval=network.homeostasis_interval)
+        if network.neurons:
+            config['tau_rate'] = network.neurons[0].tau_rate
+        integrator = network.neurons[0].integrator if network.neurons else 'exact'
+        engine = cls(config, integrator)
+        for neuron in network.neurons:
+            engine.add_neuron(neuron)
+        synapses = network.synapses
+        engine.connect_edges([engine._resolve(s.pre_neuron) for s in synapses],
+                             [engine._resolve(s.post_neuron) for s in synapses],
+                             [s.weight for s in synapses], [s.delay for s in synapses])
+        engine._ensure_compiled()
+        positions = engine._edge_pos[:len(synapses)]
+        for name in ('x', 'u', 'astro_ca', 'last_update_time', 'astro_update_time'):
+            engine._edges[name][positions] = [getattr(s, name) for s in synapses]
+        engine.current_time, engine._step = network.current_time, network._step
+        if len(network.spike_queue):
+            # Les spikes en transit deviennent les courants qu'ils délivreront, au pas de leur arrivée
+            engine._ensure_compiled(network._dt)
+            depth = engine._input_ring.shape[0]
+            for offset, delay_steps, neuron_ids in network.spike_queue.pending():
+                outgoing = gather_rows(engine._out_indptr, np.asarray(neuron_ids, dtype=np.int64))
+                outgoing = outgoing[engine._delay_steps[outgoing] == delay_steps]
+                np.add.at(engine._input_ring, ((engine._step + offset) % depth, engine._edges['post'][outgoing]),
+                          engine.efficacy(outgoing))
+        return engine
+
+    def _num_neurons(self):
+        return len(self._neuron_ids)
+
+    def _num_edges(self):
+        return len(self._edges['weight']) + sum(len(chunk['pre']) for chunk in self._staged_edges)
+
+    def add_neuron(self, neuron=None, **params):
+        """
+        Ajoute un neurone au réseau.
+
+        Args:
+            neuron (Neuron): Neurone dont les paramètres et l'état sont copiés (optionnel).
+            **params: Paramètres LIF (tau_m, v_rest, v_threshold, v_reset, r_m) si aucun neurone n'est fourni.
+
+        Returns:
+            NeuronView: Vue sur le neurone ajouté.
+        """
+        index = len(self._neuron_ids)
+        if neuron is not None:
+            neuron_id = neuron.neuron_id
+            values = {name: getattr(neuron, name) for name in DEFAULT_NEURON_PARAMS}
+            values.update(v_m=neuron.v_m, alpha=neuron.alpha, emotion_influence=neuron.emotion_influence,
+                          pre_trace=neuron.pre_trace, post_trace=neuron.post_trace, trace_time=neuron.trace_time,
+                          firing_rate=neuron.firing_rate)
+            if neuron.last_spike_time is not None:
+                values['last_spike_time'] = neuron.last_spike_time
+        else:
+            neuron_id = params.pop('neuron_id', index)
+            values = dict(DEFAULT_NEURON_PARAMS)
+            values.update(params)
+        self._neuron_ids.append(neuron_id)
+        self._index_of[neuron_id] = index
+        self._staged_neurons.append(values)
+        return NeuronView(self, index)
+
+    def add_neurons(self, count, **params):
+        """
+        Ajoute `count` neurones identiques en une seule opération.
+
+        Args:
+            count (int): Nombre de neurones à ajouter.
+            **params: Paramètres LIF communs.
+
+        Returns:
+            np.ndarray: Indices des neurones ajoutés.
+        """
+        start = len(self._neuron_ids)
+        self._neuron_ids.extend(range(start, start + count))
+        self._index_of.update((i, i) for i in range(start, start + count))
+        self._flush_neurons()
+        values = dict(DEFAULT_NEURON_PARAMS)
+        values.update(params)
+        self._append_neurons(count, values)
+        return np.arange(start, start + count)
+
+    def _append_neurons(self, count, values):
+        defaults = {
+            'v_m': values.get('v_rest', DEFAULT_NEURON_PARAMS['v_rest']),
+            'alpha': 1.0,
+            'emotion_influence': 0.0,
+            'last_spike_time': np.nan,
+            'input_current': 0.0,
+            'pre_trace': 0.0,
+            'post_trace': 0.0,
+            'trace_time': self.current_time,
+            'firing_rate': 0.0,
+        }
+        for name in NEURON_FIELDS:
+            column = np.broadcast_to(np.asarray(values.get(name, defaults.get(name)), dtype=float), (count,))
+            self._neurons[name] = np.concatenate([self._neurons[name], column])
+        self._neurons['spike'] = np.concatenate([self._neurons['spike'], np.zeros(count, dtype=bool)])
+        # Les nouveaux neurones n'ont encore aucun courant en transit
+        self._input_ring = np.pad(self._input_ring, ((0, 0), (0, count)))
+
+    def _flush_neurons(self):
+        if not self._staged_neurons:
+            return
+        staged, self._staged_neurons = self._staged_neurons, []
+        defaults = {'alpha': 1.0, 'emotion_influence': 0.0, 'last_spike_time': np.nan, 'input_current': 0.0,
+                    'pre_trace': 0.0, 'post_trace': 0.0, 'trace_time': self.current_time, 'firing_rate': 0.0}
+        count = len(staged)
+        values = {}
+        for name in NEURON_FIELDS:
+            if name == 'v_m':
+                values[name] = [row.get('v_m', row['v_rest']) for row in staged]
+            else:
+                values[name] = [row.get(name, defaults.get(name)) for row in staged]
+        self._append_neurons(count, values)
+
+    def _resolve(self, neuron):
+        if isinstance(neuron, NeuronView):
+            return neuron.index
+        if isinstance(neuron, (int, np.integer)):
+            return int(neuron)
+        return self._index_of[neuron.neuron_id]
+
+    def connect_neurons(self, pre_neuron, post_neuron, weight=0.5, delay=1.0):
+        """
+        Crée une synapse entre deux neurones.
+
+        Args:
+            pre_neuron (Neuron | NeuronView | int): Neurone pré-synaptique.
+            post_neuron (Neuron | NeuronView | int): Neurone post-synaptique.
+            weight (float): Poids synaptique initial.
+            delay (float): Délai de transmission (ms).
+        """
+        self.connect_edges([self._resolve(pre_neuron)], [self._resolve(post_neuron)], weight, delay)
+
+    def connect_edges(self, pre, post, weight=0.5, delay=1.0):
+        """
+        Ajoute un lot de synapses décrit par une liste d'arêtes.
+
+        Args:
+            pre (array-like): Indices des neurones pré-synaptiques.
+            post (array-like): Indices des neurones post-synaptiques.
+            weight (float | array-like): Poids initiaux.
+            delay (float | array-like): Délais de transmission (ms).
+        """
+        pre = np.asarray(pre, dtype=np.int64).ravel()
+        post = np.asarray(post, dtype=np.int64).ravel()
+        if pre.shape != post.shape:
+            raise ValueError("Les listes pré- et post-synaptiques doivent avoir la même longueur.")
+        count = len(pre)
+        self._staged_edges.append({
+            'pre': pre,
+            'post': post,
+            'weight': np.broadcast_to(np.asarray(weight, dtype=float), (count,)).copy(),
+            'delay': np.broadcast_to(np.asarray(delay, dtype=float), (count,)).copy(),
+        })
+
+    def _flush_edges(self):
+        if not self._staged_edges:
+            return
+        staged, self._staged_edges = self._staged_edges, []
+        num_neurons = len(self._neuron_ids)
+        first_id = len(self._edges['weight'])
+        new = {key: np.concatenate([chunk[key] for chunk in staged]) for key in ('pre', 'post', 'weight', 'delay')}
+        if new['pre'].size and (new['pre'].max(initial=0) >= num_neurons or new['post'].max(initial=0) >= num_neurons
+                                or min(new['pre'].min(), new['post'].min()) < 0):
+            raise IndexError("Une synapse référence un neurone inexistant.")
+        count = len(new['pre'])
+        new['x'] = np.ones(count)
+        new['u'] = np.zeros(count) + self._param('U', new['post'])
+        new['astro_ca'] = np.zeros(count)
+        new['last_update_time'] = np.full(count, self.current_time)
+        new['astro_update_time'] = np.full(count, self.current_time)
+        new['edge_id'] = np.arange(first_id, first_id + count, dtype=np.int64)
+        merged = {key: np.concatenate([self._edges[key], new[key]]) for key in new}
+
+        # Tri stable par neurone pré-synaptique : ordre CSR
+        order = np.argsort(merged['pre'], kind='stable')
+        self._edges = {key: value[order] for key, value in merged.items()}
+        self._edge_pos = np.empty(len(order), dtype=np.int64)
+        self._edge_pos[self._edges['edge_id']] = np.arange(len(order))
+        self._dt = None
+
+    def _build_index(self):
+        num_neurons = len(self._neuron_ids)
+        self._topology_version += 1
+        self._out_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(self._edges['pre'], minlength=num_neurons))]).astype(np.int64)
+        self._in_order = np.argsort(self._edges['post'], kind='stable')
+        self._in_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(self._edges['post'], minlength=num_neurons))]).astype(np.int64)
+
+    def _ensure_compiled(self, dt=None):
+        """Intègre les neurones et synapses en attente et (re)construit les index CSR et le tampon de délais."""
+        dirty = bool(self._staged_neurons or self._staged_edges)
+        self._flush_neurons()
+        self._flush_edges()
+        if dirty or len(self._out_indptr) != len(self._neuron_ids) + 1:
+            self._build_index()
+        if dt is not None and dt != self._dt:
+            self._delay_steps = np.maximum(1, np.rint(self._edges['delay'] / dt)).astype(np.int64)
+            depth = int(self._delay_steps.max(initial=1)) + 1
+            if self._input_ring.shape != (depth, len(self._neuron_ids)):
+                ring = np.zeros((depth, len(self._neuron_ids)))
+                # Conserve les courants déjà en transit lorsque c'est possible
+                keep = min(depth, self._input_ring.shape[0])
+                if self._input_ring.shape[1] == len(self._neuron_ids):
+                    for k in range(keep):
+                        ring[(self._step + k) % depth] = self._input_ring[(self._step + k) % self._input_ring.shape[0]]
+                self._input_ring = ring
+            self._dt = dt
+
+    def _neuron_array(self, name):
+        self._ensure_compiled()
+        return self._neurons[name]
+
+    def _edge_array(self, name):
+        self._ensure_compiled()
+        return self._edges[name]
+
+    def _out_edges(self, index):
+        self._ensure_compiled()
+        return np.arange(self._out_indptr[index], self._out_indptr[index + 1])
+
+    def _in_edges(self, index):
+        self._ensure_compiled()
+        return self._in_order[self._in_indptr[index]:self._in_indptr[index + 1]]
+
+    def _neuron_view(self, index):
+        return NeuronView(self, index)
+
+    def _synapse_view(self, edge_id):
+        return SynapseView(self, edge_id)
+
+    def _synapse_views(self, positions):
+        return [SynapseView(self, int(edge_id)) for edge_id in self._edges['edge_id'][positions]]
+
+    def weight_matrix(self):
+        """
+        Retourne la matrice des poids au format scipy.sparse.csr_matrix (lignes : pré, colonnes : post).
+
+        Returns:
+            scipy.sparse.csr_matrix: Matrice creuse des poids (les arêtes multiples sont additionnées).
+        """
+        from scipy.sparse import csr_matrix
+        self._ensure_compiled()
+        n = len(self._neuron_ids)
+        return csr_matrix((self._edges['weight'], self._edges['post'], self._out_indptr), shape=(n, n))
+
+    def _param(self, name, neurons):
+        """Valeur du paramètre `name` pour les neurones `neurons` (scalaire s'il est partagé)."""
+        values = self.param_arrays.get(name)
+        return self.config[name] if values is None else values[neurons]
+
+    def _edge_param(self, name, positions):
+        """Valeur du paramètre `name` pour les synapses aux positions CSR `positions` (scalaire s'il est partagé)."""
+        values = self.param_arrays.get(name)
+        return self.config[name] if values is None else values[self._edges['post'][positions]]
+
+    def efficacy(self, positions):
+        """
+        Calcule l'efficacité des synapses (poids modulé par la plasticité à court terme et l'astrocyte).
+
+        Args:
+            positions (np.ndarray): Positions CSR des synapses.
+
+        Returns:
+            np.ndarray: Courant transmis par spike pour chaque synapse.
+        """
+        e = self._edges
+        return (e['weight'][positions] * self._edge_param('A', positions) * e['x'][positions] * e['u'][positions]
+                * (1 + 0.1 * e['astro_ca'][positions]))
+
+    def update(self, dt):
+        """Met à jour le réseau (neurones et synapses) d'un pas de temps."""
+        self._ensure_compiled(dt)
+        self.current_time += dt
+        local = slice(0, self.num_local)
+        n = {name: values[local] for name, values in self._neurons.items()}
+        depth = self._input_ring.shape[0]
+
+        # Courant synaptique arrivant à ce pas
+        slot = self._step % depth
+        n['input_current'][:] = self._input_ring[slot, local]
+        self._input_ring[slot] = 0.0
+
+        # Intégration LIF (comme Neuron.update)
+        total_current = n['input_current'] + n['emotion_influence']
+        if self.integrator == 'exact':
+            v_inf = n['v_rest'] + n['r_m'] * n['alpha'] * total_current
+            n['v_m'][:] = v_inf + (n['v_m'] - v_inf) * self._decay_factors(dt)[local]
+        else:
+            n['v_m'] += dt * ((-(n['v_m'] - n['v_rest']) + n['r_m'] * n['alpha'] * total_current) / n['tau_m'])
+        spiking = n['v_m'] >= n['v_threshold']
+        n['v_m'][spiking] = n['v_reset'][spiking]
+        n['last_spike_time'][spiking] = self.current_time
+        n['spike'][:] = spiking
+
+        fired = np.flatnonzero(spiking)
+        if fired.size:
+            self._add_spikes_to_traces(fired, self.current_time)
+            outgoing = gather_rows(self._out_indptr, fired)
+            self._transmit(outgoing)
+            incoming = self._in_order[gather_rows(self._in_indptr, fired)]
+            self._receive(incoming)
+
+        # Taux de décharge lissé, puis mise à l'échelle homéostatique périodique
+        n['firing_rate'] *= np.exp(-dt / self._param('tau_rate', local))
+        n['firing_rate'][fired] += 1.0 / self._param('tau_rate', fired)
+        if self.recorder is not None:
+            self.recorder.record(self._step, fired, self)
+        self._step += 1
+        if self._step % self._homeostasis_steps(dt) == 0:
+            self._scale_weights()
+
+    def _homeostasis_steps(self, dt):
+        """Période de la mise à l'échelle homéostatique, en pas de simulation."""
+        return max(1, int(round(self.config['homeostasis_interval'] / dt)))
+
+    def _scale_weights(self):
+        """
+        Met à l'échelle les poids entrants de chaque neurone (une colonne de la matrice) d'un facteur
+        1 + alpha (1 - taux / taux cible), borné à [0, 1].
+        """
+        e, everyone = self._edges, slice(None)
+        factor = 1.0 + self._param('alpha', everyone) * (1.0 - self._neurons['firing_rate']
+                                                          / self._param('target_rate', everyone))
+        e['weight'] *= factor[e['post']]
+        np.clip(e['weight'], 0.0, 1.0, out=e['weight'])
+        # Les courants en transit, proportionnels aux poids, sont mis à l'échelle comme s'ils étaient
+        # évalués à la livraison (comme Network)
+        self._input_ring *= factor
+
+    def _decay_factors(self, dt):
+        """
+        Retourne exp(-dt / tau_m) pour chaque neurone, calculé une fois par valeur distincte de tau_m
+        et conservé tant que dt, le nombre de neurones et les tau_m ne changent pas.
+        """
+        num_neurons = len(self._neuron_ids)
+        if self._decay is None or self._decay[0] != dt or self._decay[1] != num_neurons:
+            taus, groups = np.unique(self._neurons['tau_m'], return_inverse=True)
+            self._decay = (dt, num_neurons, np.exp(-dt / taus)[groups])
+        return self._decay[2]
+
+    def run(self, num_steps, dt, adaptive=False):
+        """
+        Avance le réseau de `num_steps` pas.
+
+        En mode adaptatif (intégrateur exact uniquement), les périodes calmes sont franchies en un seul
+        saut : tant qu'aucun courant n'est en transit et qu'aucun neurone ne peut atteindre son seuil,
+        les potentiels sont avancés analytiquement jusqu'au pas précédant le prochain franchissement
+        de seuil ou la prochaine arrivée de courant, avec le même résultat que pas à pas.
+
+        Args:
+            num_steps (int): Nombre de pas de simulation.
+            dt (float): Pas de temps de simulation.
+            adaptive (bool): Saute les périodes sans événement.
+
+        Returns:
+            int: Nombre de pas effectivement calculés un à un.
+        """
+        if adaptive and self.integrator != 'exact':
+            raise ValueError("Le mode adaptatif requiert l'intégrateur exact.")
+        computed = 0
+        remaining = num_steps
+        while remaining > 0:
+            quiet = min(self._quiet_steps(dt), remaining) if adaptive else 0
+            if quiet > 0:
+                self._skip(quiet, dt)
+                remaining -= quiet
+            else:
+                self.update(dt)
+                computed += 1
+                remaining -= 1
+        return computed
+
+    def _quiet_steps(self, dt):
+        """Nombre de pas pouvant être sautés sans spike ni arrivée de courant."""
+        self._ensure_compiled(dt)
+        local = slice(0, self.num_local)
+        n = {name: self._neurons[name][local] for name in ('v_m', 'v_rest', 'r_m', 'alpha', 'emotion_influence',
+                                                           'v_threshold', 'tau_m')}
+        depth = self._input_ring.shape[0]
+        pending = np.flatnonzero(np.any(self._input_ring[:, local] != 0, axis=1))
+        quiet = int(((pending - self._step) % depth).min()) if pending.size else np.iinfo(np.int64).max
+        v_inf = n['v_rest'] + n['r_m'] * n['alpha'] * n['emotion_influence']
+        # Un potentiel encore au-dessus du seuil (écrit directement, par exemple) fait spiker au prochain pas
+        v_next = v_inf + (n['v_m'] - v_inf) * self._decay_factors(dt)[local]
+        if np.any(v_next >= n['v_threshold']):
+            return 0
+        # Sans entrée, v tend exponentiellement vers v_inf : seuil franchi seulement si v_inf > seuil
+        reaching = v_inf > n['v_threshold']
+        if reaching.any():
+            gap = (n['v_m'][reaching] - v_inf[reaching]) / (n['v_threshold'][reaching] - v_inf[reaching])
+            crossing = n['tau_m'][reaching] * np.log(np.maximum(gap, 1.0))
+            # Premier pas où v >= seuil : ceil(t / dt) ; les pas précédents peuvent être sautés
+            quiet = min(quiet, int(np.ceil(crossing.min() / dt)) - 1)
+        # Le pas de la prochaine mise à l'échelle homéostatique est calculé normalement
+        period = self._homeostasis_steps(dt)
+        quiet = min(quiet, period - self._step % period - 1)
+        if self.recorder is not None:
+            quiet = min(quiet, self.recorder.steps_until_sample(self._step))
+        return max(quiet, 0)
+
+    def _skip(self, num_steps, dt):
+        """Avance analytiquement de `num_steps` pas sans entrée ni spike."""
+        local = slice(0, self.num_local)
+        n = {name: values[local] for name, values in self._neurons.items()}
+        v_inf = n['v_rest'] + n['r_m'] * n['alpha'] * n['emotion_influence']
+        n['v_m'][:] = v_inf + (n['v_m'] - v_inf) * self._decay_factors(dt)[local] ** num_steps
+        n['input_current'][:] = 0.0
+        n['spike'][:] = False
+        n['firing_rate'] *= np.exp(-num_steps * dt / self._param('tau_rate', local))
+        self._step += num_steps
+        self.current_time += num_steps * dt
+
+    def inject_spikes(self, indices, steps, times):
+        """
+        Injecte les spikes passés de neurones externes (non intégrés localement, voir `num_local`).
+
+        Les courants sont mis en file pour arriver au pas d'émission augmenté du délai de chaque
+        synapse ; ce pas d'arrivée doit être postérieur au pas courant.
+
+        Args:
+            indices (np.ndarray): Indices des neurones sources.
+            steps (np.ndarray): Pas de simulation auxquels les spikes ont été émis.
+            times (np.ndarray): Temps des spikes.
+        """
+        self._ensure_compiled()
+        indices, steps, times = np.asarray(indices), np.asarray(steps), np.asarray(times, dtype=float)
+        last = self._neurons['last_spike_time']
+        # Traitement pas par pas pour appliquer la plasticité à court terme dans l'ordre des spikes
+        for step in np.unique(steps):
+            batch = steps == step
+            fired = indices[batch]
+            last[fired] = times[batch]
+            self._add_spikes_to_traces(fired, times[batch])
+            outgoing = gather_rows(self._out_indptr, fired)
+            if outgoing.size:
+                self._transmit(outgoing, int(step), np.repeat(times[batch], np.diff(self._out_indptr)[fired]))
+
+    def _add_spikes_to_traces(self, fired, times):
+        """Décroissance des traces STDP des neurones ayant spiké jusqu'au spike, puis incrément de 1."""
+        n = self._neurons
+        elapsed = np.maximum(times - n['trace_time'][fired], 0.0)
+        n['pre_trace'][fired] = n['pre_trace'][fired] * np.exp(-elapsed / self._param('tau_plus', fired)) + 1.0
+        n['post_trace'][fired] = n['post_trace'][fired] * np.exp(-elapsed / self._param('tau_minus', fired)) + 1.0
+        n['trace_time'][fired] = np.maximum(n['trace_time'][fired], times)
+
+    def _traces(self, name, indices, times, tau):
+        """Valeur des traces `name` des neurones `indices` aux temps `times` (décroissance analytique)."""
+        n = self._neurons
+        elapsed = np.maximum(times - n['trace_time'][indices], 0.0)
+        return n[name][indices] * np.exp(-elapsed / tau)
+
+    def _transmit(self, positions, emit_step=None, times=None):
+        """Plasticité à court terme, dépression STDP puis mise en file des courants vers les neurones post."""
+        e = self._edges
+        times = self.current_time if times is None else times
+        self._advance(positions, times)
+        self._advance_astrocyte(positions, times)
+        u = e['u'][positions]
+        u = u + self._edge_param('U', positions) * (1 - u)
+        x = e['x'][positions] * (1 - u)
+        e['u'][positions] = np.clip(u, 0.0, 1.0)
+        e['x'][positions] = np.clip(x, 0.0, 1.0)
+        # Dépression STDP d'une ligne de la matrice : A_minus x trace du neurone post
+        post_trace = self._traces('post_trace', e['post'][positions], times, self._edge_param('tau_minus', positions))
+        e['weight'][positions] = np.clip(e['weight'][positions] - self._edge_param('A_minus', positions) * post_trace,
+                                         0.0, 1.0)
+
+        depth = self._input_ring.shape[0]
+        emit_step = self._step if emit_step is None else emit_step
+        arrival = (emit_step + self._delay_steps[positions]) % depth
+        np.add.at(self._input_ring, (arrival, e['post'][positions]), self.efficacy(positions))
+
+    def _advance(self, positions, times):
+        """Relaxation analytique de x et u depuis leur dernière mise à jour (comme Synapse.advance)."""
+        e = self._edges
+        elapsed = np.maximum(times - e['last_update_time'][positions], 0.0)
+        recovery = np.exp(-elapsed / self._edge_param('tau_p', positions))
+        u_base = self._edge_param('U', positions)
+        e['x'][positions] = 1.0 - (1.0 - e['x'][positions]) * recovery
+        e['u'][positions] = u_base + (e['u'][positions] - u_base) * recovery
+        e['last_update_time'][positions] = np.maximum(e['last_update_time'][positions], times)
+
+    def _advance_astrocyte(self, positions, times):
+        """Relaxation analytique du calcium astrocytaire (comme Synapse.advance_astrocyte)."""
+        e = self._edges
+        elapsed = np.maximum(times - e['astro_update_time'][positions], 0.0)
+        e['astro_ca'][positions] = 1.0 - (1.0 - e['astro_ca'][positions]) * np.exp(
+            -elapsed / self._edge_param('tau_astro', positions))
+        e['astro_update_time'][positions] = np.maximum(e['astro_update_time'][positions], times)
+
+    def _receive(self, positions):
+        """STDP et modulation astrocytaire des synapses dont le neurone post a spiké."""
+        e = self._edges
+        self._advance_astrocyte(positions, self.current_time)
+        # Potentialisation STDP d'une colonne de la matrice : A_plus x trace du neurone pré
+        pre = e['pre'][positions]
+        pre_trace = self._traces('pre_trace', pre, self.current_time, self._edge_param('tau_plus', positions))
+        e['weight'][positions] = np.clip(e['weight'][positions] + self._edge_param('A_plus', positions) * pre_trace,
+                                         0.0, 1.0)
+        # Comme Synapse.receive_spike, le calcium augmente pour toutes les synapses entrantes
+        self._update_astrocyte(positions)
+
+    def _update_astrocyte(self, positions):
+        ca = self._edges['astro_ca']
+        ca[positions] = np.clip(ca[positions] + (1.0 - ca[positions]) / self._edge_param('tau_astro', positions),
+                                0.0, 1.0)
@@ -0,0 +1,41 @@
+import unittest
+import torch
+from torch import nn
+from modules.adapters import LowRankAdapter, add_low_rank_adapters
+
+
+class TestLowRankAdapters(unittest.TestCase):
+    def setUp(self):
+        """Crée un petit modèle linéaire pour les tests."""
+        torch.manual_seed(0)
+        self.model = nn.Sequential(nn.Linear(6, 8), nn.ReLU(), nn.Linear(8, 3))
+        self.inputs = torch.randn(5, 6)
+
+    def test_adapter_preserves_output_before_training(self):
+        """Teste qu'un adaptateur fraîchement ajouté ne modifie pas la sortie du modèle."""
+        expected = self.model(self.inputs)
+        add_low_rank_adapters(self.model, rank=2, target_modules=('0', '2'))
+        self.assertIsInstance(self.model[0], LowRankAdapter)
+        self.assertTrue(torch.allclose(self.model(self.inputs), expected))
+
+    def test_only_adapters_trained(self):
+        """Teste que seuls les paramètres des adaptateurs sont entraînés."""
+        base_weight = self.model[0].weight.detach().clone()
+        parameters = add_low_rank_adapters(self.model, rank=2, target_modules=('0',))
+        self.assertEqual(len(parameters), 2)
+        optimizer = torch.optim.SGD(parameters, lr=0.1)
+        for _ in range(3):
+            optimizer.zero_grad()
+            self.model(self.inputs).pow(2).sum().backward()
+            optimizer.step()
+        self.assertTrue(torch.equal(self.model[0].base.weight, base_weight))
+        self.assertGreater(self.model[0].up.abs().sum().item(), 0)
+
+    def test_unknown_target(self):
+        """Teste qu'une cible absente du modèle lève une erreur."""
+        with self.assertRaises(ValueError):
+            add_low_rank_adapters(self.model, target_modules=('c_attn',))
+
+
+if __name__ == '__main__':
+    unittest.main()
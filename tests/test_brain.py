@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+import numpy as np
 from core.brain import Brain
 
 class TestBrain(unittest.TestCase):
@@ -18,6 +21,27 @@ class TestBrain(unittest.TestCase):
         self.brain.perceive_and_process(sensory_input, dt=1.0)
         self.assertGreaterEqual(len(self.brain.memory_module.retrieve_short_term()), 0)
 
+    def test_perceive_stream(self):
+        """Teste le traitement d'un flux d'entrées sensorielles, un pas par trame."""
+        frames = np.full((20, 10), 0.5)
+        self.assertEqual(self.brain.perceive_stream(frames, dt=1.0), 20)
+        self.assertEqual(self.brain.network.current_time, 20.0)
+
+    def test_profiling(self):
+        """Teste la mesure des étapes et des compteurs quand le profilage est activé."""
+        brain = Brain(profile=True)
+        brain.perceive_and_process([20.0 for _ in range(10)], dt=1.0)
+        brain.perceive_stream(np.full((3, 10), 0.5), dt=1.0)
+        brain.process("données")
+        brain.execute_decision(dt=1.0)
+        snapshot = brain.profiler.snapshot()
+        self.assertEqual(snapshot['stages']['network.update']['calls'], 4)
+        for stage in ('perceive_and_process', 'perceive_stream', 'process', 'execute_decision', 'emotion', 'attention'):
+            self.assertIn(stage, snapshot['stages'])
+        self.assertEqual(snapshot['stages']['emotion']['calls'], 4)
+        self.assertIn('spikes', snapshot['counters'])
+        self.assertEqual(self.brain.profiler.snapshot()['stages'], {})
+
     def test_inject_knowledge(self):
         """Teste l'injection de connaissances dans le cerveau."""
         knowledge = "L'intelligence artificielle est une discipline en pleine expansion."
@@ -30,6 +54,24 @@ class TestBrain(unittest.TestCase):
         self.brain.load_state()
         self.assertGreaterEqual(len(self.brain.memory_module.retrieve_long_term("vocabulary")), 0)
 
+    def test_load_state_rebinds_modules(self):
+        """Teste que la perception et l'apprentissage pilotent le réseau restauré depuis un point de contrôle."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "checkpoint")
+            self.brain.save_state(path)
+            self.brain.load_state(path, mmap_mode=None)
+        self.assertIs(self.brain.perception_module.network, self.brain.network)
+        self.assertIs(self.brain.learning_module.network, self.brain.network)
+        self.brain.perceive_stream(np.full((5, 10), 0.5), dt=1.0)
+        self.assertEqual(self.brain.network.current_time, 5.0)
+
+    def test_close(self):
+        """Teste que le cerveau s'utilise comme gestionnaire de contexte et ferme sa file de génération."""
+        with Brain() as brain:
+            pass
+        with self.assertRaises(RuntimeError):
+            brain.communicate_async("Bonjour")
+
     def test_inject_knowledge_invalid_text(self):
         """Teste que la méthode inject_knowledge lève une ValueError pour un texte invalide."""
         with self.assertRaises(ValueError):
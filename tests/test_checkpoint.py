@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from modules.checkpoint import load_checkpoint, save_checkpoint
+from modules.network import Network
+from modules.vectorized import VectorizedNetwork
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        """Crée un répertoire temporaire pour les points de contrôle."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "checkpoint")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_vectorized_round_trip(self):
+        """Teste qu'une simulation reprise depuis un point de contrôle suit exactement l'originale."""
+        network = VectorizedNetwork()
+        network.add_neurons(100)
+        network.connect_fixed_indegree(10, rng=0)
+        network._neurons['emotion_influence'][:] = 20.0
+        for _ in range(5):
+            network.update(dt=1.0)
+        save_checkpoint(network, self.path)
+        restored = load_checkpoint(self.path)
+        self.assertIsInstance(restored._edges['weight'], np.memmap)
+        for _ in range(5):
+            network.update(dt=1.0)
+            restored.update(dt=1.0)
+        np.testing.assert_array_equal(restored._neurons['v_m'], network._neurons['v_m'])
+        np.testing.assert_array_equal(restored._edges['x'], network._edges['x'])
+        self.assertEqual(restored.current_time, network.current_time)
+
+    def test_object_network_round_trip(self):
+        """Teste la sauvegarde et la restauration d'un réseau d'objets Neuron et Synapse."""
+        network = Network()
+        network.add_neurons(3)
+        network.connect_all_to_all(weight=0.3)
+        network.synapses[0].astro_ca = 0.4
+        network.neurons[1].v_m = -55.0
+        save_checkpoint(network, self.path)
+        restored = load_checkpoint(self.path)
+        self.assertIsInstance(restored, Network)
+        self.assertEqual(len(restored.synapses), 6)
+        self.assertEqual(restored.synapses[0].astro_ca, 0.4)
+        self.assertEqual(restored.neurons[1].v_m, -55.0)
+
+    def test_object_network_spikes_in_transit(self):
+        """Teste qu'un spike en transit au moment de la sauvegarde est livré après la restauration."""
+        network = Network()
+        network.add_neurons(2)
+        network.connect_neurons(network.neurons[0], network.neurons[1], weight=0.8, delay=3.0)
+        network.neurons[0].emotion_influence = 1000.0
+        network.update(dt=1.0)
+        network.neurons[0].emotion_influence = 0.0
+        self.assertTrue(network.neurons[0].spike)
+        save_checkpoint(network, self.path)
+        restored = load_checkpoint(self.path)
+        vectorized = VectorizedNetwork.from_network(network)
+        currents = []
+        for _ in range(3):
+            for net in (network, restored, vectorized):
+                net.update(dt=1.0)
+            currents.append([net.neurons[1].input_current for net in (network, restored, vectorized)])
+        self.assertEqual(currents[0], [0.0, 0.0, 0.0])
+        self.assertGreater(currents[2][0], 0.0)
+        self.assertEqual(currents[2][1], currents[2][0])
+        self.assertAlmostEqual(currents[2][2], currents[2][0])
+
+    def test_overwrite_existing_checkpoint(self):
+        """Teste qu'un point de contrôle existant est remplacé sans laisser de répertoire temporaire."""
+        network = VectorizedNetwork()
+        network.add_neurons(2)
+        save_checkpoint(network, self.path)
+        network.add_neurons(3)
+        save_checkpoint(network, self.path)
+        self.assertEqual(len(load_checkpoint(self.path).neurons), 5)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["checkpoint"])
+
+    def test_interrupted_save_falls_back_to_previous(self):
+        """Teste qu'une sauvegarde interrompue entre les deux renommages laisse l'ancien point de contrôle chargeable."""
+        network = VectorizedNetwork()
+        network.add_neurons(2)
+        save_checkpoint(network, self.path)
+        network.add_neurons(3)
+        replace, calls = os.replace, []
+
+        def interrupted(src, dst):
+            # Le second renommage (temporaire -> point de contrôle) n'a jamais lieu
+            calls.append(src)
+            if len(calls) == 2:
+                raise OSError("interruption")
+            replace(src, dst)
+
+        with mock.patch('modules.checkpoint.os.replace', side_effect=interrupted):
+            with self.assertRaises(OSError):
+                save_checkpoint(network, self.path)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(len(load_checkpoint(self.path).neurons), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+from modules.connectivity import fixed_indegree, pairwise_bernoulli
+from modules.network import Network
+from modules.vectorized import VectorizedNetwork
+
+class TestConnectivity(unittest.TestCase):
+    def test_fixed_indegree(self):
+        """Teste que chaque neurone reçoit exactement le nombre de synapses demandé, sans doublon ni autapse."""
+        neurons = np.arange(200)
+        pre, post = fixed_indegree(neurons, neurons, indegree=20, rng=0)
+        np.testing.assert_array_equal(np.bincount(post, minlength=200), np.full(200, 20))
+        self.assertFalse(np.any(pre == post))
+        self.assertEqual(len(set(zip(pre.tolist(), post.tolist()))), len(pre))
+
+    def test_pairwise_bernoulli_density(self):
+        """Teste que la densité de connexions correspond à la probabilité demandée."""
+        neurons = np.arange(1000)
+        pre, post = pairwise_bernoulli(neurons, neurons, probability=0.05, rng=0)
+        self.assertAlmostEqual(len(pre) / (1000 * 999), 0.05, delta=0.005)
+        self.assertFalse(np.any(pre == post))
+
+    def test_network_all_to_all(self):
+        """Teste la connectivité tous-vers-tous d'un réseau d'objets."""
+        network = Network()
+        network.add_neurons(10)
+        self.assertEqual(network.connect_all_to_all(), 90)
+        self.assertEqual(len(network.neurons[0].outgoing_synapses), 9)
+
+    def test_populations(self):
+        """Teste la connectivité par blocs entre deux populations."""
+        network = VectorizedNetwork()
+        network.add_neurons(100)
+        excitatory, inhibitory = np.arange(80), np.arange(80, 100)
+        count = network.connect_populations([excitatory, inhibitory], [[0.0, 1.0], [0.0, 0.0]], weights=0.2)
+        self.assertEqual(count, 80 * 20)
+        self.assertTrue(all(synapse.weight == 0.2 for synapse in network.synapses[:10]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import numpy as np
+from modules.eligibility import EligibilityTraces
+
+
+class TestEligibilityTraces(unittest.TestCase):
+    def setUp(self):
+        """Crée des traces pour trois synapses : 0 -> 1, 1 -> 0 et 2 -> 1."""
+        self.traces = EligibilityTraces(pre=[0, 1, 2], post=[1, 0, 1], num_neurons=3, tau_e=10.0,
+                                        A_plus=0.1, A_minus=0.2, tau_plus=20.0, tau_minus=20.0)
+
+    def test_pairs_and_decay(self):
+        """Teste l'accumulation STDP des paires de spikes puis la décroissance exponentielle des traces."""
+        spike_times = np.array([1.0, 3.0, np.nan])
+        self.traces.update(1.0, fired=[1], spike_times=spike_times)
+        expected = np.array([0.1 * np.exp(-2.0 / 20.0), -0.2 * np.exp(-2.0 / 20.0), 0.0])
+        np.testing.assert_allclose(self.traces.trace, expected)
+        self.traces.update(5.0, fired=[], spike_times=spike_times)
+        np.testing.assert_allclose(self.traces.trace, expected * np.exp(-0.5))
+
+    def test_reward_scales_traces(self):
+        """Teste que la récompense modifie les poids proportionnellement aux traces, dans [0, 1]."""
+        self.traces.trace[:] = [0.5, -0.5, 0.0]
+        weights = np.array([0.5, 0.5, 0.5])
+        self.traces.apply_reward(weights, reward=2.0, learning_rate=0.1)
+        np.testing.assert_allclose(weights, [0.6, 0.4, 0.5])
+        self.traces.apply_reward(weights, reward=-10.0)
+        np.testing.assert_allclose(weights, [0.0, 1.0, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+from modules.ensemble import NetworkEnsemble
+from modules.network import Network
+from modules.vectorized import VectorizedNetwork
+
+def build_network(seed, num_neurons=10):
+    """Petit réseau aléatoire dont les paramètres dépendent de la graine."""
+    rng = np.random.default_rng(seed)
+    network = VectorizedNetwork()
+    network.add_neurons(num_neurons, tau_m=float(rng.uniform(10.0, 30.0)))
+    network.connect_fixed_indegree(3, rng=seed, weight=0.8, delay=lambda rng, n: rng.integers(1, 4, n).astype(float))
+    network._ensure_compiled()
+    network._neurons['emotion_influence'][:] = rng.uniform(14.0, 20.0, num_neurons)
+    return network
+
+class TestNetworkEnsemble(unittest.TestCase):
+    def test_matches_independent_networks(self):
+        """Teste que chaque membre de l'ensemble évolue comme s'il était simulé seul."""
+        references = [build_network(seed) for seed in range(4)]
+        for network in references:
+            for _ in range(200):
+                network.update(dt=0.5)
+        ensemble = NetworkEnsemble([build_network(seed) for seed in range(4)])
+        for _ in range(200):
+            ensemble.update(dt=0.5)
+        self.assertEqual(ensemble.neuron_state('v_m').shape, (4, 10))
+        np.testing.assert_allclose(ensemble.neuron_state('v_m'), [r._neurons['v_m'] for r in references])
+        ensemble.synchronize()
+        for member, reference in zip(ensemble.networks, references):
+            self.assertEqual(member.current_time, reference.current_time)
+            np.testing.assert_allclose(member._edges['weight'], reference._edges['weight'])
+            np.testing.assert_array_equal(member._neurons['last_spike_time'], reference._neurons['last_spike_time'])
+
+    def test_object_networks_and_uneven_sizes(self):
+        """Teste l'ensemble de réseaux d'objets de tailles différentes."""
+        networks = []
+        for size in (3, 5):
+            network = Network()
+            network.add_neurons(size)
+            network.connect_all_to_all()
+            networks.append(network)
+        ensemble = NetworkEnsemble(networks)
+        ensemble.run(10, dt=1.0)
+        self.assertEqual([len(v) for v in ensemble.neuron_state('v_m')], [3, 5])
+        self.assertEqual(len(ensemble.network.synapses), 6 + 20)
+
+    def test_synaptic_parameter_sweep(self):
+        """Teste que chaque membre garde ses propres paramètres synaptiques (balayage de A_plus, U, tau_plus...)."""
+        configs = [{}, {'A_plus': 0.05, 'tau_plus': 10.0}, {'U': 0.5, 'A_minus': 0.0, 'tau_p': 50.0},
+                   {'alpha': 0.01, 'tau_rate': 200.0, 'homeostasis_interval': 100.0}]
+
+        def build(config, seed):
+            network = build_network(seed)
+            network.config.update(config)
+            network._edges['u'][:] = network.config['U']
+            return network
+
+        references = [build(config, seed) for seed, config in enumerate(configs)]
+        for network in references:
+            network.run(400, dt=0.5)
+        ensemble = NetworkEnsemble([build(config, seed) for seed, config in enumerate(configs)])
+        self.assertEqual(set(ensemble.network.param_arrays),
+                         {'A_plus', 'tau_plus', 'U', 'A_minus', 'tau_p', 'alpha', 'tau_rate'})
+        ensemble.run(400, dt=0.5)
+        ensemble.synchronize()
+        for member, reference in zip(ensemble.networks, references):
+            for name in ('v_m', 'firing_rate', 'pre_trace'):
+                np.testing.assert_allclose(member._neurons[name], reference._neurons[name])
+            for name in ('weight', 'x', 'u'):
+                np.testing.assert_allclose(member._edges[name], reference._edges[name])
+
+    def test_mismatched_homeostasis_interval(self):
+        """Teste qu'un ensemble refuse des périodes de mise à l'échelle homéostatique différentes."""
+        with self.assertRaises(ValueError):
+            NetworkEnsemble([VectorizedNetwork(), VectorizedNetwork({'homeostasis_interval': 50.0})])
+
+if __name__ == '__main__':
+    unittest.main()
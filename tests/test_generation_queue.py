@@ -0,0 +1,60 @@
+import unittest
+from modules.generation_queue import GenerationQueue
+
+
+class FakeLanguageModule:
+    """Module de langage minimal enregistrant la taille des lots reçus."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def generate_batch(self, prompts, max_length=50):
+        self.batches.append(list(prompts))
+        if self.fail:
+            raise RuntimeError("échec de génération")
+        return [prompt + " suite" for prompt in prompts]
+
+
+class TestGenerationQueue(unittest.TestCase):
+    def test_concurrent_prompts_batched(self):
+        """Teste que des demandes concurrentes sont regroupées et que chaque futur reçoit sa phrase."""
+        language_module = FakeLanguageModule()
+        queue = GenerationQueue(language_module, max_batch_size=4, max_wait=0.5)
+        futures = [queue.submit(f"prompt {i}") for i in range(4)]
+        results = [future.result(timeout=5) for future in futures]
+        queue.close()
+        self.assertEqual(results, [f"prompt {i} suite" for i in range(4)])
+        self.assertEqual(language_module.batches, [[f"prompt {i}" for i in range(4)]])
+
+    def test_max_batch_size(self):
+        """Teste qu'un lot ne dépasse jamais la taille maximale."""
+        language_module = FakeLanguageModule()
+        queue = GenerationQueue(language_module, max_batch_size=2, max_wait=0.05)
+        futures = [queue.submit(str(i)) for i in range(5)]
+        self.assertEqual([future.result(timeout=5) for future in futures], [f"{i} suite" for i in range(5)])
+        queue.close()
+        self.assertTrue(all(len(batch) <= 2 for batch in language_module.batches))
+
+    def test_worker_started_lazily(self):
+        """Teste que le thread de service ne démarre qu'à la première demande et s'arrête à la fermeture."""
+        queue = GenerationQueue(FakeLanguageModule())
+        self.assertIsNone(queue._thread)
+        queue.close()
+        queue = GenerationQueue(FakeLanguageModule(), max_wait=0.0)
+        self.assertEqual(queue.generate("a"), "a suite")
+        queue.close()
+        self.assertFalse(queue._thread.is_alive())
+
+    def test_error_propagated(self):
+        """Teste qu'une erreur de génération est transmise aux appelants."""
+        queue = GenerationQueue(FakeLanguageModule(fail=True), max_wait=0.0)
+        with self.assertRaises(RuntimeError):
+            queue.generate("Le cerveau")
+        queue.close()
+        with self.assertRaises(RuntimeError):
+            queue.submit("Le cerveau")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from modules import language
 from modules.language import LanguageModule
 from modules.memory import MemoryModule
 
@@ -14,6 +15,15 @@ class TestLanguageModule(unittest.TestCase):
         self.language_module.learn_text(text)
         self.assertIn("cerveau", self.language_module.vocabulary)
 
+    def test_train_pending(self):
+        """Teste que les textes en file sont appris en micro-lots et que la file est vidée."""
+        self.language_module.queue_text("Le cerveau humain est un organe fascinant.")
+        self.language_module.queue_text("L'intelligence artificielle est une discipline en pleine expansion.")
+        loss = self.language_module.train_pending(micro_batch_size=1, accumulation_steps=2)
+        self.assertGreater(loss, 0)
+        self.assertEqual(self.language_module._pending_texts, [])
+        self.assertIsNone(self.language_module.train_pending())
+
     def test_generate_sentence(self):
         """Teste la génération de phrases."""
         sentence = self.language_module.generate_sentence(prompt="Le cerveau")
@@ -24,3 +34,77 @@ class TestLanguageModule(unittest.TestCase):
         sentence = "Le cerveau humain est fascinant."
         comprehension = self.language_module.understand_sentence(sentence)
         self.assertIn("comprise", comprehension)
+
+    def test_score_sentences(self):
+        """Teste que les scores par lots correspondent à la perte du modèle phrase par phrase."""
+        sentences = ["Le cerveau humain est fascinant.", "Bonjour", "L'intelligence artificielle est une discipline."]
+        scores = self.language_module.score_sentences(sentences, batch_size=2)
+        self.assertEqual(len(scores), len(sentences))
+        for sentence, log_probs in zip(sentences, scores):
+            inputs = self.language_module.tokenizer.encode(sentence, return_tensors='pt')
+            self.assertEqual(len(log_probs), inputs.shape[1] - 1)
+            if len(log_probs):
+                loss = self.language_module.model(inputs, labels=inputs).loss.item()
+                self.assertAlmostEqual(-float(log_probs.mean()), loss, places=3)
+
+    def test_stream_sentence(self):
+        """Teste que la génération en flux produit la suite du prompt par fragments."""
+        fragments = list(self.language_module.stream_sentence("Le cerveau", max_length=10))
+        self.assertTrue(all(isinstance(fragment, str) for fragment in fragments))
+        self.assertLessEqual(len(fragments), 10)
+
+    def test_prefix_cache_reused(self):
+        """Teste qu'un prompt prolongeant un préfixe en cache réutilise ses clés/valeurs d'attention."""
+        self.language_module.generate_sentence("Le cerveau")
+        self.language_module.generate_sentence("Le cerveau humain")
+        prefixes = [prefix for prefix, _, _ in self.language_module._prefix_cache.values()]
+        self.assertEqual(len(prefixes), 2)
+        self.assertEqual(prefixes[1][:len(prefixes[0])], prefixes[0])
+
+    def test_shared_prefix_reused(self):
+        """Teste qu'un prompt partageant seulement le début d'un prompt en cache ne recalcule que la fin."""
+        first = "Le cerveau humain est un organe fascinant. Que fait le cortex ?"
+        second = "Le cerveau humain est un organe fascinant. Que fait l'hippocampe ?"
+        self.language_module.generate_sentence(first)
+        lengths = []
+        hook = self.language_module.model.register_forward_pre_hook(
+            lambda module, args, kwargs: lengths.append(kwargs.get('input_ids', args[0] if args else None).shape[-1]),
+            with_kwargs=True)
+        try:
+            list(self.language_module.stream_sentence(second, max_length=1))
+        finally:
+            hook.remove()
+        common = language._common_prefix_length(self.language_module.encode(first), self.language_module.encode(second))
+        self.assertGreater(common, 0)
+        self.assertEqual(lengths, [len(self.language_module.encode(second)) - common])
+
+    def test_single_prompt_batch_uses_prefix_cache(self):
+        """Teste qu'un lot d'un seul prompt (Brain.communicate) passe par le cache de préfixes."""
+        sentences = self.language_module.generate_batch(["Le cerveau"], max_length=10)
+        self.assertTrue(sentences[0].startswith("Le cerveau"))
+        prefixes = [prefix for prefix, _, _ in self.language_module._prefix_cache.values()]
+        self.assertEqual(prefixes, [tuple(self.language_module.encode("Le cerveau"))])
+
+    def test_tokenization_cache(self):
+        """Teste que la tokenisation d'un texte déjà vu est servie par le cache."""
+        first = self.language_module.encode("Le cerveau humain")
+        self.assertIn("Le cerveau humain", self.language_module._token_cache)
+        self.assertEqual(self.language_module.encode_batch(["Le cerveau humain", "Bonjour"])[0], first)
+        self.assertEqual(len(self.language_module._token_cache), 2)
+
+    def test_model_loaded_lazily(self):
+        """Teste que le modèle n'est pas chargé à la construction du module."""
+        self.assertIsNone(self.language_module._model)
+        self.assertIsNone(self.language_module._tokenizer)
+
+    def test_shared_model_registry(self):
+        """Teste que deux modules utilisant le même modèle partagent une seule instance."""
+        tokenizer, model = object(), object()
+        language._MODEL_REGISTRY["modele-test"] = (tokenizer, model)
+        try:
+            first = LanguageModule(self.memory, model_name="modele-test")
+            second = LanguageModule(self.memory, model_name="modele-test")
+            self.assertIs(first.model, second.model)
+            self.assertIs(first.tokenizer, tokenizer)
+        finally:
+            language.release_pretrained("modele-test")
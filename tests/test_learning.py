@@ -1,9 +1,13 @@
+import os
+import tempfile
 import unittest
 import numpy as np
+from modules.checkpoint import load_checkpoint, save_checkpoint
 from modules.learning import LearningModule
 from modules.network import Network
 from modules.memory import MemoryModule
 from modules.neuron import Neuron
+from modules.vectorized import VectorizedNetwork
 
 class TestLearningModule(unittest.TestCase):
     def setUp(self):
@@ -29,6 +33,35 @@ class TestLearningModule(unittest.TestCase):
         for synapse, initial_weight in zip(self.network.synapses, initial_weights):
             self.assertNotEqual(synapse.weight, initial_weight)
 
+    def test_batch_matches_per_example_rule(self):
+        """Teste que la mise à jour d'un lot est la moyenne de la règle delta appliquée synapse par synapse."""
+        self.network.connect_fixed_indegree(2, rng=0)
+        for synapse in self.network.synapses:
+            synapse.weight = 0.5
+        rng = np.random.default_rng(0)
+        inputs = rng.random((4, 5)) * 400
+        targets = rng.integers(0, 2, (4, 5))
+        potentials, outputs = self.learning_module._forward(inputs)
+        errors = targets - outputs
+        expected = [np.clip(0.5 + 1e-4 * np.mean(errors[:, synapse.post_neuron.neuron_id] *
+                                                 potentials[:, synapse.pre_neuron.neuron_id]), 0.0, 1.0)
+                    for synapse in self.network.synapses]
+        self.learning_module.supervised_learning(inputs, targets, learning_rate=1e-4)
+        np.testing.assert_allclose([synapse.weight for synapse in self.network.synapses], expected)
+
+    def test_vectorized_network_mini_batches(self):
+        """Teste l'apprentissage par mini-lots et époques sur un VectorizedNetwork."""
+        self.network.connect_all_to_all()
+        vectorized = VectorizedNetwork.from_network(self.network)
+        other = LearningModule(vectorized, self.memory)
+        rng = np.random.default_rng(1)
+        inputs, targets = rng.random((6, 5)) * 400, rng.integers(0, 2, (6, 5))
+        losses = self.learning_module.supervised_learning(inputs, targets, 1e-4, batch_size=4, epochs=3)
+        self.assertEqual(other.supervised_learning(inputs, targets, 1e-4, batch_size=4, epochs=3), losses)
+        self.assertEqual(len(losses), 3)
+        np.testing.assert_allclose(vectorized._edges['weight'][vectorized._edge_pos],
+                                   [synapse.weight for synapse in self.network.synapses])
+
     def test_unsupervised_learning(self):
         """Teste l'apprentissage non supervisé basé sur le clustering."""
         inputs = np.random.rand(len(self.network.neurons))
@@ -38,6 +71,23 @@ class TestLearningModule(unittest.TestCase):
         for synapse in self.network.synapses:
             self.assertTrue(0 <= synapse.weight <= 1)
 
+    def test_streaming_clusters(self):
+        """Teste que les centroïdes persistent entre les appels et que seules les synapses intra-cluster sont renforcées."""
+        self.network.connect_all_to_all()
+        for synapse in self.network.synapses:
+            synapse.weight = 0.5
+        inputs = np.array([0.0, 0.1, 0.05, 5.0, 5.1])
+        labels = self.learning_module.unsupervised_learning(inputs, num_clusters=2, rng=0)
+        centroids = self.learning_module.centroids.copy()
+        labels = self.learning_module.unsupervised_learning(inputs + 0.01, num_clusters=2)
+        self.assertEqual(len(set(labels[:3])), 1)
+        self.assertNotEqual(labels[0], labels[3])
+        self.assertEqual(labels[3], labels[4])
+        self.assertFalse(np.array_equal(self.learning_module.centroids, centroids))
+        for synapse in self.network.synapses:
+            same = labels[synapse.pre_neuron.neuron_id] == labels[synapse.post_neuron.neuron_id]
+            self.assertAlmostEqual(synapse.weight, 0.52 if same else 0.48)
+
     def test_reinforcement_learning(self):
         """Teste l'apprentissage par renforcement avec une récompense."""
         reward = 1  # Récompense positive
@@ -48,3 +98,40 @@ class TestLearningModule(unittest.TestCase):
         # Vérifie que les poids synaptiques ont été mis à jour
         for synapse, initial_weight in zip(self.network.synapses, initial_weights):
             self.assertNotEqual(synapse.weight, initial_weight)
+
+    def test_reward_modulated_traces(self):
+        """Teste que la récompense ne modifie que les synapses dont les spikes sont éligibles."""
+        first, second, third = self.network.neurons[:3]
+        potentiated = self.network.connect_neurons(first, second, 0.5)
+        depressed = self.network.connect_neurons(second, first, 0.5)
+        idle = self.network.connect_neurons(third, second, 0.5)
+        first.spike, first.last_spike_time = True, 1.0
+        self.learning_module.update_eligibility(dt=1.0)
+        first.spike = False
+        second.spike, second.last_spike_time = True, 3.0
+        self.learning_module.update_eligibility(dt=1.0)
+        self.learning_module.reinforcement_learning(reward=1.0, learning_rate=1.0)
+        self.assertGreater(potentiated.weight, 0.5)
+        self.assertLess(depressed.weight, 0.5)
+        self.assertEqual(idle.weight, 0.5)
+
+    def test_traces_persist_on_memory_mapped_checkpoint(self):
+        """Teste que les traces d'un réseau restauré par projection mémoire s'accumulent d'un pas à l'autre."""
+        network = VectorizedNetwork({'A_plus': 0.05, 'tau_plus': 5.0})
+        network.add_neurons(2)
+        network.connect_edges([0], [1])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "checkpoint")
+            save_checkpoint(network, path)
+            restored = load_checkpoint(path, mmap_mode='c')
+            learning = LearningModule(restored, self.memory)
+            restored._neurons['spike'][:] = [True, False]
+            restored._neurons['last_spike_time'][:] = [1.0, np.nan]
+            learning.update_eligibility(dt=1.0)
+            traces = learning.eligibility
+            restored._neurons['spike'][:] = [False, True]
+            restored._neurons['last_spike_time'][1] = 3.0
+            learning.update_eligibility(dt=1.0)
+            self.assertIs(learning.eligibility, traces)
+            self.assertEqual((traces.A_plus, traces.tau_plus), (0.05, 5.0))
+            self.assertAlmostEqual(traces.trace[0], 0.05 * np.exp(-2.0 / 5.0))
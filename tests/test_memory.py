@@ -1,5 +1,10 @@
+import json
+import os
+import tempfile
+import time
 import unittest
 from modules.memory import MemoryModule
+from modules.profiler import Profiler
 from modules.synapse import Synapse
 from modules.neuron import Neuron
 
@@ -47,5 +52,87 @@ class TestMemoryModule(unittest.TestCase):
         self.assertIn("new_neurons", self.memory_module.long_term_memory)
         self.assertEqual(self.memory_module.long_term_memory["new_neurons"], new_neurons)
 
+class TestLongTermStore(unittest.TestCase):
+    def setUp(self):
+        """Utilise un fichier temporaire pour la mémoire à long terme."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "long_term_memory.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_writes_are_batched(self):
+        """Teste que les écritures sont différées jusqu'au vidage explicite."""
+        memory = MemoryModule(self.filename, batch_size=100, flush_interval=3600)
+        memory.store_long_term("a", 1)
+        self.assertFalse(os.path.exists(self.filename))
+        memory.flush()
+        self.assertEqual(MemoryModule(self.filename).retrieve_long_term("a"), 1)
+
+    def test_flush_persists_embeddings(self):
+        """Teste que le rappel par similarité fonctionne après une réouverture suivant un simple vidage."""
+        memory = MemoryModule(self.filename, batch_size=100, flush_interval=3600)
+        memory.store_long_term("chat", "un chat", embedding=[1.0, 0.0, 0.0])
+        memory.store_long_term("chien", "un chien", embedding=[0.0, 1.0, 0.0])
+        memory.flush()
+        reopened = MemoryModule(self.filename)
+        key, data, _ = reopened.recall_similar([0.9, 0.1, 0.0], k=1)[0]
+        self.assertEqual((key, data), ("chat", "un chat"))
+
+    def test_pending_writes_flushed_by_timer(self):
+        """Teste qu'une écriture isolée est vidée après flush_interval sans autre écriture."""
+        memory = MemoryModule(self.filename, batch_size=100, flush_interval=0.05)
+        memory.store_long_term("a", 1)
+        deadline = time.monotonic() + 5.0
+        while not (os.path.exists(self.filename) and os.path.getsize(self.filename)) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(MemoryModule(self.filename).retrieve_long_term("a"), 1)
+
+    def test_memory_writes_counted(self):
+        """Teste que les écritures en mémoire à long terme sont comptées par le profileur."""
+        profiler = Profiler(enabled=True)
+        memory = MemoryModule(self.filename, profiler=profiler)
+        memory.store_long_term("a", 1)
+        memory.extend_long_term("b", [1, 2])
+        self.assertEqual(profiler.snapshot()['counters'], {'memory_writes': 2})
+
+    def test_append_only_log(self):
+        """Teste que chaque vidage ajoute uniquement les nouvelles écritures au journal."""
+        memory = MemoryModule(self.filename, batch_size=1)
+        memory.store_long_term("a", 1)
+        memory.store_long_term("a", 2)
+        with open(self.filename) as f:
+            self.assertEqual(f.read().splitlines(), ['["a", 1]', '["a", 2]'])
+        memory.save_long_term_memory()
+        with open(self.filename) as f:
+            self.assertEqual(f.read().splitlines(), ['["a", 2]'])
+
+    def test_truncated_record_is_ignored(self):
+        """Teste qu'une dernière ligne tronquée (arrêt brutal) est ignorée puis réparée."""
+        with open(self.filename, "w") as f:
+            f.write('["a", 1]\n["b", ')
+        memory = MemoryModule(self.filename, batch_size=1)
+        self.assertEqual(memory.long_term_memory, {"a": 1})
+        memory.store_long_term("c", 3)
+        self.assertEqual(MemoryModule(self.filename).long_term_memory, {"a": 1, "c": 3})
+
+    def test_legacy_json_file(self):
+        """Teste la lecture d'un ancien fichier au format dictionnaire JSON."""
+        with open(self.filename, "w") as f:
+            json.dump({"vocabulary": ["a"]}, f)
+        memory = MemoryModule(self.filename, batch_size=1)
+        self.assertEqual(memory.retrieve_long_term("vocabulary"), ["a"])
+        memory.store_long_term("b", 2)
+        self.assertEqual(MemoryModule(self.filename).long_term_memory, {"vocabulary": ["a"], "b": 2})
+
+    def test_extend_writes_only_new_items(self):
+        """Teste que prolonger une liste n'écrit que les nouveaux éléments dans le journal."""
+        memory = MemoryModule(self.filename, batch_size=1)
+        memory.extend_long_term("vocabulary", ["a", "b"])
+        memory.extend_long_term("vocabulary", ["c"])
+        with open(self.filename) as f:
+            self.assertEqual(f.read().splitlines()[-1], '["vocabulary", ["c"], "+"]')
+        self.assertEqual(MemoryModule(self.filename).retrieve_long_term("vocabulary"), ["a", "b", "c"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+import numpy as np
 from modules.network import Network
 from modules.neuron import Neuron
 from modules.synapse import Synapse
+from modules.vectorized import VectorizedNetwork
 
 class TestNetwork(unittest.TestCase):
     def setUp(self):
@@ -31,3 +33,83 @@ class TestNetwork(unittest.TestCase):
         self.neuron1.spike = True
         self.network.update(dt=1.0)
         self.assertFalse(self.neuron1.spike)  # Le neurone doit être réinitialisé après un spike
+
+    def test_delayed_spike_delivery(self):
+        """Teste que le spike n'atteint le neurone post-synaptique qu'après le délai de la synapse."""
+        self.network.connect_neurons(self.neuron1, self.neuron2, weight=1.0, delay=2.0)
+        self.neuron1.emotion_influence = 400.0
+        self.network.update(dt=1.0)
+        self.assertTrue(self.neuron1.spike)
+        self.assertEqual(len(self.network.spike_queue), 1)
+        self.neuron1.emotion_influence = 0.0
+        self.network.update(dt=1.0)
+        self.assertEqual(self.neuron2.input_current, 0.0)
+        self.network.update(dt=1.0)
+        self.assertEqual(len(self.network.spike_queue), 0)
+        self.assertEqual(self.neuron2.input_current, self.network.synapses[0].efficacy())
+
+    def test_dt_change_rejected_with_spikes_in_transit(self):
+        """Teste qu'un changement de pas de temps est refusé tant qu'un spike est en transit."""
+        self.network.connect_neurons(self.neuron1, self.neuron2, weight=1.0, delay=2.0)
+        self.neuron1.emotion_influence = 400.0
+        self.network.update(dt=1.0)
+        self.neuron1.emotion_influence = 0.0
+        with self.assertRaises(ValueError):
+            self.network.update(dt=0.5)
+        self.network.update(dt=1.0)
+        self.network.update(dt=1.0)
+        self.assertEqual(len(self.network.spike_queue), 0)
+        self.network.update(dt=0.5)
+        self.assertEqual(self.network._outgoing_by_delay[0], {4: self.network.synapses})
+
+    def test_idle_synapse_not_updated(self):
+        """Teste qu'une synapse sans spike n'est pas mise à jour à chaque pas, puis relaxe analytiquement au spike suivant."""
+        synapse = self.network.connect_neurons(self.neuron1, self.neuron2)
+        synapse.x, synapse.astro_ca = 0.5, 0.2
+        for _ in range(10):
+            self.network.update(dt=1.0)
+        self.assertEqual((synapse.x, synapse.astro_ca, synapse.last_update_time), (0.5, 0.2, 0.0))
+        synapse.on_pre_spike(10.0)
+        u = synapse.U + synapse.U * (1 - synapse.U)
+        self.assertAlmostEqual(synapse.u, u)
+        self.assertAlmostEqual(synapse.x, (1 - 0.5 * np.exp(-10.0 / synapse.tau_p)) * (1 - u))
+        self.assertAlmostEqual(synapse.astro_ca, 1 - 0.8 * np.exp(-10.0 / synapse.tau_astro))
+
+    def test_vectorized_engine_matches(self):
+        """Teste que le moteur vectorisé reproduit l'état synaptique du réseau d'objets."""
+        network = Network()
+        network.add_neurons(30)
+        network.connect_fixed_indegree(5, rng=0)
+        for i, neuron in enumerate(network.neurons):
+            neuron.emotion_influence = 14.0 + i % 5
+        for synapse in network.synapses:
+            # Calcium quasi constant : il est lu à la livraison par Network et à l'émission par le moteur vectorisé
+            synapse.tau_astro = 1e12
+            synapse.weight = 0.9
+        engine = VectorizedNetwork.from_network(network)
+        for _ in range(300):
+            network.update(dt=0.5)
+            engine.update(dt=0.5)
+        for name in ('weight', 'x', 'u', 'last_update_time'):
+            np.testing.assert_allclose(engine._edges[name][engine._edge_pos],
+                                       [getattr(synapse, name) for synapse in network.synapses], atol=1e-12)
+        # Un spike en transit porte le poids de son émission dans le moteur vectorisé et celui de sa
+        # livraison dans Network : une potentialisation entre les deux décale légèrement les potentiels
+        np.testing.assert_allclose(engine._neurons['v_m'], [neuron.v_m for neuron in network.neurons], rtol=1e-5)
+
+    def test_vectorized_engine_matches_stdp_time_constants(self):
+        """Teste que les deux moteurs appliquent les mêmes constantes de temps STDP non standard."""
+        network = Network()
+        network.add_neurons(20)
+        network.connect_fixed_indegree(4, rng=1)
+        for i, neuron in enumerate(network.neurons):
+            neuron.emotion_influence = 15.0 + i % 4
+        for synapse in network.synapses:
+            synapse.tau_plus, synapse.tau_minus, synapse.tau_astro = 7.0, 45.0, 1e12
+        engine = VectorizedNetwork.from_network(network)
+        self.assertEqual((engine.config['tau_plus'], engine.config['tau_minus']), (7.0, 45.0))
+        for _ in range(200):
+            network.update(dt=0.5)
+            engine.update(dt=0.5)
+        np.testing.assert_allclose(engine._edges['weight'][engine._edge_pos],
+                                   [synapse.weight for synapse in network.synapses], atol=1e-12)
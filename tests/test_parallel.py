@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+from modules.parallel import ShardedNetwork
+from modules.vectorized import VectorizedNetwork
+
+def build_network():
+    """Réseau sans plasticité à long terme ni astrocyte, pour comparer simulations séquentielle et parallèle."""
+    network = VectorizedNetwork({'A_plus': 0.0, 'A_minus': 0.0, 'alpha': 0.0, 'tau_astro': 1e12})
+    network.add_neurons(200, r_m=30.0)
+    network.connect_fixed_indegree(20, rng=0, weight=lambda rng, n: rng.random(n),
+                                   delay=lambda rng, n: rng.integers(2, 5, n).astype(float))
+    network._ensure_compiled()
+    network._neurons['emotion_influence'][:] = np.random.default_rng(1).random(200) * 1.2
+    return network
+
+class TestShardedNetwork(unittest.TestCase):
+    def check_backend(self, backend):
+        reference = build_network()
+        for _ in range(60):
+            reference.update(dt=1.0)
+        network = build_network()
+        with ShardedNetwork(network, num_shards=3, backend=backend) as sharded:
+            sharded.run(60, dt=1.0)
+            sharded.synchronize()
+        self.assertEqual(network.current_time, reference.current_time)
+        np.testing.assert_allclose(network._neurons['v_m'], reference._neurons['v_m'])
+        np.testing.assert_array_equal(network._neurons['last_spike_time'], reference._neurons['last_spike_time'])
+
+    def test_thread_backend_matches_sequential(self):
+        """Teste que la simulation par partitions (threads) reproduit la simulation séquentielle."""
+        self.check_backend('thread')
+
+    def test_process_backend_matches_sequential(self):
+        """Teste que la simulation par partitions (processus) reproduit la simulation séquentielle."""
+        self.check_backend('process')
+
+    def test_invalid_backend(self):
+        """Teste qu'un backend inconnu est refusé."""
+        with self.assertRaises(ValueError):
+            ShardedNetwork(build_network(), num_shards=2, backend='gpu')
+
+if __name__ == '__main__':
+    unittest.main()
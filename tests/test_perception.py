@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from modules.network import Network
+from modules.perception import PerceptionModule
+from modules.vectorized import VectorizedNetwork
+
+def build_network():
+    network = VectorizedNetwork()
+    network.add_neurons(4)
+    network.connect_all_to_all(weight=0.8)
+    return network
+
+class TestPerceptionModule(unittest.TestCase):
+    def setUp(self):
+        self.frames = np.random.default_rng(0).uniform(0.0, 3.0, (50, 4))
+
+    def test_stream_matches_per_frame(self):
+        """Teste que le flux par blocs donne le même état que l'encodage trame par trame."""
+        reference = build_network()
+        perception = PerceptionModule(reference)
+        perception.add_sensory_neurons(list(reference.neurons))
+        for frame in self.frames:
+            perception.encode_sensory_input(frame.tolist())
+            reference.update(dt=1.0)
+
+        network = build_network()
+        perception = PerceptionModule(network)
+        perception.add_sensory_neurons(list(network.neurons))
+        self.assertEqual(perception.stream(iter(self.frames), dt=1.0, chunk_size=16), 50)
+        np.testing.assert_allclose(network._neurons['v_m'], reference._neurons['v_m'])
+
+    def test_memory_mapped_input(self):
+        """Teste la lecture d'un enregistrement projeté en mémoire, avec un réseau d'objets."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.npy")
+            np.save(path, self.frames)
+            network = Network()
+            network.add_neurons(4)
+            perception = PerceptionModule(network)
+            perception.add_sensory_neurons(network.neurons[:2])
+            self.assertEqual(perception.stream(np.load(path, mmap_mode='r'), dt=1.0), 50)
+        self.assertEqual(network.current_time, 50.0)
+
+    def test_rate_encoder(self):
+        """Teste que le codage par taux émet le nombre d'impulsions attendu, d'un bloc à l'autre."""
+        perception = PerceptionModule(build_network(), encoder='rate', gain=2.0, max_rate=0.1)
+        perception.add_sensory_neurons([0, 1])
+        frames = np.tile([1.0, 0.5], (30, 1))
+        pulses = np.concatenate([perception.encode(frames[:7], dt=1.0), perception.encode(frames[7:], dt=1.0)])
+        np.testing.assert_allclose(pulses.sum(axis=0), [6.0, 2.0])
+
+    def test_poisson_encoder(self):
+        """Teste que le codage de Poisson est reproductible avec une graine et respecte le taux."""
+        encodings = []
+        for _ in range(2):
+            perception = PerceptionModule(build_network(), encoder='poisson', max_rate=0.5, rng=3)
+            perception.add_sensory_neurons([0])
+            encodings.append(perception.encode(np.full((2000, 1), 0.5), dt=1.0))
+        np.testing.assert_array_equal(encodings[0], encodings[1])
+        self.assertAlmostEqual(encodings[0].mean(), 0.25, delta=0.05)
+
+    def test_invalid_encoder(self):
+        """Teste qu'un codage inconnu est refusé."""
+        with self.assertRaises(ValueError):
+            PerceptionModule(build_network(), encoder='phase')
+
+if __name__ == '__main__':
+    unittest.main()
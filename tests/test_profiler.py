@@ -0,0 +1,59 @@
+import json
+import unittest
+from modules.network import Network
+from modules.profiler import Profiler, network_activity
+from modules.vectorized import VectorizedNetwork
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_is_noop(self):
+        """Teste qu'un profileur désactivé ne mesure rien."""
+        profiler = Profiler()
+        with profiler.stage('network.update'):
+            pass
+        profiler.count('spikes', 3)
+        self.assertIs(profiler.stage('a'), profiler.stage('b'))
+        self.assertEqual(profiler.snapshot(), {'stages': {}, 'counters': {}})
+
+    def test_snapshot(self):
+        """Teste les durées, percentiles et compteurs exportés par le profileur."""
+        profiler = Profiler(enabled=True)
+        for duration in range(1, 101):
+            profiler.record('communicate', duration / 1000.0)
+        with profiler.stage('network.update'):
+            pass
+        profiler.count('spikes', 3)
+        profiler.count('spikes')
+        snapshot = profiler.snapshot(percentiles=(50, 99))
+        stats = snapshot['stages']['communicate']
+        self.assertEqual(stats['calls'], 100)
+        self.assertAlmostEqual(stats['p50'], 0.0505)
+        self.assertAlmostEqual(stats['max'], 0.1)
+        self.assertEqual(snapshot['stages']['network.update']['calls'], 1)
+        self.assertEqual(snapshot['counters'], {'spikes': 4})
+        json.dumps(snapshot)
+        profiler.reset()
+        self.assertEqual(profiler.snapshot()['stages'], {})
+
+    def test_max_covers_every_call(self):
+        """Teste que la durée maximale porte sur tous les appels, pas seulement sur la fenêtre récente."""
+        profiler = Profiler(enabled=True, window=10)
+        profiler.record('communicate', 1.0)
+        for _ in range(20):
+            profiler.record('communicate', 0.001)
+        stats = profiler.snapshot()['stages']['communicate']
+        self.assertEqual(stats['max'], 1.0)
+        self.assertAlmostEqual(stats['p99'], 0.001)
+        profiler.reset()
+        self.assertEqual(profiler.snapshot()['stages'], {})
+
+    def test_network_activity(self):
+        """Teste le comptage des spikes et des événements synaptiques sur les deux moteurs."""
+        for network in (Network(), VectorizedNetwork()):
+            network.add_neurons(4)
+            network.connect_all_to_all()
+            network.neurons[0].emotion_influence = 1000.0
+            network.update(dt=1.0)
+            self.assertEqual(network_activity(network), (1, 3))
+
+if __name__ == '__main__':
+    unittest.main()
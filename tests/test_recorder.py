@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+import numpy as np
+from modules.network import Network
+from modules.recorder import SpikeRecorder
+from modules.vectorized import VectorizedNetwork
+
+def build_network():
+    network = VectorizedNetwork()
+    network.add_neurons(20)
+    network.connect_fixed_indegree(4, rng=0, weight=0.8)
+    network._ensure_compiled()
+    network._neurons['emotion_influence'][:] = np.random.default_rng(1).uniform(14.0, 20.0, 20)
+    return network
+
+class TestSpikeRecorder(unittest.TestCase):
+    def test_records_every_spike(self):
+        """Teste que les paires (pas, neurone) enregistrées correspondent aux spikes de chaque pas."""
+        network = build_network()
+        network.recorder = SpikeRecorder()
+        expected = []
+        for step in range(200):
+            network.update(dt=0.5)
+            expected.extend((step, i) for i in np.flatnonzero(network._neurons['spike']))
+        steps, neurons = network.recorder.spikes()
+        self.assertEqual(steps.dtype, np.int32)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(list(zip(steps.tolist(), neurons.tolist())), expected)
+
+    def test_spills_segments_within_budget(self):
+        """Teste l'écriture de segments sur disque une fois le budget mémoire atteint."""
+        reference = build_network()
+        reference.recorder = SpikeRecorder()
+        reference.run(400, dt=0.5)
+        with tempfile.TemporaryDirectory() as directory:
+            network = build_network()
+            network.recorder = SpikeRecorder(directory, memory_budget=256, sample_neurons=[0, 3], sample_every=10)
+            network.run(400, dt=0.5)
+            self.assertGreater(len(network.recorder._segments), 1)
+            self.assertLess(network.recorder._spikes.nbytes, 256)
+            for recorded, expected in zip(network.recorder.spikes(), reference.recorder.spikes()):
+                np.testing.assert_array_equal(recorded, expected)
+            steps, values = network.recorder.membrane()
+            np.testing.assert_array_equal(steps, np.arange(0, 400, 10))
+            self.assertEqual(values.shape, (40, 2))
+            segments = list(network.recorder.iter_spikes())
+            self.assertEqual(len(segments), len(network.recorder._segments) + 1)
+            self.assertIsInstance(segments[0][0], np.memmap)
+            np.testing.assert_array_equal(np.concatenate([steps for steps, _ in segments]),
+                                          reference.recorder.spikes()[0])
+            self.assertEqual(sum(len(values) for _, values in network.recorder.iter_membrane()), 40)
+
+    def test_adaptive_run_samples(self):
+        """Teste que le saut des périodes calmes n'omet aucun échantillon de potentiel."""
+        recorders = []
+        for adaptive in (False, True):
+            network = VectorizedNetwork()
+            network.add_neurons(2)
+            network.neurons[0].emotion_influence = 16.0
+            network.recorder = SpikeRecorder(sample_neurons=[0, 1], sample_every=7)
+            network.run(300, dt=0.5, adaptive=adaptive)
+            recorders.append(network.recorder)
+        for recorded, expected in zip(recorders[1].membrane(), recorders[0].membrane()):
+            np.testing.assert_allclose(recorded, expected, rtol=1e-6)
+        np.testing.assert_array_equal(recorders[1].spikes()[0], recorders[0].spikes()[0])
+
+    def test_object_network(self):
+        """Teste l'enregistrement d'un réseau d'objets."""
+        network = Network()
+        network.add_neurons(3)
+        network.neurons[1].emotion_influence = 20.0
+        network.recorder = SpikeRecorder(sample_neurons=[1])
+        for _ in range(50):
+            network.update(dt=1.0)
+        steps, neurons = network.recorder.spikes()
+        self.assertTrue(len(steps) > 0 and set(neurons.tolist()) == {1})
+        self.assertEqual(network.recorder.membrane()[1].shape, (5, 1))
+
+if __name__ == '__main__':
+    unittest.main()
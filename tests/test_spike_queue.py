@@ -0,0 +1,35 @@
+import unittest
+from modules.spike_queue import SpikeQueue
+
+class TestSpikeQueue(unittest.TestCase):
+    def test_delivery_after_delay(self):
+        """Teste que les spikes sont livrés exactement après leur délai."""
+        queue = SpikeQueue(max_delay_steps=3)
+        queue.push([4, 7], 2)
+        self.assertEqual(queue.pop(), [])
+        queue.advance()
+        self.assertEqual(queue.pop(), [])
+        queue.advance()
+        self.assertEqual(queue.pop(), [(2, [4, 7])])
+        self.assertEqual(len(queue), 0)
+
+    def test_queue_grows_for_longer_delays(self):
+        """Teste que la file s'agrandit sans perdre les spikes en transit."""
+        queue = SpikeQueue(max_delay_steps=1)
+        queue.advance()
+        queue.push([1], 1)
+        queue.push([2], 5)
+        self.assertGreater(queue.size, 5)
+        delivered = []
+        for _ in range(6):
+            delivered.extend(queue.pop())
+            queue.advance()
+        self.assertEqual(delivered, [(1, [1]), (5, [2])])
+
+    def test_invalid_delay(self):
+        """Teste qu'un délai nul est refusé."""
+        with self.assertRaises(ValueError):
+            SpikeQueue().push([0], 0)
+
+if __name__ == '__main__':
+    unittest.main()
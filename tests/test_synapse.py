@@ -1,3 +1,4 @@
+import math
 import unittest
 from modules.synapse import Synapse
 from modules.neuron import Neuron
@@ -23,9 +24,33 @@ class TestSynapse(unittest.TestCase):
         """Teste la mise à jour du poids synaptique selon la règle STDP."""
         delta_t = 10
         initial_weight = self.synapse.weight
+        self.pre_neuron.add_spike_to_traces(0.0)
         self.synapse.update_weight_stdp(delta_t)
         self.assertNotEqual(self.synapse.weight, initial_weight)
 
+    def test_stdp_all_to_all_traces(self):
+        """Teste que la STDP somme les contributions de tous les spikes via les traces des neurones."""
+        for t in (0.0, 5.0):
+            self.pre_neuron.add_spike_to_traces(t)
+        self.synapse.receive_spike(10.0)
+        expected = 0.5 + 0.01 * (math.exp(-10.0 / 20.0) + math.exp(-5.0 / 20.0))
+        self.assertAlmostEqual(self.synapse.weight, expected)
+        self.post_neuron.add_spike_to_traces(10.0)
+        self.synapse.on_pre_spike(12.0)
+        self.assertAlmostEqual(self.synapse.weight, expected - 0.012 * math.exp(-2.0 / 20.0))
+
+    def test_stdp_configured_time_constants(self):
+        """Teste que tau_plus et tau_minus de la configuration règlent les traces des neurones."""
+        synapse = Synapse(self.pre_neuron, self.post_neuron, config={'tau_plus': 10.0, 'tau_minus': 40.0})
+        self.assertEqual((self.pre_neuron.tau_plus, self.post_neuron.tau_minus), (10.0, 40.0))
+        self.pre_neuron.add_spike_to_traces(0.0)
+        synapse.receive_spike(10.0)
+        expected = 0.5 + 0.01 * math.exp(-10.0 / 10.0)
+        self.assertAlmostEqual(synapse.weight, expected)
+        self.post_neuron.add_spike_to_traces(10.0)
+        synapse.on_pre_spike(20.0)
+        self.assertAlmostEqual(synapse.weight, expected - 0.012 * math.exp(-10.0 / 40.0))
+
     def test_synapse_current(self):
         """Teste que la synapse génère correctement le courant synaptique."""
         self.synapse.spike_times.append(1)
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from modules.memory import MemoryModule
+from modules.vector_index import IVFIndex, VectorIndex
+
+class TestVectorIndex(unittest.TestCase):
+    def setUp(self):
+        """Génère des vecteurs aléatoires reproductibles."""
+        self.vectors = np.random.default_rng(0).standard_normal((500, 16))
+
+    def test_brute_force_search(self):
+        """Teste que le plus proche voisin d'un vecteur bruité est le vecteur d'origine."""
+        index = VectorIndex()
+        for i, vector in enumerate(self.vectors):
+            index.add(i, vector)
+        results = index.search(self.vectors[:10] + 0.01, k=3)
+        self.assertEqual([matches[0][0] for matches in results], list(range(10)))
+        self.assertEqual(len(results[0]), 3)
+
+    def test_ivf_search(self):
+        """Teste la recherche par fichiers inversés une fois les centroïdes entraînés."""
+        index = IVFIndex(num_lists=8, num_probe=8, train_size=200)
+        for i, vector in enumerate(self.vectors):
+            index.add(i, vector)
+        self.assertIsNotNone(index.centroids)
+        index.add(3, self.vectors[42])
+        self.assertEqual({key for key, _ in index.search(self.vectors[42], k=2)[0]}, {3, 42})
+
+class TestMemoryRecall(unittest.TestCase):
+    def test_recall_similar(self):
+        """Teste le rappel associatif et la persistance de l'index des plongements."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "memory.json")
+            memory = MemoryModule(filename)
+            memory.store_long_term("chat", "un félin", embedding=[1.0, 0.0, 0.1])
+            memory.store_long_term("chien", "un canidé", embedding=[0.0, 1.0, 0.1])
+            key, data, score = memory.recall_similar(np.array([0.9, 0.1, 0.0]), k=1)[0]
+            self.assertEqual((key, data), ("chat", "un félin"))
+            memory.save_long_term_memory()
+            reloaded = MemoryModule(filename)
+            self.assertEqual(reloaded.recall_similar(np.array([0.0, 1.0, 0.0]), k=1)[0][0], "chien")
+
+if __name__ == '__main__':
+    unittest.main()
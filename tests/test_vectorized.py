@@ -0,0 +1,121 @@
+import unittest
+import numpy as np
+from modules.neuron import Neuron
+from modules.vectorized import VectorizedNetwork, gather_rows
+
+class TestVectorizedNetwork(unittest.TestCase):
+    def setUp(self):
+        """Initialise un réseau vectorisé de deux neurones reliés par une synapse."""
+        self.network = VectorizedNetwork()
+        self.neuron1 = self.network.add_neuron(Neuron(neuron_id=0))
+        self.neuron2 = self.network.add_neuron(Neuron(neuron_id=1))
+        self.network.connect_neurons(self.neuron1, self.neuron2, weight=0.7, delay=1.5)
+
+    def test_views_expose_state(self):
+        """Teste que les vues lisent et écrivent directement dans les tableaux."""
+        synapse = self.network.synapses[0]
+        self.assertEqual(synapse.pre_neuron, self.neuron1)
+        self.assertEqual(synapse.post_neuron, self.neuron2)
+        self.assertEqual(synapse.weight, 0.7)
+        synapse.weight = 0.3
+        self.assertEqual(self.network.synapses[0].weight, 0.3)
+        self.assertEqual(self.neuron2.incoming_synapses, [synapse])
+
+    def test_network_update_spike(self):
+        """Teste qu'un neurone fortement stimulé émet un spike et se réinitialise."""
+        self.neuron1.emotion_influence = 400.0
+        self.network.update(dt=1.0)
+        self.assertTrue(self.neuron1.spike)
+        self.assertEqual(self.neuron1.v_m, self.neuron1.v_reset)
+        self.assertEqual(self.neuron1.last_spike_time, 1.0)
+        self.assertFalse(self.neuron2.spike)
+
+    def test_lif_step_matches_neuron(self):
+        """Teste que le pas vectorisé reproduit l'intégration d'Euler de Neuron.update."""
+        neuron = Neuron(neuron_id=0)
+        neuron.emotion_influence = 10.0
+        network = VectorizedNetwork()
+        view = network.add_neuron(neuron)
+        neuron.update(dt=1.0)
+        network.update(dt=1.0)
+        self.assertAlmostEqual(view.v_m, neuron.v_m)
+
+    def test_exact_integrator(self):
+        """Teste que l'intégrateur exact suit la solution analytique quel que soit dt."""
+        neuron = Neuron(neuron_id=0)
+        neuron.emotion_influence = 10.0
+        network = VectorizedNetwork()
+        view = network.add_neuron(neuron)
+        for _ in range(4):
+            neuron.update(dt=5.0)
+            network.update(dt=5.0)
+        expected = -55.0 - 10.0 * np.exp(-20.0 / 20.0)
+        self.assertAlmostEqual(neuron.v_m, expected)
+        self.assertAlmostEqual(view.v_m, expected)
+
+    def test_adaptive_run_matches_steps(self):
+        """Teste que le saut des périodes calmes donne le même état que la simulation pas à pas."""
+        networks = []
+        for _ in range(2):
+            network = VectorizedNetwork()
+            network.add_neurons(3)
+            network.connect_edges([0, 1], [1, 2], weight=1.0, delay=[1.0, 1.5])
+            network.neurons[0].emotion_influence = 16.0
+            networks.append(network)
+        computed = networks[0].run(400, dt=0.5, adaptive=True)
+        networks[1].run(400, dt=0.5)
+        self.assertLess(computed, 40)
+        for name in ('v_m', 'last_spike_time', 'input_current'):
+            np.testing.assert_allclose(networks[0]._neurons[name], networks[1]._neurons[name], equal_nan=True)
+        for name in ('weight', 'x', 'u', 'astro_ca'):
+            np.testing.assert_allclose(networks[0]._edges[name], networks[1]._edges[name])
+        self.assertEqual(networks[0].current_time, networks[1].current_time)
+
+    def test_adaptive_run_keeps_potential_above_threshold(self):
+        """Teste qu'un potentiel écrit au-dessus du seuil (v_inf sous le seuil) spike au premier pas adaptatif."""
+        networks = []
+        for adaptive in (True, False):
+            network = VectorizedNetwork()
+            network.add_neurons(2)
+            network.connect_edges([0], [1], weight=1.0)
+            network._ensure_compiled()
+            network._neurons['v_m'][0] = -40.0
+            network.run(50, dt=1.0, adaptive=adaptive)
+            networks.append(network)
+        self.assertEqual(networks[0].neurons[0].last_spike_time, 1.0)
+        for name in ('v_m', 'last_spike_time'):
+            np.testing.assert_allclose(networks[0]._neurons[name], networks[1]._neurons[name], equal_nan=True)
+
+    def test_trace_stdp_updates_column(self):
+        """Teste qu'un spike post potentialise ses synapses entrantes de A_plus x trace pré."""
+        network = VectorizedNetwork()
+        network.add_neurons(3)
+        network.connect_edges([0, 1], [2, 2], weight=0.5)
+        network.neurons[0].pre_trace = 1.0
+        network.neurons[1].pre_trace = 0.5
+        network.neurons[2].emotion_influence = 1000.0
+        network.update(dt=1.0)
+        expected = 0.5 + 0.01 * np.array([1.0, 0.5]) * np.exp(-1.0 / 20.0)
+        np.testing.assert_allclose([synapse.weight for synapse in network.synapses], expected)
+        self.assertEqual(network.neurons[2].post_trace, 1.0)
+        self.assertEqual(network.neurons[2].trace_time, 1.0)
+
+    def test_homeostatic_scaling(self):
+        """Teste la mise à l'échelle périodique des poids entrants selon le taux de décharge lissé."""
+        for adaptive in (False, True):
+            network = VectorizedNetwork({'homeostasis_interval': 50.0})
+            network.add_neurons(3)
+            network.connect_edges([0, 1], [1, 2], weight=0.5)
+            network.neurons[1].firing_rate = 0.2
+            network.run(100, dt=0.5, adaptive=adaptive)
+            decay = np.exp(-50.0 / 1000.0)
+            expected = 0.5 * (1.0 + 0.001 * (1.0 - np.array([0.2 * decay, 0.0]) / 0.1))
+            np.testing.assert_allclose([synapse.weight for synapse in network.synapses], expected)
+
+    def test_gather_rows(self):
+        """Teste le rassemblement des positions CSR de plusieurs lignes."""
+        indptr = np.array([0, 2, 2, 5])
+        np.testing.assert_array_equal(gather_rows(indptr, np.array([0, 2])), [0, 1, 2, 3, 4])
+
+if __name__ == '__main__':
+    unittest.main()